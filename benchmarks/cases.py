@@ -0,0 +1,185 @@
+"""Benchmark cases pairing easyrepr classes with hand-written equivalents.
+
+Each case is a function returning ``(easyrepr_obj, handwritten_obj)``, where the
+two objects have the same repr.
+"""
+
+from easyrepr import easyrepr
+
+
+__all__ = ["CASES"]
+
+
+def _handwritten_call_repr(self):
+    attributes = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+    return f"{type(self).__qualname__}({attributes})"
+
+
+class DictEllipsis:
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class DictNames(DictEllipsis):
+    @easyrepr(override=True)
+    def __repr__(self):
+        return ("foo", "bar", "baz")
+
+
+class DictHandwritten:
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+    def __repr__(self):
+        return f"DictEllipsis(foo={self.foo!r}, bar={self.bar!r}, baz={self.baz!r})"
+
+
+class DictNamesHandwritten(DictHandwritten):
+    def __repr__(self):
+        return f"DictNames(foo={self.foo!r}, bar={self.bar!r}, baz={self.baz!r})"
+
+
+class SlotsEllipsis:
+    __slots__ = ("foo", "bar", "baz")
+
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class SlotsHandwritten:
+    __slots__ = ("foo", "bar", "baz")
+
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+    def __repr__(self):
+        return f"SlotsEllipsis(foo={self.foo!r}, bar={self.bar!r}, baz={self.baz!r})"
+
+
+class AngleNames(DictEllipsis):
+    @easyrepr(style="<>", override=True)
+    def __repr__(self):
+        return ("foo", "bar", "baz")
+
+
+class AngleHandwritten(DictHandwritten):
+    def __repr__(self):
+        return f"<AngleNames foo={self.foo!r} bar={self.bar!r} baz={self.baz!r}>"
+
+
+def _custom_style(instance, class_name, attributes):
+    formatted = "; ".join(f"{key}: {value!r}" for key, value in attributes)
+    return f"{class_name}[{formatted}]"
+
+
+class CustomStyle(DictEllipsis):
+    @easyrepr(style=_custom_style, override=True)
+    def __repr__(self):
+        return ("foo", "bar", "baz")
+
+
+class CustomStyleHandwritten(DictHandwritten):
+    def __repr__(self):
+        return f"CustomStyle[foo: {self.foo!r}; bar: {self.bar!r}; baz: {self.baz!r}]"
+
+
+def _make_chain(depth):
+    """Build a chain of classes, each adding one attribute to the repr."""
+    easyrepr_class = object
+    handwritten_class = object
+
+    for index in range(depth):
+        name = f"attr{index}"
+
+        def easyrepr_method(self, name=name):
+            return (name,)
+
+        # The default argument keeps the wrapped function from being constant,
+        # like most real-world non-trivial reprs.
+        easyrepr_class = type(
+            f"Chain{index}",
+            (easyrepr_class,),
+            {"__repr__": easyrepr(easyrepr_method)},
+        )
+        handwritten_class = type(
+            f"Chain{index}", (handwritten_class,), {"__repr__": _handwritten_call_repr}
+        )
+
+    easyrepr_obj = easyrepr_class()
+    handwritten_obj = handwritten_class()
+
+    for index in range(depth):
+        setattr(easyrepr_obj, f"attr{index}", index)
+        setattr(handwritten_obj, f"attr{index}", index)
+
+    return easyrepr_obj, handwritten_obj
+
+
+class Node:
+    def __init__(self, value, children=()):
+        self.value = value
+        self.children = children
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class NodeHandwritten:
+    def __init__(self, value, children=()):
+        self.value = value
+        self.children = children
+
+    def __repr__(self):
+        return f"Node(value={self.value!r}, children={self.children!r})"
+
+
+def _make_tree(node_class, depth, width):
+    if depth == 0:
+        return node_class(0)
+
+    children = tuple(_make_tree(node_class, depth - 1, width) for _ in range(width))
+    return node_class(depth, children)
+
+
+CASES = {
+    "dict-ellipsis": lambda: (
+        DictEllipsis(1, "two", 3.0),
+        DictHandwritten(1, "two", 3.0),
+    ),
+    "dict-names": lambda: (
+        DictNames(1, "two", 3.0),
+        DictNamesHandwritten(1, "two", 3.0),
+    ),
+    "slots-ellipsis": lambda: (
+        SlotsEllipsis(1, "two", 3.0),
+        SlotsHandwritten(1, "two", 3.0),
+    ),
+    "angle-style": lambda: (AngleNames(1, "two", 3.0), AngleHandwritten(1, "two", 3.0)),
+    "custom-style": lambda: (
+        CustomStyle(1, "two", 3.0),
+        CustomStyleHandwritten(1, "two", 3.0),
+    ),
+    "inheritance-chain-8": lambda: _make_chain(8),
+    "nested-tree": lambda: (_make_tree(Node, 4, 3), _make_tree(NodeHandwritten, 4, 3)),
+    "large-value": lambda: (
+        DictEllipsis(list(range(100_000)), "two", 3.0),
+        DictHandwritten(list(range(100_000)), "two", 3.0),
+    ),
+}
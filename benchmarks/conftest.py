@@ -0,0 +1,11 @@
+def pytest_terminal_summary(terminalreporter):
+    from .test_repr import ratios
+
+    if not ratios:
+        return
+
+    terminalreporter.section("easyrepr overhead vs. hand-written __repr__")
+    width = max(map(len, ratios))
+
+    for case, ratio in sorted(ratios.items()):
+        terminalreporter.write_line(f"{case:<{width}}  {ratio:6.2f}x")
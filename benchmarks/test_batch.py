@@ -0,0 +1,37 @@
+"""Benchmarks of repr_many against calling repr for each object."""
+
+import pytest
+
+from easyrepr import repr_many
+
+from .cases import DictEllipsis, DictNames, SlotsEllipsis
+
+
+pytest.importorskip("pytest_benchmark")
+
+
+_BATCHES = {
+    "dict-ellipsis": lambda: [DictEllipsis(i, "two", 3.0) for i in range(10_000)],
+    "dict-names": lambda: [DictNames(i, "two", 3.0) for i in range(10_000)],
+    "slots-ellipsis": lambda: [SlotsEllipsis(i, "two", 3.0) for i in range(10_000)],
+}
+
+
+def _repr_each(objects):
+    return list(map(repr, objects))
+
+
+def _repr_many(objects):
+    return list(repr_many(objects))
+
+
+@pytest.mark.parametrize("case", list(_BATCHES))
+@pytest.mark.parametrize(
+    "function", [_repr_each, _repr_many], ids=["repr-each", "repr-many"]
+)
+def test_batch(benchmark, case, function):
+    objects = _BATCHES[case]()
+    benchmark.group = f"batch-{case}"
+
+    result = benchmark(function, objects)
+    assert result == _repr_each(objects)
@@ -0,0 +1,55 @@
+"""Benchmarks comparing easyrepr against hand-written __repr__ methods.
+
+Run with ``pytest benchmarks`` (requires pytest-benchmark). Each easyrepr
+benchmark records its overhead relative to the equivalent hand-written repr as
+``ratio`` in its extra info, so the ratios are saved along with the timings by
+``--benchmark-autosave`` and can be compared across commits with
+``--benchmark-compare``. The ratio compares the minimum timings of the two
+benchmarks in a group, so it's only recorded when the hand-written benchmark
+for the case ran first in the same session.
+"""
+
+import pytest
+
+from .cases import CASES
+
+
+pytest.importorskip("pytest_benchmark")
+
+
+# Minimum timings of the hand-written benchmarks in this session, by case.
+_baseline_timings = {}
+
+#: Overhead ratios measured in this session, by case, for the summary.
+ratios = {}
+
+
+@pytest.mark.parametrize("case", list(CASES))
+def test_handwritten(benchmark, case):
+    _, handwritten_obj = CASES[case]()
+    benchmark.group = case
+
+    benchmark(repr, handwritten_obj)
+
+    if benchmark.stats is not None:
+        _baseline_timings[case] = benchmark.stats.stats.min
+
+
+@pytest.mark.parametrize("case", list(CASES))
+def test_easyrepr(benchmark, case):
+    easyrepr_obj, handwritten_obj = CASES[case]()
+    benchmark.group = case
+
+    result = benchmark(repr, easyrepr_obj)
+    assert result == repr(handwritten_obj)
+
+    baseline_timing = _baseline_timings.get(case, None)
+
+    if benchmark.stats is None or baseline_timing is None:
+        # Benchmarks are disabled (e.g., --benchmark-disable), or the
+        # hand-written benchmark didn't run.
+        return
+
+    ratio = benchmark.stats.stats.min / baseline_timing
+    benchmark.extra_info["ratio"] = ratio
+    ratios[case] = ratio
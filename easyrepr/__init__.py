@@ -1,3 +1,31 @@
-__all__ = ["easyrepr"]
+__all__ = [
+    "arepr",
+    "attributes",
+    "dump",
+    "easyrepr",
+    "fallback",
+    "FormatterRegistry",
+    "instrumentation",
+    "lazy",
+    "profile",
+    "register_formatter",
+    "repr_many",
+    "repr_table",
+    "ReprLimits",
+    "verbosity",
+    "write_repr",
+]
 
+from . import fallback, instrumentation
+from .arepr import arepr
+from .batch import repr_many
 from .decorator import easyrepr
+from .dump import dump
+from .formatters import FormatterRegistry, register_formatter
+from .instrumentation import profile
+from .lazy import lazy
+from .limits import ReprLimits
+from .structured import attributes
+from .table import repr_table
+from .tiers import verbosity
+from .writer import write_repr
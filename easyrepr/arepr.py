@@ -0,0 +1,93 @@
+import contextvars
+import time
+import weakref
+from collections.abc import Sized
+
+from .descriptor import find_easyrepr
+from .structured import freeze
+
+
+__all__ = ["arepr"]
+
+
+# Class -> time taken by the most recent repr of an instance, in seconds.
+_timings = weakref.WeakKeyDictionary()
+
+
+async def arepr(
+    obj, *, threshold=0.005, size_threshold=10_000, snapshot=False, executor=None
+):
+    """Return the repr of an object, without blocking the event loop for long.
+
+    :param obj: the object to repr
+    :param threshold: the time in seconds above which a repr is considered
+      expensive. Default is 0.005.
+    :param size_threshold: the total size (e.g., the number of items in
+      containers or the length of strings) of the attribute values above which
+      the repr of an object is considered expensive, if its class hasn't been
+      timed yet. Default is 10,000.
+    :param snapshot: freeze the attributes (see `.structured.freeze`, with
+      `portable` unset) in the event loop thread before sending an expensive
+      repr to the executor, so that the object can keep changing in the
+      meantime. Styles and limits are still applied in the executor. Default is
+      `False`.
+    :param executor: the :class:`concurrent.futures.Executor` for expensive
+      reprs. Default is `None` (the event loop's default executor).
+    :returns: the repr string
+
+    The time taken by each repr is remembered per class. Objects whose class
+    took longer than `threshold` last time are repr'd in `executor`, and others
+    in the event loop thread. For a class that hasn't been timed yet, the size
+    of the attribute values is used as an estimate instead.
+
+    Unless `snapshot` is set, an object repr'd in the executor should not be
+    changed before the repr is finished.
+
+    >>> import asyncio
+    >>> asyncio.run(arepr([1, 2, 3]))
+    '[1, 2, 3]'
+    """
+    klass = type(obj)
+    elapsed = _timings.get(klass, None)
+
+    if elapsed is None:
+        expensive = _estimate_size(obj) > size_threshold
+    else:
+        expensive = elapsed > threshold
+
+    if expensive:
+        if snapshot:
+            obj = freeze(obj, portable=False)
+
+        # Importing asyncio is slow, and only needed here.
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        # Executors don't carry over context variables, e.g., the verbosity
+        # tier.
+        context = contextvars.copy_context()
+        text, elapsed = await loop.run_in_executor(
+            executor, context.run, _timed_repr, obj
+        )
+    else:
+        text, elapsed = _timed_repr(obj)
+
+    _timings[klass] = elapsed
+    return text
+
+
+def _estimate_size(obj):
+    repr_fn = find_easyrepr(type(obj).__repr__)
+
+    if repr_fn is None:
+        values = (obj,)
+    else:
+        values = (attribute[-1] for attribute in repr_fn.compute_attributes(obj))
+
+    return sum(len(value) for value in values if isinstance(value, Sized))
+
+
+def _timed_repr(obj):
+    start = time.perf_counter()
+    text = repr(obj)
+    return text, time.perf_counter() - start
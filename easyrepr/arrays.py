@@ -0,0 +1,143 @@
+"""Formatters that summarize NumPy arrays and pandas objects.
+
+The reprs of large arrays and data frames are slow, and far too long for most
+reprs of objects holding them. These formatters show the shape, dtype and memory
+size instead, and the first few values. They only read metadata and the values
+they show, however large the array is.
+
+They're registered lazily in `.formatters.default_formatters`, so they apply to
+every easyrepr class once NumPy or pandas has been imported, but this module
+doesn't import either library itself. For example, an attribute holding
+``numpy.arange(1000.0)`` is shown as::
+
+    ndarray(shape=(1000,), dtype=float64, nbytes=8000, head=[0.0, 1.0, 2.0, ...])
+
+To show more or fewer values, register a formatter with a different `head`::
+
+    register_formatter(numpy.ndarray, functools.partial(summarize_ndarray, head=0))
+"""
+
+import collections
+
+
+__all__ = [
+    "summarize_dataframe",
+    "summarize_index",
+    "summarize_ndarray",
+    "summarize_series",
+]
+
+
+def summarize_ndarray(value, head=3):
+    """Formatter for NumPy arrays.
+
+    :param value: a :class:`numpy.ndarray`, or an instance of a subclass
+    :param head: the number of values to show, in flat (C) order. Default is 3.
+    """
+    values = [value.item(index) for index in range(min(head, value.size))]
+
+    return _summarize(
+        value,
+        [
+            f"shape={value.shape!r}",
+            f"dtype={value.dtype}",
+            f"nbytes={value.nbytes!r}",
+        ],
+        values,
+        value.size,
+    )
+
+
+def summarize_series(value, head=3):
+    """Formatter for pandas Series.
+
+    :param value: a :class:`pandas.Series`
+    :param head: the number of values to show. Default is 3.
+
+    The memory size includes the index, but not objects referred to by values
+    of the object dtype.
+    """
+    parts = []
+
+    if value.name is not None:
+        parts.append(f"name={value.name!r}")
+
+    parts += [
+        f"shape={value.shape!r}",
+        f"dtype={value.dtype}",
+        f"nbytes={int(value.memory_usage(index=True, deep=False))!r}",
+    ]
+    values = [value.iat[index] for index in range(min(head, len(value)))]
+
+    return _summarize(value, parts, values, len(value))
+
+
+def summarize_index(value, head=3):
+    """Formatter for pandas Index objects.
+
+    :param value: a :class:`pandas.Index`, or an instance of a subclass
+    :param head: the number of values to show. Default is 3.
+    """
+    values = [value[index] for index in range(min(head, len(value)))]
+
+    return _summarize(
+        value,
+        [
+            f"shape={value.shape!r}",
+            f"dtype={value.dtype}",
+            f"nbytes={int(value.memory_usage(deep=False))!r}",
+        ],
+        values,
+        len(value),
+    )
+
+
+def summarize_dataframe(value, head=3):
+    """Formatter for pandas DataFrames.
+
+    :param value: a :class:`pandas.DataFrame`
+    :param head: the number of column names to show. Default is 3.
+
+    Rather than values, this shows how many columns have each dtype, and the
+    first few column names. The memory size includes the index, but not objects
+    referred to by values of the object dtype.
+    """
+    dtype_counts = collections.Counter(str(dtype) for dtype in value.dtypes)
+    joined_dtypes = ", ".join(
+        f"{dtype}: {count}" for dtype, count in dtype_counts.items()
+    )
+    nbytes = int(value.memory_usage(index=True, deep=False).sum())
+
+    columns = value.columns
+    column_names = [columns[index] for index in range(min(head, len(columns)))]
+
+    return _summarize(
+        value,
+        [
+            f"shape={value.shape!r}",
+            f"dtypes={{{joined_dtypes}}}",
+            f"nbytes={nbytes!r}",
+        ],
+        column_names,
+        len(columns),
+        label="columns",
+    )
+
+
+def _summarize(value, parts, head_values, size, label="head"):
+    if head_values:
+        formatted_values = [repr(_to_python(item)) for item in head_values]
+
+        if size > len(head_values):
+            formatted_values.append("...")
+
+        parts.append(f"{label}=[{', '.join(formatted_values)}]")
+
+    return f"{type(value).__name__}({', '.join(parts)})"
+
+
+def _to_python(item):
+    # NumPy scalars' reprs include their type, e.g., np.float64(1.0).
+    if type(item).__module__ == "numpy":
+        return item.item()
+    return item
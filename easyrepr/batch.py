@@ -0,0 +1,95 @@
+import functools
+
+from . import fallback, instrumentation
+from .descriptor import find_easyrepr
+from .recursion import FILL_VALUE, get_ident, is_nested, running
+
+
+__all__ = ["repr_many"]
+
+
+def repr_many(iterable):
+    """Return the reprs of many objects, which are often of the same class.
+
+    :param iterable: the objects to repr
+    :returns: an iterator of the repr strings, in the same order as `iterable`
+
+    The result is the same as ``map(repr, iterable)``, but the work of finding
+    the repr plan of an easyrepr class is done only once per class, rather than
+    once per object. For classes with a static list of attributes, each object
+    is formatted by the plan's generated function, which reads its attributes
+    straight into the repr string.
+
+    Objects are consumed from `iterable` only as their reprs are needed. Plans
+    are resolved when the first object of each class is reached, so changes to
+    the classes after that are not picked up by the iterator.
+
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class UseEasyRepr:
+    ...     def __init__(self, foo):
+    ...         self.foo = foo
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         ...
+    ...
+    >>> list(repr_many([UseEasyRepr(1), UseEasyRepr(2), 3]))
+    ['UseEasyRepr(foo=1)', 'UseEasyRepr(foo=2)', '3']
+    """
+    # Class -> function to repr its instances, or None to use repr.
+    renderers = {}
+
+    for obj in iterable:
+        klass = type(obj)
+
+        try:
+            render = renderers[klass]
+        except KeyError:
+            render = renderers[klass] = _make_renderer(klass)
+
+        if render is None or instrumentation.active or fallback.active:
+            yield repr(obj)
+            continue
+
+        key = (id(obj), get_ident())
+
+        if key in running:
+            yield FILL_VALUE
+            continue
+
+        # Don't yield within the guard: that would leave obj marked as being
+        # repr'd while the caller has control.
+        running.add(key)
+
+        try:
+            text = render(obj)
+        finally:
+            running.discard(key)
+
+        yield text
+
+
+def _make_renderer(klass):
+    repr_fn = find_easyrepr(klass.__repr__)
+
+    if repr_fn is None:
+        return None
+
+    plan = repr_fn.get_plan(klass)
+
+    if plan.cache is not None:
+        return functools.partial(_render_cached, repr_fn, plan)
+    if plan.compiled is not None:
+        return plan.compiled
+    return functools.partial(_render, repr_fn, plan)
+
+
+def _render(repr_fn, plan, obj):
+    return repr_fn.render(obj, plan)
+
+
+def _render_cached(repr_fn, plan, obj):
+    if is_nested((id(obj), get_ident())):
+        return repr_fn.render(obj, plan)
+    return plan.cache.get_or_compute(obj, repr_fn.render, plan)
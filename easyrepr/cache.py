@@ -0,0 +1,313 @@
+import collections
+import threading
+import weakref
+
+from .style import format_attribute
+
+
+__all__ = ["CacheInfo", "FragmentCache", "ReprCache"]
+
+
+# Types whose values can't change, so that an identical value is known to have
+# the same repr as before.
+_IMMUTABLE_TYPES = frozenset(
+    [type(None), bool, int, float, complex, str, bytes, type(Ellipsis)]
+)
+
+
+#: Statistics for a :any:`ReprCache`, like :func:`functools.lru_cache` reports.
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class ReprCache:
+    """Bounded LRU cache of repr strings, keyed by instance.
+
+    :param maxsize: the maximum number of reprs to keep. Default is 1024.
+
+    Instances are tracked by identity. For instances that support weak
+    references, the cache only holds a weak reference, and the entry is dropped
+    when the instance is garbage collected. Other instances are held strongly
+    until their entry is evicted, so that their :func:`id` can't be reused by a
+    different object in the meantime.
+
+    A repr is not cached if its instance is invalidated while the repr is being
+    computed, since the result may already be stale.
+
+    >>> cache = ReprCache(maxsize=2)
+    >>> obj = object()
+    >>> cache.get_or_compute(obj, repr) == repr(obj)
+    True
+    >>> cache.get_or_compute(obj, repr) == repr(obj)
+    True
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+
+        self._entries = collections.OrderedDict()
+        # Instance id -> token for each repr being computed, which is dropped if
+        # the instance is invalidated in the meantime.
+        self._computing = {}
+        self._lock = threading.Lock()
+        self._pending_removals = []
+        self._watched_classes = weakref.WeakSet()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self):
+        return f"ReprCache(maxsize={self.maxsize!r})"
+
+    def get_or_compute(self, instance, compute, *args):
+        """Return the cached repr of an instance, computing it on a miss.
+
+        :param instance: the object whose repr is wanted
+        :param compute: the function to compute the repr, which is called as
+          ``compute(instance, *args)``
+        """
+        key = id(instance)
+
+        with self._lock:
+            self._purge_pending_removals()
+            entry = self._entries.get(key, None)
+
+            if entry is not None and _holds(entry[0], instance):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+
+            self._misses += 1
+            token = self._computing[key] = object()
+
+        try:
+            result = compute(instance, *args)
+        except BaseException:
+            with self._lock:
+                if self._computing.get(key, None) is token:
+                    del self._computing[key]
+            raise
+
+        try:
+            holder = weakref.ref(instance, self._make_remover(key))
+        except TypeError:
+            holder = instance
+
+        with self._lock:
+            if self._computing.get(key, None) is not token:
+                return result
+
+            del self._computing[key]
+            self._entries[key] = (holder, result)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return result
+
+    def invalidate(self, instance):
+        """Drop the cached repr of an instance, if any.
+
+        :param instance: the object whose repr should be dropped
+        """
+        with self._lock:
+            self._computing.pop(id(instance), None)
+            entry = self._entries.get(id(instance), None)
+
+            if entry is not None and _holds(entry[0], instance):
+                del self._entries[id(instance)]
+
+    def cache_clear(self):
+        """Drop all cached reprs and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._computing.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def cache_info(self):
+        """Return a :any:`CacheInfo` with the cache's statistics."""
+        with self._lock:
+            self._purge_pending_removals()
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def watch(self, klass):
+        """Invalidate cached reprs when attributes of instances are set.
+
+        :param klass: the class whose instances should be watched
+
+        This wraps the class's `__setattr__` and `__delattr__`. Frozen
+        dataclasses are not watched, since their instances can't change.
+        Changes to attribute values in place (e.g., appending to a list) are not
+        detected; call :any:`invalidate` after them.
+        """
+        if klass in self._watched_classes:
+            return
+
+        self._watched_classes.add(klass)
+
+        dataclass_params = getattr(klass, "__dataclass_params__", None)
+
+        if dataclass_params is not None and dataclass_params.frozen:
+            return
+
+        invalidate = self.invalidate
+        original_setattr = klass.__setattr__
+        original_delattr = klass.__delattr__
+
+        def __setattr__(instance, name, value):
+            original_setattr(instance, name, value)
+            invalidate(instance)
+
+        def __delattr__(instance, name):
+            original_delattr(instance, name)
+            invalidate(instance)
+
+        klass.__setattr__ = __setattr__
+        klass.__delattr__ = __delattr__
+
+    def _purge_pending_removals(self):
+        # Weak reference callbacks can run at awkward times (e.g., in the middle
+        # of updating the entries), so they only queue up their references.
+        # Lookups check that an entry's instance is still alive, so stale
+        # entries are harmless until they're purged here.
+        while self._pending_removals:
+            key, ref = self._pending_removals.pop()
+            entry = self._entries.get(key, None)
+
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def _make_remover(self, key):
+        pending_removals = self._pending_removals
+
+        def remove(ref):
+            pending_removals.append((key, ref))
+
+        return remove
+
+
+class FragmentCache:
+    """Per-instance cache of formatted attributes, for incremental reprs.
+
+    The formatted attributes (e.g., ``"foo=1"``) from each instance's last repr
+    are kept, and an attribute is formatted again only if it has changed since.
+    An attribute is considered unchanged if it has the same key and the very
+    same value as before, and the value is of an immutable type (e.g., `int` or
+    `str`). Values of other types (e.g., `list`) may have been changed in place,
+    so they are always formatted again.
+
+    Only instances that support weak references are tracked, and the cache does
+    not keep them alive.
+
+    >>> class Klass:
+    ...     pass
+    ...
+    >>> cache = FragmentCache()
+    >>> obj = Klass()
+    >>> attributes = [("foo", 1000), ("bar", [2])]
+    >>> first = cache.format_attributes(obj, attributes)
+    >>> first
+    ['foo=1000', 'bar=[2]']
+    >>> second = cache.format_attributes(obj, attributes)
+    >>> second[0] is first[0], second[1] is first[1]
+    (True, False)
+    """
+
+    def __init__(self):
+        # id(instance) -> (weak reference, [(attribute, formatted attribute)])
+        self._tables = {}
+
+    def __repr__(self):
+        return "FragmentCache()"
+
+    def format_attributes(self, instance, attributes):
+        """Format attributes, reusing those unchanged since the last call.
+
+        :param instance: the object whose attributes are being formatted
+        :param attributes: the sequence of attribute tuples, which may be either
+          ``(key, value)`` or ``(value,)``
+        :returns: the list of formatted attributes (see
+          `.style.format_attribute`), or `None` if `instance` can't be tracked
+        """
+        table = self._table(instance)
+
+        if table is None:
+            return None
+
+        size = len(table)
+        fragments = []
+
+        for index, attribute in enumerate(attributes):
+            if index < size:
+                previous_attribute, fragment = table[index]
+
+                if (
+                    previous_attribute[-1] is attribute[-1]
+                    and previous_attribute[0] is attribute[0]
+                    and len(previous_attribute) == len(attribute)
+                    and type(attribute[-1]) in _IMMUTABLE_TYPES
+                    and type(attribute[0]) in _IMMUTABLE_TYPES
+                ):
+                    fragments.append(fragment)
+                    continue
+
+                fragment = format_attribute(attribute)
+                table[index] = (attribute, fragment)
+            else:
+                fragment = format_attribute(attribute)
+                table.append((attribute, fragment))
+
+            fragments.append(fragment)
+
+        del table[len(fragments) :]
+        return fragments
+
+    def cache_clear(self):
+        """Drop all formatted attributes."""
+        self._tables.clear()
+
+    def _table(self, instance):
+        key = id(instance)
+        entry = self._tables.get(key, None)
+
+        if entry is not None and entry[0]() is instance:
+            return entry[1]
+
+        try:
+            ref = weakref.ref(instance, self._make_remover(key))
+        except TypeError:
+            return None
+
+        table = []
+        self._tables[key] = (ref, table)
+        return table
+
+    def _make_remover(self, key):
+        tables = self._tables
+
+        def remove(ref):
+            entry = tables.get(key, None)
+
+            if entry is not None and entry[0] is ref:
+                del tables[key]
+
+        return remove
+
+
+def _holds(holder, instance):
+    if isinstance(holder, weakref.ref):
+        return holder() is instance
+    return holder is instance
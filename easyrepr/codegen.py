@@ -0,0 +1,185 @@
+import keyword
+
+from . import runtime
+from .recursion import FILL_VALUE, get_ident, running
+from .style import angle_style, call_style
+
+
+__all__ = ["compile_repr"]
+
+
+def compile_repr(
+    class_name,
+    attributes,
+    style_fn,
+    *,
+    klass=None,
+    fallback=None,
+    plan=None,
+    format_value=None,
+    on_unset=None,
+):
+    """Generate a specialized repr function for a fixed list of attributes.
+
+    :param class_name: the class name that should be displayed
+    :param attributes: the sequence of attributes, which may be either `str`
+      attribute names, ``(key, value)``, or ``(value,)``
+    :param style_fn: the style function the repr should match
+    :param klass: if given, the generated function only handles instances of
+      exactly this class, and calls `fallback` for instances of subclasses (or
+      while `.runtime.deferred` is set)
+    :param fallback: the function to call for instances of subclasses of
+      `klass`
+    :param plan: if given with `klass`, the `.plan.ReprPlan` the attributes
+      come from. The generated function also calls `fallback` once the method is
+      reassigned on a base class of `klass`, or the MRO of `klass` changes.
+    :param format_value: if given, the function to format attribute values with
+      (see `.formatters.FormatterRegistry.format_value`) instead of
+      :func:`repr`. It's called on each repr, even for values given directly
+      in `attributes`.
+    :param on_unset: if given, the function to call with the instance instead
+      when loading an attribute raises :exc:`AttributeError`, e.g., for a
+      `.reflection.DeclaredField` that isn't set
+    :returns: a function that accepts an instance and returns its repr, or `None`
+      if `style_fn` is not a built-in style
+
+    The generated function loads each attribute and formats the repr string with
+    a single f-string, similar to how :mod:`dataclasses` builds `__repr__`. Its
+    result is the same as calling `style_fn` with the processed attributes.
+
+    >>> repr_fn = compile_repr("Klass", ["real", ("virtual", 42)], call_style)
+    >>> repr_fn(1 + 2j)
+    'Klass(real=1.0, virtual=42)'
+    """
+    if style_fn is not angle_style and style_fn is not call_style:
+        return None
+
+    namespace = {}
+    fragments = []
+
+    if format_value is not None:
+        namespace["_format_value"] = format_value
+
+    for index, attribute in enumerate(attributes):
+        if isinstance(attribute, str):
+            fragment = _escape(attribute) + "=" + _load(attribute, index, namespace)
+        elif len(attribute) == 1:
+            (value,) = attribute
+            fragment = _format_static(value, index, namespace)
+        else:
+            key, value = attribute
+            key_str = key if isinstance(key, str) else repr(key)
+            fragment = _escape(key_str) + "=" + _format_static(value, index, namespace)
+
+        fragments.append(fragment)
+
+    # These must match the formatting in angle_style and call_style.
+    if style_fn is angle_style:
+        text = "<" + " ".join([_escape(class_name), *fragments]) + ">"
+    else:
+        text = _escape(class_name) + "(" + ", ".join(fragments) + ")"
+
+    if on_unset is not None:
+        namespace["_on_unset"] = on_unset
+        # Declared fields may not be set, which is rare enough to handle
+        # separately.
+        handler = ["    except AttributeError:", "        pass"]
+        unset = ["    return _on_unset(self)"]
+    else:
+        handler = unset = []
+
+    if klass is None and on_unset is None:
+        lines = ["def __repr__(self):", f"    return f{text!r}"]
+    elif klass is None:
+        lines = [
+            "def __repr__(self):",
+            "    try:",
+            f"        return f{text!r}",
+            *handler,
+            *unset,
+        ]
+    else:
+        # Installed functions stand in for the descriptor's __call__, so they
+        # also need its recursion guard.
+        namespace["_klass"] = klass
+        namespace["_fallback"] = fallback
+        namespace["_runtime"] = runtime
+        namespace["_fill_value"] = FILL_VALUE
+        namespace["_get_ident"] = get_ident
+        namespace["_running"] = running
+        lines = [
+            "def __repr__(self):",
+            f"    if {_guard(klass, plan, namespace)}:",
+            "        return _fallback(self)",
+            "    key = (id(self), _get_ident())",
+            "    if key in _running:",
+            "        return _fill_value",
+            "    _running.add(key)",
+            "    try:",
+            f"        return f{text!r}",
+            *handler,
+            "    finally:",
+            "        _running.discard(key)",
+            *unset,
+        ]
+
+    source = "\n".join(lines) + "\n"
+
+    exec(source, namespace)
+
+    repr_fn = namespace["__repr__"]
+    repr_fn.__qualname__ = f"{class_name}.__repr__"
+    return repr_fn
+
+
+def _guard(klass, plan, namespace):
+    # Returns the condition for the generated function to call its fallback.
+    conditions = ["type(self) is not _klass", "_runtime.deferred"]
+
+    if plan is not None:
+        # Inlined counterpart of ReprPlan.is_valid_for, which is too slow to
+        # call on every repr. Only instances of exactly klass get here, so
+        # klass's own method must be this function. Builtin base classes'
+        # methods can't be reassigned.
+        namespace["_mro"] = klass.__mro__
+        namespace["_name"] = plan.name
+        conditions.append("_klass.__mro__ is not _mro")
+
+        for index, (mro_type, method) in enumerate(zip(klass.__mro__, plan.methods)):
+            if mro_type is klass or mro_type.__module__ == "builtins":
+                continue
+
+            namespace[f"_dict_{index}"] = mro_type.__dict__
+            namespace[f"_method_{index}"] = method
+            conditions.append(f"_dict_{index}.get(_name) is not _method_{index}")
+
+    return " or ".join(conditions)
+
+
+def _escape(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _load(name, index, namespace):
+    if name.isidentifier() and not keyword.iskeyword(name):
+        expression = f"self.{name}"
+    else:
+        # Names that aren't valid identifiers can still be read using getattr.
+        name_variable = f"_name_{index}"
+        namespace["_getattr"] = getattr
+        namespace[name_variable] = name
+        expression = f"_getattr(self, {name_variable})"
+
+    if "_format_value" in namespace:
+        return f"{{_format_value({expression})}}"
+    return f"{{{expression}!r}}"
+
+
+def _format_static(value, index, namespace):
+    if "_format_value" not in namespace:
+        return _escape(repr(value))
+
+    # Formatters may change after the function is generated.
+    value_variable = f"_value_{index}"
+    namespace[value_variable] = value
+    return f"{{_format_value({value_variable})}}"
@@ -38,12 +38,59 @@ def easyrepr(wrapped=None, **kwargs):
         easyrepr(style="<>")(fn)
 
     to make it easier to use this function as a decorator.
+
+    This decorator may also be applied to a class, in which case the class's own
+    `__repr__` method (if any) is used as the wrapped function. If the class has
+    no `__repr__` method of its own, all attributes of the instance are
+    included, as if the method returned `None`.
+
+    >>> @easyrepr(style="<>")
+    ... class UseEasyReprOnClass:
+    ...     def __init__(self, foo, bar):
+    ...         self.foo = foo
+    ...         self.bar = bar
+    ...
+    >>> x = UseEasyReprOnClass(1, 2)
+    >>> repr(x)
+    '<UseEasyReprOnClass foo=1 bar=2>'
+
+    Rather than a descriptor, the class gets a plain `__repr__` function (see
+    `.descriptor.EasyRepr.as_function`), which avoids the overhead of the
+    descriptor protocol on each call.
     """
 
     def _easyrepr(_wrapped):
+        if isinstance(_wrapped, type):
+            return _easyrepr_class(_wrapped, **kwargs)
         return EasyRepr(_wrapped, **kwargs)
 
     if wrapped is None:
         return _easyrepr
 
     return _easyrepr(wrapped)
+
+
+def _easyrepr_class(klass, **kwargs):
+    wrapped = klass.__dict__.get("__repr__", _reflect_all_attributes)
+
+    if isinstance(wrapped, EasyRepr):
+        if kwargs:
+            raise TypeError(
+                "class already has an EasyRepr __repr__; pass keyword arguments "
+                "to one decorator or the other"
+            )
+        repr_fn = wrapped
+    else:
+        repr_fn = EasyRepr(wrapped, **kwargs)
+        klass.__repr__ = repr_fn
+        # Since we're adding this descriptor after klass was created, we're
+        # responsible for calling __set_name__ manually.
+        repr_fn.__set_name__(klass, "__repr__")
+
+    # The descriptor has to be in place first, so that it's found when planning.
+    klass.__repr__ = repr_fn.as_function(klass)
+    return klass
+
+
+def _reflect_all_attributes(self):
+    ...
@@ -1,13 +1,21 @@
 import functools
 import inspect
 import types
+import weakref
 from collections.abc import Sequence
 
-from .reflection import Mirror
-from .style import angle_style, call_style
+from . import fallback, instrumentation
+from . import tiers as verbosity
+from .cache import FragmentCache, ReprCache
+from .codegen import compile_repr
+from .formatters import default_formatters, FormattedValue, FormatterRegistry
+from .plan import attribute_key, invalidate_plans, REFLECT, ReprPlan, STATIC
+from .recursion import FILL_VALUE, get_ident, is_nested, running
+from .reflection import DeclaredField, Mirror, NOT_CONSTANT, reflect_constant_return
+from .style import angle_style, call_style, join_formatted
 
 
-__all__ = ["EasyRepr"]
+__all__ = ["EasyRepr", "find_easyrepr"]
 
 
 class _EasyReprBootstrap(type):
@@ -40,7 +48,38 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
     :param skip_private: skip private attributes --- i.e., those whose names
       start with an underscore ("_") --- when finding attributes for `None` or
       `Ellipsis`. Default is `True`.
+    :param include: patterns for the only attributes to include when finding
+      attributes for `None` or `Ellipsis`. Each pattern may be a glob, a
+      compiled regular expression, or a predicate function; see
+      `.reflection.compile_filter`. Default is `None` (all attributes).
+    :param exclude: patterns for attributes to skip when finding attributes for
+      `None` or `Ellipsis`, in the same forms as `include`. Default is `None`.
     :param style: the style to use. Default is `None`.
+    :param limits: a `.limits.ReprLimits` to bound the size of the repr. Default
+      is `None` (inherit limits from a super class, or else no limits).
+    :param cache: memoize reprs per instance. May be `True` to use a new
+      `.cache.ReprCache`, or a ReprCache to use. Default is `False` (inherit
+      the cache from a super class, or else don't cache). Cached reprs are
+      invalidated when attributes of the instance are set or deleted, but not
+      when attribute values are changed in place, e.g., by appending to a list
+      attribute, or when values nested in them change. The cache is not used
+      for reprs inside another repr, whose result may differ because of
+      recursive references (see `.recursion`).
+    :param incremental: keep the formatted attributes of each instance, and
+      only format those that have changed since its last repr (see
+      `.cache.FragmentCache`). Default is `False` (inherit from a super class,
+      or else format all attributes every time). This only applies to the
+      built-in styles without limits.
+    :param formatters: a `.formatters.FormatterRegistry`, or a mapping from
+      type to formatter function, to format attribute values of those types
+      rather than using :func:`repr`. Default is `None` (inherit formatters
+      from a super class, or else use `.formatters.default_formatters`).
+    :param tiers: a mapping from the name of a verbosity tier (see `.tiers`) to
+      the names of the attributes to include in that tier, or a single name.
+      Default is `None` (no tiers). In a tier, a class shows only the
+      attributes named for the tier by any of its EasyRepr methods, or all
+      attributes if none of them declare it. Reprs in tiers other than
+      `.tiers.FULL` are not cached, and not incremental.
 
     :ivar __wrapped__: the wrapped function
 
@@ -50,18 +89,24 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
 
     Valid attribute descriptions include:
 
-    * `None` --- include all attributes of the instance (via `vars`)
+    * `None` --- include all attributes of the instance (via `vars`), or, if
+      the class declares its fields, only those fields that are set (see
+      `.reflection.declared_fields`)
 
       .. note:: A function whose body is :keyword:`pass` or `Ellipsis`
          (:any:`...`) implicitly returns `None`.
 
+      .. note:: For a dataclass, attrs class or named tuple, attributes that
+         aren't declared as fields --- e.g., set in ``__post_init__`` --- are
+         not included.
+
     * An iterable containing zero or more of any of the following:
 
       * `str` --- include the attribute with the given name
       * ``(key, value)`` --- include a virtual attribute
       * ``(value,)`` --- include a nameless virtual attribute
       * `Ellipsis` (:any:`...`) --- include all attributes of the instance (via
-        :func:`vars`)
+        :func:`vars`), or the declared fields, the same as `None`
 
     The style of the repr string returned is determined by the `style`
     parameter, which may be one of:
@@ -79,56 +124,261 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
     * `~collections.abc.Callable` --- use a user-defined style function, which
       should accept three parameters: the object instance, the computed class
       name, and an iterable of attributes, which may be either ``(key, value)``
-      or ``(value,)``, as described above.
+      or ``(value,)``, as described above. If limits are in effect, the style
+      function is also passed a `limits` keyword argument, and should use
+      `.limits.ReprLimits.join_attributes` to format the attributes.
     """
 
-    def __init__(self, wrapped, *, override=False, skip_private=True, style=None):
+    def __init__(
+        self,
+        wrapped,
+        *,
+        override=False,
+        skip_private=True,
+        include=None,
+        exclude=None,
+        style=None,
+        limits=None,
+        cache=False,
+        incremental=False,
+        formatters=None,
+        tiers=None,
+    ):
         self._check_wrapped(wrapped)
         functools.update_wrapper(self, wrapped)
 
         self.override = override
         self.style = style
+        self.limits = limits
+
+        if cache is True:
+            cache = ReprCache()
+
+        #: The `.cache.ReprCache` for this method's reprs, or `None`.
+        self.cache = cache or None
+
+        #: The `.cache.FragmentCache` for incremental reprs, or `None`.
+        self.fragments = FragmentCache() if incremental else None
+
+        if formatters is not None and not isinstance(formatters, FormatterRegistry):
+            formatters = FormatterRegistry(formatters)
+
+        #: The `.formatters.FormatterRegistry` for attribute values, or `None`.
+        self.formatters = formatters
+
+        if tiers is not None:
+            if verbosity.FULL in tiers:
+                raise ValueError(
+                    f"the {verbosity.FULL!r} tier always includes every attribute"
+                )
+
+            tiers = {
+                tier: frozenset((names,) if isinstance(names, str) else names)
+                for tier, names in tiers.items()
+            }
 
-        self._mirror = Mirror(skip_private)
+        #: A mapping from verbosity tier to the names of the attributes it
+        #: includes, or `None`.
+        self.tiers = tiers
+
+        self._mirror = Mirror(skip_private, include=include, exclude=exclude)
+        self._plans = weakref.WeakKeyDictionary()
+        # Class -> {tier: plan}, for tiers other than the full tier.
+        self._tier_plans = weakref.WeakKeyDictionary()
+
+        # If the wrapped function just returns a constant --- most commonly None,
+        # from a body of "..." or "pass" --- we don't need to call it again for
+        # every repr.
+        self._constant_return = reflect_constant_return(wrapped)
 
     def __set_name__(self, owner, name):
         self.__objclass__ = owner
         self._name = name
 
+        # Plans cached for subclasses of owner may have skipped over owner,
+        # because it had no EasyRepr until now.
+        invalidate_plans()
+
     def __get__(self, instance, owner=None):
         if instance is None:
             return self
         return types.MethodType(self, instance)
 
     def __call__(self, instance):
-        attributes = []
-        style_fn = None
+        if fallback.active and fallback.should_fall_back(type(instance)):
+            return fallback.fallback_repr(instance)
 
-        if self.override:
-            search_classes = (type(instance),)
-        else:
-            search_classes = self._mirror.reflect_classes(instance)
+        key = (id(instance), get_ident())
 
-        for mro_type in search_classes:
-            repr_fn = mro_type.__dict__.get(self._name, None)
+        if key in running:
+            return FILL_VALUE
 
-            if not isinstance(repr_fn, EasyRepr):
-                continue
+        running.add(key)
 
-            if repr_fn.style is not None:
-                style_fn = self._resolve_style(repr_fn.style)
+        try:
+            if instrumentation.active:
+                return self._call_instrumented(instance, key)
+
+            plan = self.get_plan(type(instance))
+
+            # A repr inside another repr may show the outer objects as ..., and
+            # a cached repr may show this object as ... in the wrong place.
+            if plan.cache is not None and not is_nested(key):
+                return plan.cache.get_or_compute(instance, self.render, plan)
+
+            return self.render(instance, plan)
+        finally:
+            running.discard(key)
+
+    def as_function(self, klass):
+        """Return a plain function that reprs instances like this descriptor.
+
+        :param klass: the class the function will be installed on, which must
+          already have this descriptor as an attribute
+
+        The repr plan for `klass` is computed up-front. Where possible, the
+        returned function is the specialized function generated for the plan,
+        which calls this descriptor instead once the plan is stale; otherwise
+        it calls this descriptor. Either way, calling it does not go
+        through the descriptor protocol. Instances of subclasses of `klass` are
+        handled the same as by this descriptor.
+
+        The descriptor is available from the function as `__easyrepr__`, so that
+        the function still counts as an EasyRepr method for subclasses.
+        """
+        plan = self.get_plan(klass, verbosity.FULL)
+        function = None
+
+        if plan.compiled is not None and plan.cache is None:
+            function = compile_repr(
+                plan.class_name,
+                plan.attributes,
+                plan.style_fn,
+                klass=klass,
+                fallback=self,
+                plan=plan,
+                format_value=plan.format_value,
+                on_unset=self if plan.has_declared_fields else None,
+            )
 
-            return_value = repr_fn.__wrapped__(instance)
-            new_attributes = repr_fn._expand_repr_return_value(instance, return_value)
-            attributes.extend(new_attributes)
+        if function is None:
 
-        attributes = self._process_attribute_sequence(instance, attributes)
+            def function(instance):
+                return self(instance)
 
-        if style_fn is None:
-            style_fn = self._resolve_style(self._default_style())
+        function.__module__ = self.__module__
+        # The wrapped function may not be a method of klass at all, e.g., when
+        # a decorated class has no __repr__ of its own.
+        function.__name__ = self._name
+        function.__qualname__ = f"{klass.__qualname__}.{self._name}"
+        function.__doc__ = self.__doc__
+        function.__easyrepr__ = self
+        return function
+
+    def compute_attributes(self, instance, plan=None):
+        """Return the attributes to include in the repr of an instance.
+
+        :param instance: the object whose attributes should be computed
+        :param plan: the plan for the instance's class, if already known (see
+          :any:`get_plan`)
+        :returns: a sequence of attribute tuples, which may be either
+          ``(key, value)`` or ``(value,)``
+
+        This does all the work of a repr except for the styling.
+        """
+        if plan is None:
+            plan = self.get_plan(type(instance))
+
+        attributes = self._collect_attributes(instance, plan)
+
+        if plan.needs_lookup:
+            attributes = self._process_attribute_sequence(instance, attributes)
+
+        return attributes
+
+    def get_plan(self, klass, tier=None):
+        """Return the repr plan for a class, computing it if needed.
+
+        :param klass: the concrete class of the instances to repr
+        :param tier: the verbosity tier to plan for. Default is `None` (the tier
+          in effect; see `.tiers.current`).
+        :returns: a `.plan.ReprPlan`
+
+        Plans are cached per class and tier, and recomputed automatically when
+        they become stale. Checking for that costs a lookup per class in the
+        MRO of `klass` (see `.plan.ReprPlan.is_valid_for`).
+        """
+        if tier is None and verbosity.active:
+            tier = verbosity.current()
+
+        if tier is not None and tier != verbosity.FULL:
+            return self._get_tier_plan(klass, tier)
+
+        plan = self._plans.get(klass, None)
 
-        klass_name = type(instance).__qualname__
-        return style_fn(instance, klass_name, attributes)
+        if plan is None or not plan.is_valid_for(klass):
+            plan = self._build_plan(klass)
+            self._plans[klass] = plan
+
+        return plan
+
+    def render(self, instance, plan):
+        """Return the repr of an instance according to a plan.
+
+        :param instance: the object to repr
+        :param plan: the plan for the instance's class (see :any:`get_plan`)
+
+        Unlike calling the descriptor, this skips the cache, the recursion
+        guard, and `.instrumentation`.
+        """
+        if plan.compiled is not None:
+            return plan.compiled(instance)
+
+        attributes = self.compute_attributes(instance, plan)
+
+        if plan.formatters is not None:
+            attributes = plan.formatters.format_attributes(attributes)
+
+        if plan.fragments is not None:
+            fragments = plan.fragments.format_attributes(instance, attributes)
+
+            if fragments is not None:
+                return join_formatted(plan.style_fn, plan.class_name, fragments)
+
+        if plan.limits is not None:
+            return plan.style_fn(
+                instance, plan.class_name, attributes, limits=plan.limits
+            )
+
+        return plan.style_fn(instance, plan.class_name, attributes)
+
+    def repr_bounded(self, instance, limits):
+        """Return the repr of an instance within the given limits.
+
+        :param instance: the object to repr
+        :param limits: the `.limits.ReprLimits` to apply, in addition to any
+          limits set for the instance's class
+
+        This is used to carry a parent's limits through to nested easyrepr
+        objects.
+        """
+        if fallback.active and fallback.should_fall_back(type(instance)):
+            return fallback.fallback_repr(instance)
+
+        key = (id(instance), get_ident())
+
+        if key in running:
+            return FILL_VALUE
+
+        running.add(key)
+
+        try:
+            if instrumentation.active:
+                return self._call_instrumented(instance, key, limits)
+
+            return self._render_bounded(instance, self.get_plan(type(instance)), limits)
+        finally:
+            running.discard(key)
 
     # This method is not annotated with @easyrepr because it's not available
     # yet -- it needs *this* class to be defined. Instead, our metaclass,
@@ -136,6 +386,44 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
     def __repr__(self):
         return (("wrapped", self.__wrapped__), ...)
 
+    def _call_instrumented(self, instance, key, limits=None):
+        start = instrumentation.clock()
+        plan = self.get_plan(type(instance))
+        report = instrumentation.profile_report
+
+        if limits is not None:
+            # Profiles don't break down reprs within limits by attribute.
+            render, args = self._render_bounded, (plan, limits)
+        elif report is not None:
+            render, args = self._render_profiled, (plan, report)
+        else:
+            render, args = self.render, (plan,)
+
+        if limits is None and plan.cache is not None and not is_nested(key):
+            result = plan.cache.get_or_compute(instance, render, *args)
+        else:
+            result = render(instance, *args)
+
+        if instrumentation.enabled:
+            elapsed = instrumentation.clock() - start
+            instrumentation.record(plan.class_name, elapsed, len(result))
+
+        return result
+
+    def _render_bounded(self, instance, plan, limits):
+        limits = limits.combine(plan.limits)
+
+        if limits.exhausted:
+            # Too deep to show any attributes, so don't bother computing them.
+            attributes = ()
+        else:
+            attributes = self.compute_attributes(instance, plan)
+
+            if plan.formatters is not None:
+                attributes = plan.formatters.format_attributes(attributes)
+
+        return plan.style_fn(instance, plan.class_name, attributes, limits=limits)
+
     def _check_wrapped(self, wrapped):
         try:
             signature = inspect.signature(wrapped)
@@ -150,12 +438,165 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
                 "(self)"
             )
 
+    def _get_tier_plan(self, klass, tier):
+        tier_plans = self._tier_plans.get(klass, None)
+
+        if tier_plans is None:
+            tier_plans = self._tier_plans[klass] = {}
+
+        plan = tier_plans.get(tier, None)
+
+        if plan is None or not plan.is_valid_for(klass):
+            plan = self._build_plan(klass, tier)
+
+            if plan is None:
+                # No contributor declares the tier, so the full plan will do.
+                plan = self.get_plan(klass, verbosity.FULL)
+
+            tier_plans[tier] = plan
+
+        return plan
+
+    def _build_plan(self, klass, tier=verbosity.FULL):
+        # Returns None for a tier that no contributor declares.
+        steps = []
+        style_fn = None
+        limits = None
+        cache = None
+        fragments = None
+        formatters = default_formatters
+        keys = None
+
+        if self.override:
+            search_classes = (klass,)
+        else:
+            search_classes = self._mirror.reflect_classes_of_type(klass)
+
+        for mro_type in search_classes:
+            repr_fn = find_easyrepr(mro_type.__dict__.get(self._name, None))
+
+            if repr_fn is None:
+                continue
+
+            if repr_fn.style is not None:
+                style_fn = self._resolve_style(repr_fn.style)
+            if repr_fn.limits is not None:
+                limits = repr_fn.limits
+            if repr_fn.cache is not None:
+                cache = repr_fn.cache
+                cache.watch(mro_type)
+            if repr_fn.fragments is not None:
+                fragments = repr_fn.fragments
+            if repr_fn.formatters is not None:
+                formatters = repr_fn.formatters
+
+            if tier != verbosity.FULL and repr_fn.tiers is not None:
+                tier_keys = repr_fn.tiers.get(tier, None)
+
+                if tier_keys is not None:
+                    keys = tier_keys if keys is None else keys | tier_keys
+
+            steps.append((mro_type, repr_fn, repr_fn._attribute_template()))
+
+        if tier != verbosity.FULL:
+            if keys is None:
+                return None
+
+            cache = None
+            fragments = None
+
+        if style_fn is None:
+            style_fn = self._resolve_style(self._default_style())
+
+        return ReprPlan(
+            klass,
+            self._name,
+            steps,
+            style_fn,
+            limits=limits,
+            cache=cache,
+            fragments=fragments,
+            formatters=formatters,
+            keys=keys,
+        )
+
+    def _collect_attributes(self, instance, plan):
+        # Returns the attributes described by the plan, without looking up the
+        # values of named attributes.
+        if not plan.instance_dependent:
+            return plan.attributes
+
+        attributes = []
+
+        for action, argument in plan.steps:
+            if action is STATIC:
+                attributes.extend(argument)
+            elif action is REFLECT:
+                attributes.extend(argument.reflect_attribute_values(instance))
+            else:
+                return_value = argument.__wrapped__(instance)
+                attributes.extend(
+                    argument._expand_repr_return_value(instance, return_value)
+                )
+
+        if plan.keys is not None:
+            keys = plan.keys
+            attributes = [
+                attribute
+                for attribute in attributes
+                if attribute_key(attribute) in keys
+            ]
+
+        return attributes
+
     def _default_style(self):
         return call_style
 
+    def _attribute_template(self):
+        return_value = self._constant_return
+
+        if return_value is NOT_CONSTANT:
+            return None
+
+        return self._parse_repr_return_value(return_value)
+
     def _expand_repr_return_value(self, instance, return_value):
+        attributes = []
+
+        for item in self._parse_repr_return_value(return_value):
+            if item is self._mirror:
+                attributes.extend(self._mirror.reflect_attribute_values(instance))
+            else:
+                attributes.append(item)
+
+        return attributes
+
+    def _process_attribute_sequence(self, instance, attributes):
+        processed_attributes = []
+
+        for attribute in attributes:
+            if not isinstance(attribute, str):
+                processed_attributes.append(attribute)
+                continue
+
+            try:
+                value = getattr(instance, attribute)
+            except AttributeError:
+                # Unlike attributes named explicitly, declared fields are
+                # skipped if they aren't set.
+                if isinstance(attribute, DeclaredField):
+                    continue
+                raise
+
+            processed_attributes.append((attribute, value))
+
+        return processed_attributes
+
+    def _parse_repr_return_value(self, return_value):
+        # Returns the described attributes, with our mirror standing in for
+        # reflected attributes.
         if return_value is None:
-            return self._mirror.reflect_attributes(instance)
+            return [self._mirror]
         if isinstance(return_value, str):
             raise ValueError("for a string repr, remove @easyrepr or EasyRepr")
         if not isinstance(return_value, Sequence):
@@ -176,7 +617,7 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
 
                 attributes.append(tuple(item))
             elif item == Ellipsis:
-                attributes.extend(self._mirror.reflect_attributes(instance))
+                attributes.append(self._mirror)
             else:
                 raise ValueError(
                     f"attribute is not a string, sequence, or ellipsis: {item!r}"
@@ -184,16 +625,66 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
 
         return attributes
 
-    def _process_attribute_sequence(self, instance, attributes):
-        processed_attributes = []
+    def _render_profiled(self, instance, plan, report):
+        # Counterpart of render and _process_attribute_sequence that records
+        # the time spent on each attribute in a profile report.
+        clock = instrumentation.clock
+        class_name = plan.class_name
+        time_values = plan.limits is None and plan.style_fn in (
+            angle_style,
+            call_style,
+        )
+        attributes = []
+
+        for index, attribute in enumerate(self._collect_attributes(instance, plan)):
+            start = clock()
 
-        for attribute in attributes:
             if isinstance(attribute, str):
-                processed_attributes.append((attribute, getattr(instance, attribute)))
+                try:
+                    attribute = (attribute, getattr(instance, attribute))
+                except AttributeError:
+                    if isinstance(attribute, DeclaredField):
+                        continue
+                    raise
+
+            elapsed = clock() - start
+
+            if len(attribute) == 1:
+                name = index
+            elif isinstance(attribute[0], str):
+                name = attribute[0]
             else:
-                processed_attributes.append(attribute)
+                name = repr(attribute[0])
 
-        return processed_attributes
+            report.record_lookup(class_name, name, elapsed)
+
+            if plan.formatters is not None:
+                formatter = plan.formatters.dispatch(type(attribute[-1]))
+
+                if formatter is not None:
+                    start = clock()
+                    value = FormattedValue(formatter(attribute[-1]))
+                    report.record_repr(class_name, name, clock() - start)
+                    attribute = (*attribute[:-1], value)
+
+            if time_values:
+                value = report.timed_value(class_name, name, attribute[-1])
+                attribute = (*attribute[:-1], value)
+
+            attributes.append(attribute)
+
+        if time_values:
+            return plan.style_fn(instance, class_name, attributes)
+
+        start = clock()
+
+        if plan.limits is not None:
+            result = plan.style_fn(instance, class_name, attributes, limits=plan.limits)
+        else:
+            result = plan.style_fn(instance, class_name, attributes)
+
+        report.record_repr(class_name, None, clock() - start)
+        return result
 
     def _resolve_style(self, style):
         if style == "<>":
@@ -201,3 +692,18 @@ class EasyRepr(metaclass=_EasyReprBootstrap):
         elif style == "()":
             return call_style
         return style
+
+
+def find_easyrepr(value):
+    """Return the EasyRepr behind a method, if any.
+
+    :param value: a class attribute, e.g., ``type(obj).__repr__``
+    :returns: the `EasyRepr`, or `None` if `value` is not an EasyRepr or a
+      function created by `EasyRepr.as_function`
+    """
+    if isinstance(value, EasyRepr):
+        return value
+    if isinstance(value, types.FunctionType):
+        # Functions returned by EasyRepr.as_function.
+        return getattr(value, "__easyrepr__", None)
+    return None
@@ -0,0 +1,114 @@
+import collections
+import contextvars
+import itertools
+import os
+
+from .batch import repr_many
+from .structured import freeze
+
+
+__all__ = ["dump"]
+
+
+def dump(iterable, file, *, workers=None, chunk_size=1000, processes=False):
+    """Write the reprs of many objects to a file, one per line, in parallel.
+
+    :param iterable: the objects to repr
+    :param file: a text file (or any object with a `write` method)
+    :param workers: the number of worker threads or processes. Default is
+      `None` (the number of CPUs).
+    :param chunk_size: the number of objects formatted by a worker at a time.
+      Default is 1000.
+    :param processes: use worker processes rather than threads. Default is
+      `False`.
+
+    The objects are split into chunks, which are formatted by a pool of workers
+    and written to `file` in order, with one write per chunk. Only a few chunks
+    are in flight at a time, so `iterable` may be much larger than memory.
+
+    In worker threads, chunks are formatted by `.batch.repr_many`. With worker
+    processes, the objects are converted by `.structured.freeze` in this
+    process, and only the resulting plain values are sent to the workers to be
+    formatted, so the objects themselves need not be picklable.
+
+    >>> import io
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class UseEasyRepr:
+    ...     def __init__(self, foo):
+    ...         self.foo = foo
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         ...
+    ...
+    >>> file = io.StringIO()
+    >>> dump((UseEasyRepr(i) for i in range(3)), file, workers=2, chunk_size=2)
+    >>> print(file.getvalue(), end="")
+    UseEasyRepr(foo=0)
+    UseEasyRepr(foo=1)
+    UseEasyRepr(foo=2)
+    """
+    # Importing concurrent.futures is slow, and only needed here.
+    import concurrent.futures
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if processes:
+        executor_class = concurrent.futures.ProcessPoolExecutor
+        prepare_chunk = _prepare_records
+        format_chunk = _format_records
+    else:
+        executor_class = concurrent.futures.ThreadPoolExecutor
+        prepare_chunk = None
+        format_chunk = _format_objects
+
+    # Enough chunks to keep every worker busy while the oldest is written.
+    max_pending = 2 * workers
+    pending = collections.deque()
+
+    with executor_class(max_workers=workers) as executor:
+        for chunk in _chunks(iterable, chunk_size):
+            if prepare_chunk is not None:
+                chunk = prepare_chunk(chunk)
+
+            if processes:
+                future = executor.submit(format_chunk, chunk)
+            else:
+                # Threads don't inherit context variables, e.g., the verbosity
+                # tier.
+                context = contextvars.copy_context()
+                future = executor.submit(context.run, format_chunk, chunk)
+
+            pending.append(future)
+
+            if len(pending) >= max_pending:
+                file.write(pending.popleft().result())
+
+        while pending:
+            file.write(pending.popleft().result())
+
+
+def _chunks(iterable, chunk_size):
+    iterator = iter(iterable)
+
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _format_objects(objects):
+    return "".join([text + "\n" for text in repr_many(objects)])
+
+
+def _format_records(records):
+    return "".join([repr(record) + "\n" for record in records])
+
+
+def _prepare_records(objects):
+    return [freeze(obj) for obj in objects]
@@ -0,0 +1,231 @@
+"""A process-wide switch to replace easyrepr reprs with cheap ones.
+
+While falling back, easyrepr objects are shown like ``<Klass at 0x7f...>``
+instead of computing their attributes, e.g., to take the cost of reprs out of
+a hot path during an incident. Falling back may be sampled, so that the full
+repr is still computed once in every so many calls, and may be overridden per
+class. Falling back is disabled by default, and costs only a single check per
+repr while disabled.
+
+>>> from easyrepr import easyrepr, fallback
+...
+>>> class UseEasyRepr:
+...     def __init__(self, foo):
+...         self.foo = foo
+...
+...     @easyrepr
+...     def __repr__(self):
+...         ...
+...
+>>> fallback.enable(sample=2)
+>>> repr(UseEasyRepr(1))
+'UseEasyRepr(foo=1)'
+>>> repr(UseEasyRepr(1))  # doctest: +ELLIPSIS
+'<UseEasyRepr at 0x...>'
+>>> fallback.disable()
+>>> fallback.counts()["UseEasyRepr"]
+FallbackCounts(full=1, skipped=1)
+>>> fallback.reset_counts()
+
+Falling back can also be enabled by setting the environment variable
+``EASYREPR_FALLBACK`` before easyrepr is imported, to ``1`` to always fall back,
+or to ``sample:N`` to compute the full repr once in every `N` calls.
+"""
+
+import collections
+import os
+import threading
+import warnings
+import weakref
+
+from . import runtime
+
+__all__ = [
+    "clear_override",
+    "counts",
+    "disable",
+    "enable",
+    "ENVIRONMENT_VARIABLE",
+    "fallback_repr",
+    "FallbackCounts",
+    "load_environment",
+    "override",
+    "reset_counts",
+    "should_fall_back",
+]
+
+
+#: The environment variable read by :any:`load_environment`.
+ENVIRONMENT_VARIABLE = "EASYREPR_FALLBACK"
+
+#: The number of reprs of one class that were computed in full, and that fell
+#: back, while falling back was enabled for the class.
+FallbackCounts = collections.namedtuple("FallbackCounts", ["full", "skipped"])
+
+#: Whether any class may fall back. This is the only thing checked by reprs
+#: while falling back is disabled.
+active = False
+
+# A policy is the number of calls in which to compute one full repr: 0 to
+# always fall back, or None to never fall back.
+_policy = None
+_overrides = weakref.WeakKeyDictionary()
+# Class -> policy, resolved through the MRO.
+_resolved = weakref.WeakKeyDictionary()
+
+# Class qualified name -> [full, skipped]
+_counts = {}
+_lock = threading.Lock()
+
+
+def enable(sample=None):
+    """Start falling back for every class, except where overridden.
+
+    :param sample: if given, still compute the full repr once in every `sample`
+      calls for each class. Default is `None` (always fall back).
+    """
+    global _policy
+    _policy = _check_sample(sample)
+    _policy_changed()
+
+
+def disable():
+    """Stop falling back, except for classes overridden to fall back. Counts
+    recorded so far are kept."""
+    global _policy
+    _policy = None
+    _policy_changed()
+
+
+def override(klass, enabled=True, sample=None):
+    """Set whether a class falls back, regardless of :any:`enable`.
+
+    :param klass: the class, whose subclasses are also affected
+    :param enabled: whether instances of `klass` fall back. Default is `True`.
+    :param sample: if given, still compute the full repr once in every `sample`
+      calls. Default is `None` (always fall back).
+    """
+    _overrides[klass] = _check_sample(sample) if enabled else None
+    _policy_changed()
+
+
+def clear_override(klass):
+    """Remove the override for a class, if any.
+
+    :param klass: the class
+    """
+    _overrides.pop(klass, None)
+    _policy_changed()
+
+
+def should_fall_back(klass):
+    """Return whether the next repr of an instance of a class should fall back,
+    and count it.
+
+    :param klass: the instance's class
+    """
+    try:
+        policy = _resolved[klass]
+    except KeyError:
+        policy = _resolved[klass] = _resolve(klass)
+
+    if policy is None:
+        return False
+
+    with _lock:
+        class_counts = _counts.get(klass.__qualname__, None)
+
+        if class_counts is None:
+            class_counts = _counts[klass.__qualname__] = [0, 0]
+
+        calls = class_counts[0] + class_counts[1]
+
+        if policy and calls % policy == 0:
+            class_counts[0] += 1
+            return False
+
+        class_counts[1] += 1
+        return True
+
+
+def fallback_repr(obj):
+    """Return the cheap repr of an object, e.g., ``<Klass at 0x7f...>``.
+
+    :param obj: the object to repr
+    """
+    return f"<{type(obj).__qualname__} at {id(obj):#x}>"
+
+
+def counts():
+    """Return the counts of full and skipped reprs recorded so far.
+
+    :returns: a :class:`dict` from class qualified name to
+      :any:`FallbackCounts`
+    """
+    with _lock:
+        return {
+            class_name: FallbackCounts(*class_counts)
+            for class_name, class_counts in _counts.items()
+        }
+
+
+def reset_counts():
+    """Discard all counts recorded so far."""
+    with _lock:
+        _counts.clear()
+
+
+def load_environment(environ=os.environ):
+    """Enable or disable falling back according to :any:`ENVIRONMENT_VARIABLE`.
+
+    :param environ: the environment to read. Default is :data:`os.environ`.
+
+    This is called when easyrepr is imported. The variable may be ``1`` (or
+    ``on``) to always fall back, ``sample:N`` to compute the full repr once in
+    every `N` calls, or ``0`` (or ``off``, or empty) not to fall back. Any other
+    value is ignored with a warning.
+    """
+    value = environ.get(ENVIRONMENT_VARIABLE, "").strip().lower()
+    mode, _, sample = value.partition(":")
+
+    if value in ("", "0", "off"):
+        disable()
+    elif value in ("1", "on"):
+        enable()
+    elif mode == "sample" and sample.isdigit() and int(sample) >= 1:
+        enable(sample=int(sample))
+    else:
+        warnings.warn(
+            f"ignoring invalid {ENVIRONMENT_VARIABLE}: {value!r}", RuntimeWarning
+        )
+
+
+def _check_sample(sample):
+    if sample is None:
+        return 0
+    if sample < 1:
+        raise ValueError(f"sample must be at least 1: {sample!r}")
+    return sample
+
+
+def _resolve(klass):
+    for mro_type in klass.__mro__:
+        try:
+            return _overrides[mro_type]
+        except KeyError:
+            pass
+
+    return _policy
+
+
+def _policy_changed():
+    global active
+    _resolved.clear()
+    active = _policy is not None or any(
+        policy is not None for policy in _overrides.values()
+    )
+    # The functions installed by the class decorator don't fall back.
+    runtime.set_reason("fallback", active)
+
+
+load_environment()
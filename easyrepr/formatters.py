@@ -0,0 +1,405 @@
+"""Formatters for attribute values of particular types.
+
+By default, each attribute value is formatted by :func:`repr`. A formatter
+registry maps types to functions that format values of those types instead,
+similar to :func:`functools.singledispatch`. Formatters registered with
+:any:`register_formatter` apply to every easyrepr class, and a
+`.descriptor.EasyRepr` may also have formatters of its own.
+
+>>> from easyrepr import easyrepr
+...
+>>> class UseEasyRepr:
+...     def __init__(self, foo, bar):
+...         self.foo = foo
+...         self.bar = bar
+...
+...     @easyrepr(formatters={bytes: summarize_bytes})
+...     def __repr__(self):
+...         ...
+...
+>>> repr(UseEasyRepr(1, bytes(range(100))))
+"UseEasyRepr(foo=1, bar=bytes(len=100, hex='0001020304050607...'))"
+
+Formatters apply to attribute values themselves, not to items nested inside
+them (e.g., in a list).
+
+Formatters for types from optional libraries can be registered lazily, by the
+type's qualified name (see :any:`FormatterRegistry.register_lazy`), so that the
+library isn't imported just to register them. That's how the summarizers in
+`.arrays` for NumPy arrays and pandas objects are registered by default.
+"""
+
+import sys
+import weakref
+
+from . import runtime
+from .arrays import (
+    summarize_dataframe,
+    summarize_index,
+    summarize_ndarray,
+    summarize_series,
+)
+from .plan import invalidate_plans
+
+
+__all__ = [
+    "default_formatters",
+    "register_lazy_formatter",
+    "FormattedValue",
+    "FormatterRegistry",
+    "register_formatter",
+    "summarize_bytes",
+]
+
+
+# Every registry, so that their dispatch caches can be cleared when any
+# registry they fall back to changes.
+_registries = weakref.WeakSet()
+
+# Stands in for default_formatters as a default argument, since it doesn't exist
+# until this module is loaded.
+_DEFAULT_PARENT = object()
+
+# The number of types whose formatter lookup each registry remembers. The cache
+# is cleared when it's full, so that dynamically created types aren't kept
+# around forever.
+_DISPATCH_CACHE_SIZE = 1024
+
+
+class FormatterRegistry:
+    """A mapping from types to the functions that format their values.
+
+    :param formatters: an optional mapping from type to formatter, to register
+      right away
+    :param parent: the registry to fall back to for types without a formatter
+      in this registry. Default is :any:`default_formatters`.
+
+    A formatter is called with a value and returns the formatted string, which
+    is shown in place of the value's repr. The formatter for a value is the one
+    registered for the first class in its type's MRO that has one.
+
+    >>> registry = FormatterRegistry(parent=None)
+    >>> @registry.register(int)
+    ... def format_int(value):
+    ...     return hex(value)
+    ...
+    >>> registry.format_attributes([("foo", 255), ("bar", "baz")])
+    [('foo', 0xff), ('bar', 'baz')]
+    """
+
+    def __init__(self, formatters=None, *, parent=_DEFAULT_PARENT):
+        if parent is _DEFAULT_PARENT:
+            parent = default_formatters
+
+        self.parent = parent
+
+        self._formatters = {}
+        self._lazy_formatters = {}
+        self._dispatch_cache = {}
+        self._used_while_inactive = False
+        _registries.add(self)
+
+        if formatters:
+            for klass, formatter in formatters.items():
+                self.register(klass, formatter)
+
+    def __repr__(self):
+        return f"<FormatterRegistry types={list(self._formatters)!r}>"
+
+    @property
+    def active(self):
+        """Whether this registry or any registry it falls back to has
+        formatters."""
+        return bool(self._formatters) or (
+            self.parent is not None and self.parent.active
+        )
+
+    def register(self, klass, formatter=None):
+        """Register a formatter for a type and its subclasses.
+
+        :param klass: the type of values to format
+        :param formatter: the function to format them. If omitted, this method
+          returns a decorator that registers the decorated function.
+        """
+        if formatter is None:
+
+            def decorator(formatter):
+                self.register(klass, formatter)
+                return formatter
+
+            return decorator
+
+        self._formatters[klass] = formatter
+        _formatters_changed()
+        return formatter
+
+    def register_lazy(self, name, formatter):
+        """Register a formatter for a type that may not have been imported yet.
+
+        :param name: the type's module and qualified name, e.g.,
+          ``"numpy.ndarray"``
+        :param formatter: the function to format its values
+
+        The formatter is registered once the type's module has been imported by
+        someone else, as noticed by :any:`resolve_lazy`. It doesn't replace a
+        formatter that was registered for the type directly.
+
+        While any lazy formatter is pending, reprs using this registry look up
+        a formatter for each value (see :any:`use`), so that the first value of
+        a newly imported type resolves its formatter.
+        """
+        self._lazy_formatters[name] = formatter
+        self.resolve_lazy()
+
+    def resolve_lazy(self):
+        """Register the lazy formatters whose modules have been imported.
+
+        This is called whenever a repr plan is built, and whenever a formatter
+        is looked up for a type for the first time.
+        """
+        for name in list(self._lazy_formatters):
+            klass = _find_imported_type(name)
+
+            if klass is None:
+                continue
+
+            formatter = self._lazy_formatters.pop(name)
+
+            if klass not in self._formatters:
+                self.register(klass, formatter)
+
+    def unregister(self, klass):
+        """Remove the formatter registered for a type, if any.
+
+        :param klass: the type whose formatter should be removed
+        """
+        if self._formatters.pop(klass, None) is not None:
+            _formatters_changed()
+
+    def use(self):
+        """Note that a repr plan uses this registry.
+
+        :returns: this registry if it or any registry it falls back to has
+          formatters, including lazy formatters that are still pending, or else
+          `None`
+
+        This also registers any lazy formatters whose modules have been
+        imported (see :any:`resolve_lazy`).
+
+        Registering the first formatter in a registry that was already used
+        without any formatters makes the functions installed by the class
+        decorator defer to their descriptor, which is somewhat slower, since
+        they were generated without formatters. So it's best to register
+        formatters up-front.
+        """
+        registry = self
+        pending = False
+
+        while registry is not None:
+            if registry._lazy_formatters:
+                registry.resolve_lazy()
+                pending = pending or bool(registry._lazy_formatters)
+            registry = registry.parent
+
+        if pending or self.active:
+            return self
+
+        registry = self
+
+        while registry is not None:
+            registry._used_while_inactive = True
+            registry = registry.parent
+
+        return None
+
+    def dispatch(self, klass):
+        """Return the formatter for values of a type, or `None` if values of
+        the type are formatted by :func:`repr`.
+
+        :param klass: the type of the value
+
+        Lookups are cached per type.
+        """
+        try:
+            return self._dispatch_cache[klass]
+        except KeyError:
+            pass
+
+        # The type may come from a module imported since the lazy formatters
+        # were last resolved.
+        if self._lazy_formatters:
+            self.resolve_lazy()
+
+        formatter = self._find_formatter(klass)
+
+        if len(self._dispatch_cache) >= _DISPATCH_CACHE_SIZE:
+            self._dispatch_cache.clear()
+
+        self._dispatch_cache[klass] = formatter
+        return formatter
+
+    def format_attributes(self, attributes):
+        """Format the attribute values that have a formatter.
+
+        :param attributes: the sequence of attribute tuples, which may be either
+          ``(key, value)`` or ``(value,)``
+        :returns: the attributes, with each value that has a formatter replaced
+          by a :any:`FormattedValue`
+        """
+        dispatch = self.dispatch
+        formatted_attributes = None
+
+        for index, attribute in enumerate(attributes):
+            value = attribute[-1]
+            formatter = dispatch(type(value))
+
+            if formatter is None:
+                continue
+
+            if formatted_attributes is None:
+                formatted_attributes = list(attributes)
+
+            formatted_value = FormattedValue(formatter(value))
+            formatted_attributes[index] = (*attribute[:-1], formatted_value)
+
+        if formatted_attributes is None:
+            return attributes
+        return formatted_attributes
+
+    def format_value(self, value):
+        """Format one value, with its formatter or else :func:`repr`.
+
+        :param value: the value to format
+        :returns: the formatted string
+
+        >>> FormatterRegistry({int: hex}, parent=None).format_value(255)
+        '0xff'
+        """
+        # Generated repr functions call this for every attribute, so look in
+        # the dispatch cache directly first.
+        try:
+            formatter = self._dispatch_cache[type(value)]
+        except KeyError:
+            formatter = self.dispatch(type(value))
+
+        if formatter is None:
+            return repr(value)
+        return formatter(value)
+
+    def _find_formatter(self, klass):
+        formatters = self._formatters
+
+        for base in klass.__mro__:
+            formatter = formatters.get(base, None)
+
+            if formatter is not None:
+                return formatter
+
+        if self.parent is not None:
+            return self.parent.dispatch(klass)
+
+        return None
+
+
+def _find_imported_type(name):
+    parts = name.split(".")
+
+    # The longest prefix that names an imported module, e.g., "package.module"
+    # for "package.module.Klass".
+    for index in range(len(parts) - 1, 0, -1):
+        obj = sys.modules.get(".".join(parts[:index]), None)
+
+        if obj is not None:
+            break
+    else:
+        return None
+
+    for part in parts[index:]:
+        # The module may still be importing.
+        obj = getattr(obj, part, None)
+
+    if isinstance(obj, type):
+        return obj
+    return None
+
+
+def _formatters_changed():
+    for registry in _registries:
+        registry._dispatch_cache.clear()
+
+    # Plans remember whether there are any formatters at all, and the functions
+    # generated for plans without formatters don't apply them. Functions
+    # generated with formatters look them up on each call, so they stay valid.
+    invalidate_plans()
+    runtime.set_reason(
+        "formatters",
+        any(
+            registry._used_while_inactive and registry._formatters
+            for registry in _registries
+        ),
+    )
+
+
+class FormattedValue:
+    """A value that has already been formatted.
+
+    :param text: the formatted value, which is returned as its repr
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return self.text
+
+
+def summarize_bytes(value, max_bytes=8):
+    """Formatter for bytes values that shows the length and a hex prefix.
+
+    :param value: a :class:`bytes` or :class:`bytearray`
+    :param max_bytes: the number of bytes to show. Default is 8.
+
+    Only the bytes shown are read, however long `value` is.
+
+    >>> summarize_bytes(b"\\x00\\x01\\x02")
+    "bytes(len=3, hex='000102')"
+    """
+    prefix = value[:max_bytes].hex()
+    ellipsis = "..." if len(value) > max_bytes else ""
+    return f"{type(value).__name__}(len={len(value)}, hex='{prefix}{ellipsis}')"
+
+
+#: The global registry, which every other registry falls back to by default.
+default_formatters = FormatterRegistry(parent=None)
+
+
+def register_formatter(klass, formatter=None):
+    """Register a formatter for a type in :any:`default_formatters`.
+
+    :param klass: the type of values to format
+    :param formatter: the function to format them. If omitted, this function
+      returns a decorator.
+
+    See :any:`FormatterRegistry.register`.
+    """
+    return default_formatters.register(klass, formatter)
+
+
+def register_lazy_formatter(name, formatter):
+    """Register a formatter for a type in :any:`default_formatters`, by name.
+
+    :param name: the type's module and qualified name, e.g.,
+      ``"numpy.ndarray"``
+    :param formatter: the function to format its values
+
+    See :any:`FormatterRegistry.register_lazy`.
+    """
+    default_formatters.register_lazy(name, formatter)
+
+
+register_lazy_formatter("numpy.ndarray", summarize_ndarray)
+register_lazy_formatter("pandas.DataFrame", summarize_dataframe)
+register_lazy_formatter("pandas.Index", summarize_index)
+register_lazy_formatter("pandas.Series", summarize_series)
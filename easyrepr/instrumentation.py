@@ -0,0 +1,314 @@
+"""Opt-in statistics on the reprs computed by easyrepr.
+
+Instrumentation is disabled by default, and costs only a single check per repr
+while disabled. Once enabled, each call to `.descriptor.EasyRepr` records its
+wall time and the length of its result under the class's qualified name. Time
+spent on nested easyrepr objects is included in the time of their parent, as
+well as being recorded for their own class.
+
+>>> from easyrepr import easyrepr, instrumentation
+...
+>>> class UseEasyRepr:
+...     def __init__(self, foo, bar):
+...         self.foo = foo
+...         self.bar = bar
+...
+...     @easyrepr
+...     def __repr__(self):
+...         ...
+...
+>>> instrumentation.enable()
+>>> repr(UseEasyRepr(1, 2))
+'UseEasyRepr(foo=1, bar=2)'
+>>> instrumentation.disable()
+>>> stats = instrumentation.snapshot()["UseEasyRepr"]
+>>> stats.calls, stats.total_length
+(1, 25)
+>>> instrumentation.reset()
+
+To find out which attributes make a repr slow, use :any:`profile`.
+"""
+
+import collections
+import contextlib
+import threading
+import time
+
+from . import runtime
+
+__all__ = [
+    "AttributeProfile",
+    "disable",
+    "enable",
+    "profile",
+    "ProfileReport",
+    "record",
+    "reset",
+    "ReprStats",
+    "snapshot",
+]
+
+
+#: Statistics for the reprs of one class.
+ReprStats = collections.namedtuple(
+    "ReprStats",
+    ["calls", "total_time", "max_time", "total_length", "max_length"],
+)
+
+#: Profile of one attribute of a class, as reported by :any:`ProfileReport`.
+AttributeProfile = collections.namedtuple(
+    "AttributeProfile",
+    ["class_name", "attribute", "calls", "getattr_time", "repr_time", "total_time"],
+)
+
+#: Whether statistics are being recorded. Use :any:`enable` and :any:`disable`
+#: to change it.
+enabled = False
+
+#: The report of the innermost active :any:`profile`, or `None`.
+profile_report = None
+
+#: Whether either statistics or a profile are being recorded. This is the only
+#: thing checked by reprs while instrumentation is not in use.
+active = False
+
+# Class name -> [calls, total_time, max_time, total_length, max_length]
+_stats = {}
+_lock = threading.Lock()
+
+#: The clock used to time reprs.
+clock = time.perf_counter
+
+
+def enable():
+    """Start recording statistics."""
+    global enabled
+    enabled = True
+    _update_active()
+
+
+def disable():
+    """Stop recording statistics. Statistics recorded so far are kept."""
+    global enabled
+    enabled = False
+    _update_active()
+
+
+def record(class_name, elapsed, length):
+    """Record one repr.
+
+    :param class_name: the qualified name of the instance's class
+    :param elapsed: the wall time taken by the repr, in seconds
+    :param length: the length of the repr string
+    """
+    with _lock:
+        stats = _stats.get(class_name, None)
+
+        if stats is None:
+            _stats[class_name] = [1, elapsed, elapsed, length, length]
+            return
+
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+        stats[3] += length
+        stats[4] = max(stats[4], length)
+
+
+def snapshot():
+    """Return the statistics recorded so far.
+
+    :returns: a :class:`dict` from class qualified name to :any:`ReprStats`
+    """
+    with _lock:
+        return {class_name: ReprStats(*stats) for class_name, stats in _stats.items()}
+
+
+def reset():
+    """Discard all statistics recorded so far."""
+    with _lock:
+        _stats.clear()
+
+
+@contextlib.contextmanager
+def profile():
+    """Context manager to profile the attributes of easyrepr objects.
+
+    :returns: a :any:`ProfileReport`, which is filled in while the context is
+      active
+
+    Within the context, every easyrepr repr (in any thread) times the lookup
+    of each named attribute separately from the repr of its value, and adds
+    them to the report under the class and attribute name. Nested easyrepr
+    objects are profiled as well, and their time is also included in the repr
+    time of the attribute they are nested in.
+
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class UseEasyRepr:
+    ...     def __init__(self, foo):
+    ...         self.foo = foo
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         return ("foo", "bar")
+    ...
+    ...     @property
+    ...     def bar(self):
+    ...         return self.foo * 2
+    ...
+    >>> with profile() as report:
+    ...     _ = repr(UseEasyRepr(1))
+    ...
+    >>> sorted((entry.attribute, entry.calls) for entry in report.top())
+    [('bar', 1), ('foo', 1)]
+
+    Use :any:`ProfileReport.format` for a table of the slowest attributes.
+
+    Nameless attributes are reported by their position. Attributes are only
+    timed individually for the built-in styles without limits; otherwise, the
+    time taken by the style function is reported with an attribute of `None`.
+    """
+    global profile_report
+
+    report = ProfileReport()
+    previous_report = profile_report
+    profile_report = report
+    _update_active()
+
+    try:
+        yield report
+    finally:
+        profile_report = previous_report
+        _update_active()
+
+
+class ProfileReport:
+    """The times recorded by :any:`profile`, per class and attribute."""
+
+    def __init__(self):
+        # (class_name, attribute) -> [calls, getattr_time, repr_time]
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<ProfileReport entries={len(self._entries)!r}>"
+
+    def top(self, n=None):
+        """Return the most expensive attributes, most expensive first.
+
+        :param n: the number of attributes to return. Default is `None` (all
+          attributes).
+        :returns: a list of :any:`AttributeProfile`
+        """
+        with self._lock:
+            entries = [
+                AttributeProfile(
+                    class_name,
+                    attribute,
+                    calls,
+                    getattr_time,
+                    repr_time,
+                    getattr_time + repr_time,
+                )
+                for (class_name, attribute), (
+                    calls,
+                    getattr_time,
+                    repr_time,
+                ) in self._entries.items()
+            ]
+
+        entries.sort(key=lambda entry: entry.total_time, reverse=True)
+        return entries[:n]
+
+    def format(self, n=10):
+        """Return the most expensive attributes as a table.
+
+        :param n: the number of attributes to include. Default is 10.
+        """
+        rows = [("attribute", "calls", "getattr", "repr", "total")]
+
+        for entry in self.top(n):
+            rows.append(
+                (
+                    f"{entry.class_name}.{entry.attribute}",
+                    str(entry.calls),
+                    f"{entry.getattr_time:.6f}",
+                    f"{entry.repr_time:.6f}",
+                    f"{entry.total_time:.6f}",
+                )
+            )
+
+        name_width = max(len(row[0]) for row in rows)
+        lines = [
+            row[0].ljust(name_width) + "".join(column.rjust(10) for column in row[1:])
+            for row in rows
+        ]
+        return "\n".join(lines)
+
+    def record_lookup(self, class_name, attribute, elapsed):
+        """Record one use of an attribute, and the time taken to look it up.
+
+        :param class_name: the qualified name of the instance's class
+        :param attribute: the attribute name (or position, if nameless)
+        :param elapsed: the time taken by :func:`getattr`, in seconds
+        """
+        key = (class_name, attribute)
+
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            if entry is None:
+                self._entries[key] = [1, elapsed, 0.0]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+
+    def record_repr(self, class_name, attribute, elapsed):
+        """Record the time taken to repr the value of an attribute.
+
+        :param class_name: the qualified name of the instance's class
+        :param attribute: the attribute name (or position, if nameless), or
+          `None` for the time taken by a whole style function
+        :param elapsed: the time taken, in seconds
+        """
+        key = (class_name, attribute)
+
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            if entry is None:
+                self._entries[key] = [0, 0.0, elapsed]
+            else:
+                entry[2] += elapsed
+
+    def timed_value(self, class_name, attribute, value):
+        """Wrap a value so that the time taken to repr it is recorded.
+
+        :param class_name: the qualified name of the instance's class
+        :param attribute: the attribute name (or position, if nameless)
+        :param value: the attribute value
+        """
+        return _TimedValue(self, class_name, attribute, value)
+
+
+class _TimedValue:
+    __slots__ = ("report", "class_name", "attribute", "value")
+
+    def __init__(self, report, class_name, attribute, value):
+        self.report = report
+        self.class_name = class_name
+        self.attribute = attribute
+        self.value = value
+
+    def __repr__(self):
+        start = clock()
+        text = repr(self.value)
+        self.report.record_repr(self.class_name, self.attribute, clock() - start)
+        return text
+
+
+def _update_active():
+    global active
+    active = enabled or profile_report is not None
+    runtime.set_reason("instrumentation", active)
@@ -0,0 +1,79 @@
+from .descriptor import find_easyrepr
+
+
+__all__ = ["lazy", "LazyRepr"]
+
+
+def lazy(obj, *, limits=None):
+    """Return a proxy that computes the repr of an object only when needed.
+
+    :param obj: the object to repr
+    :param limits: a `.limits.ReprLimits` to apply to the repr, in addition to
+      any limits set for the object's class. Default is `None`.
+    :returns: a :any:`LazyRepr`
+
+    This is useful for logging, where the message (and so the repr) is often
+    never formatted, e.g., ::
+
+        logger.debug("state %s", lazy(obj))
+
+    Creating the proxy does not do any of the work of the repr.
+
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class UseEasyRepr:
+    ...     def __init__(self, foo, bar):
+    ...         self.foo = foo
+    ...         self.bar = bar
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         ...
+    ...
+    >>> proxy = lazy(UseEasyRepr(1, 2))
+    >>> f"state {proxy}"
+    'state UseEasyRepr(foo=1, bar=2)'
+    """
+    return LazyRepr(obj, limits)
+
+
+class LazyRepr:
+    """Proxy for the repr of an object, computed on first use.
+
+    :param obj: the object to repr
+    :param limits: a `.limits.ReprLimits` to apply to the repr, or `None`
+
+    Both :func:`str` and :func:`repr` of the proxy return the repr of the
+    object. The repr is computed at most once per proxy, so that several log
+    handlers formatting the same record share the work.
+    """
+
+    __slots__ = ("_obj", "_limits", "_repr")
+
+    def __init__(self, obj, limits=None):
+        self._obj = obj
+        self._limits = limits
+        self._repr = None
+
+    def __repr__(self):
+        result = self._repr
+
+        if result is None:
+            result = self._repr = self._compute_repr()
+            # The object isn't needed any more.
+            self._obj = None
+
+        return result
+
+    __str__ = __repr__
+
+    def _compute_repr(self):
+        obj = self._obj
+
+        if self._limits is not None:
+            repr_fn = find_easyrepr(type(obj).__repr__)
+
+            if repr_fn is not None:
+                return repr_fn.repr_bounded(obj, self._limits)
+
+        return repr(obj)
@@ -0,0 +1,314 @@
+import reprlib
+import sys
+
+from .descriptor import find_easyrepr
+from .formatters import FormattedValue
+from .structured import _Record
+
+
+__all__ = ["ReprLimits"]
+
+
+# Used in place of limits that are not set.
+_UNLIMITED = sys.maxsize
+
+# Nesting depth of plain containers when max_depth is not set, matching
+# reprlib.Repr.
+_DEFAULT_CONTAINER_DEPTH = 6
+
+_FILL_VALUE = "..."
+
+# Marks the end of the attributes in ReprLimits.join_attributes.
+_END = object()
+
+
+class ReprLimits:
+    """Limits on the size of a repr, similar to :class:`reprlib.Repr`.
+
+    :param max_length: the maximum length of the repr. Default is `None` (no
+      limit).
+    :param max_attribute_length: the maximum length of each formatted
+      attribute. Default is `None` (no limit).
+    :param max_items: the maximum number of items to show from each container
+      (:class:`list`, :class:`dict`, etc.). Default is `None` (no limit).
+    :param max_depth: the maximum number of levels of nested containers and
+      easyrepr objects to expand. Default is `None`, which does not limit nested
+      easyrepr objects, but limits plain containers to reprlib's default of 6
+      levels.
+
+    The limits are enforced while the repr is produced: formatting stops once
+    `max_length` is used up, containers stop after `max_items`, and nested
+    easyrepr objects are formatted within what's left of their parent's limits.
+    Anything left out is replaced by ``...``.
+
+    >>> limits = ReprLimits(max_length=25, max_items=3)
+    >>> attributes = [("foo", list(range(100))), ("bar", 2), ("baz", 3)]
+    >>> limits.join_attributes(attributes, ", ")
+    'foo=[0, 1, 2, ...], ...'
+
+    The class name and the ``...`` marker are always included, so a repr may
+    exceed `max_length` if that is very small.
+
+    Values of types that reprlib does not know how to shorten are formatted
+    with :func:`repr` and then truncated to `max_attribute_length`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_length=None,
+        max_attribute_length=None,
+        max_items=None,
+        max_depth=None,
+    ):
+        self.max_length = max_length
+        self.max_attribute_length = max_attribute_length
+        self.max_items = max_items
+        self.max_depth = max_depth
+
+    def __repr__(self):
+        return (
+            f"ReprLimits(max_length={self.max_length!r}, "
+            f"max_attribute_length={self.max_attribute_length!r}, "
+            f"max_items={self.max_items!r}, max_depth={self.max_depth!r})"
+        )
+
+    @property
+    def exhausted(self):
+        """Whether the maximum depth has been used up, so that no attributes
+        should be shown at all."""
+        return self.max_depth is not None and self.max_depth < 0
+
+    def combine(self, other):
+        """Return limits that are at least as strict as both these limits and
+        `other`.
+
+        :param other: other limits, or `None`
+        """
+        if other is None or other is self:
+            return self
+
+        return ReprLimits(
+            max_length=_min_limit(self.max_length, other.max_length),
+            max_attribute_length=_min_limit(
+                self.max_attribute_length, other.max_attribute_length
+            ),
+            max_items=_min_limit(self.max_items, other.max_items),
+            max_depth=_min_limit(self.max_depth, other.max_depth),
+        )
+
+    def nested(self, max_length, max_depth):
+        """Return the limits for an object nested inside a repr.
+
+        :param max_length: the length left over for the nested object
+        :param max_depth: the depth left over for the nested object
+        """
+        return ReprLimits(
+            max_length=max_length,
+            max_attribute_length=self.max_attribute_length,
+            max_items=self.max_items,
+            max_depth=max_depth,
+        )
+
+    def join_attributes(self, attributes, separator, reserved=0):
+        """Format and join attributes, stopping once `max_length` is used up.
+
+        :param attributes: an iterable of attribute tuples, which may be either
+          ``(key, value)`` or ``(value,)``
+        :param separator: the string to put between formatted attributes
+        :param reserved: the length of the rest of the repr (e.g., the class
+          name and punctuation), which is subtracted from `max_length`
+        :returns: the joined string, ending with ``...`` if any attributes
+          were left out
+        """
+        if self.exhausted:
+            return _FILL_VALUE
+
+        budget = _limit(self.max_length) - reserved
+        pieces = []
+        used = 0
+        iterator = iter(attributes)
+        attribute = next(iterator, _END)
+
+        while attribute is not _END:
+            if pieces:
+                used += len(separator)
+
+            remaining = budget - used
+
+            if remaining < len(_FILL_VALUE):
+                pieces.append(_FILL_VALUE)
+                break
+
+            piece = self.format_attribute(attribute, remaining)
+            next_attribute = next(iterator, _END)
+
+            # Unless this is the last attribute, keep room for the separator and
+            # the marker for the attributes after it.
+            room = remaining - len(separator) - len(_FILL_VALUE)
+
+            if next_attribute is not _END and len(piece) > room:
+                if room > len(_FILL_VALUE):
+                    pieces.append(self.format_attribute(attribute, room))
+
+                pieces.append(_FILL_VALUE)
+                break
+
+            pieces.append(piece)
+            used += len(piece)
+            attribute = next_attribute
+
+        return separator.join(pieces)
+
+    def format_attribute(self, attribute, max_length=None):
+        """Format a tuple describing an attribute within these limits.
+
+        :param attribute: attribute tuple, which may be either ``(key, value)``
+          or ``(value,)``
+        :param max_length: the maximum length of the result, in addition to
+          `max_attribute_length`
+        :returns: the formatted string
+
+        This is the bounded counterpart of `.style.format_attribute`.
+        """
+        max_length = min(_limit(max_length), _limit(self.max_attribute_length))
+
+        if len(attribute) == 1:
+            (value,) = attribute
+            return self.repr_value(value, max_length)
+
+        key, value = attribute
+
+        if isinstance(key, str):
+            key_str = key
+        else:
+            key_str = self.repr_value(key, max_length)
+
+        prefix = f"{key_str}="
+        value_str = self.repr_value(value, max_length - len(prefix))
+
+        return _truncate(prefix + value_str, max_length)
+
+    def repr_value(self, value, max_length=None):
+        """Return the repr of a value within these limits.
+
+        :param value: the value to format
+        :param max_length: the maximum length of the result, in addition to
+          `max_attribute_length`
+        """
+        max_length = min(_limit(max_length), _limit(self.max_attribute_length))
+        bounded_repr = _BoundedRepr(self, max_length)
+        text = bounded_repr.repr_bounded(value, self._value_depth())
+        return _truncate(text, max_length)
+
+    def _value_depth(self):
+        if self.max_depth is None:
+            return _DEFAULT_CONTAINER_DEPTH
+        return self.max_depth
+
+
+class _BoundedRepr(reprlib.Repr):
+    # Formats one value within max_length. Each value gets its own instance,
+    # which keeps track of how much of max_length is left.
+
+    def __init__(self, limits, max_length):
+        super().__init__()
+        self.limits = limits
+        self.max_length = max_length
+        self.remaining = max_length
+        # The length of the values formatted so far within the value being
+        # formatted, which have already been subtracted from remaining.
+        self._counted = 0
+
+        # Each item takes at least one character and a separator, so no more
+        # than this many can fit.
+        max_items = min(_limit(limits.max_items), max_length // 3 + 1)
+        self.maxtuple = max_items
+        self.maxlist = max_items
+        self.maxarray = max_items
+        self.maxdict = max_items
+        self.maxset = max_items
+        self.maxfrozenset = max_items
+        self.maxdeque = max_items
+
+        # Strings are shortened before their repr adds quotes (see
+        # repr_bounded).
+        self.maxstring = max_length + 2
+        self.maxlong = max_length
+        self.maxother = max_length
+
+    def repr_bounded(self, value, level):
+        repr_fn = find_easyrepr(type(value).__repr__)
+
+        if repr_fn is not None:
+            return self._repr_easyrepr(repr_fn, value, level, self.max_length)
+        if type(value) is _Record:
+            return self._repr_easyrepr(None, value, level, self.max_length)
+
+        # Formatted values are only truncated, like any other string.
+        if type(value) is FormattedValue:
+            return value.text
+
+        # Strings are only shortened to maxstring, so shorten them to fit here,
+        # too, before paying for the full repr.
+        if isinstance(value, str) and len(value) > self.max_length:
+            value = value[: self.max_length]
+
+        return self.repr1(value, level)
+
+    def repr1(self, x, level):
+        # Once max_length is used up, the rest of the items of containers are
+        # cut off anyway, so don't bother formatting them.
+        if self.remaining <= 0:
+            return _FILL_VALUE
+
+        outer_counted = self._counted
+        self._counted = 0
+
+        text = super().repr1(x, level)
+
+        # Items of x have already subtracted their own length.
+        self.remaining -= len(text) - self._counted
+        self._counted = outer_counted + len(text)
+        return text
+
+    def repr_instance(self, x, level):
+        repr_fn = find_easyrepr(type(x).__repr__)
+
+        if repr_fn is not None or type(x) is _Record:
+            max_length = max(self.remaining, len(_FILL_VALUE))
+            return self._repr_easyrepr(repr_fn, x, level, max_length)
+
+        return super().repr_instance(x, level)
+
+    def _repr_easyrepr(self, repr_fn, value, level, max_length):
+        # repr_fn is None for a snapshot of an easyrepr object (see
+        # .structured.freeze).
+        max_depth = None if self.limits.max_depth is None else level - 1
+        nested_limits = self.limits.nested(max_length, max_depth)
+
+        if repr_fn is None:
+            return value.repr_bounded(nested_limits)
+        return repr_fn.repr_bounded(value, nested_limits)
+
+
+def _limit(value):
+    if value is None:
+        return _UNLIMITED
+    return value
+
+
+def _min_limit(first, second):
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+def _truncate(text, max_length):
+    if len(text) <= max_length:
+        return text
+    if max_length <= len(_FILL_VALUE):
+        return _FILL_VALUE
+    return text[: max_length - len(_FILL_VALUE)] + _FILL_VALUE
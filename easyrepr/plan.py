@@ -0,0 +1,271 @@
+from .codegen import compile_repr
+from .reflection import DeclaredField, Mirror
+from .style import angle_style, call_style
+
+
+__all__ = [
+    "attribute_key",
+    "CALL",
+    "invalidate_plans",
+    "REFLECT",
+    "ReprPlan",
+    "STATIC",
+]
+
+
+#: Plan step that extends the attributes with a precomputed list.
+STATIC = "static"
+#: Plan step that extends the attributes with all reflected attributes.
+REFLECT = "reflect"
+#: Plan step that calls an EasyRepr's wrapped function.
+CALL = "call"
+
+
+# Incremented whenever cached plans might be stale, e.g., because a new EasyRepr
+# was attached to a class. Each plan remembers the generation it was built in.
+_generation = 0
+
+
+def invalidate_plans():
+    """Invalidate every cached repr plan.
+
+    Plans are invalidated automatically when a new `.descriptor.EasyRepr` is
+    attached to a class, when the method is reassigned on any class in an MRO,
+    and when a class's MRO changes. Call this function after any other change that
+    should affect existing reprs.
+    """
+    global _generation
+    _generation += 1
+
+
+class ReprPlan:
+    """Everything `.descriptor.EasyRepr` needs to repr instances of one class.
+
+    :param klass: the concrete class of the instances
+    :param name: the name of the method the plan was built for
+    :param contributions: ``(owner, repr_fn, template)`` for each contributing
+      EasyRepr descriptor, in order. `template` is the descriptor's attribute
+      list with a `.reflection.Mirror` in place of each `Ellipsis`, or `None`
+      if the wrapped function has to be called for each instance.
+    :param style_fn: the resolved style function
+    :param limits: the resolved `.limits.ReprLimits`, or `None`
+    :param cache: the resolved `.cache.ReprCache`, or `None`
+    :param fragments: the resolved `.cache.FragmentCache`, or `None`. It is
+      only used with the built-in styles and without limits.
+    :param formatters: the resolved `.formatters.FormatterRegistry`, or `None`
+    :param keys: if given, only include attributes with these keys (names), for
+      a verbosity tier (see `.tiers`). Nameless attributes are left out.
+
+    :ivar steps: the steps to compute the attributes of an instance, as
+      ``(action, argument)`` tuples. The action is one of :any:`STATIC` (the
+      argument is a list of attributes), :any:`REFLECT` (the argument is a
+      Mirror), or :any:`CALL` (the argument is an EasyRepr).
+    :ivar instance_dependent: whether any step needs the instance to compute its
+      attribute list. If not, :any:`attributes` holds the full, precomputed list.
+    :ivar has_declared_fields: whether :any:`attributes` includes any
+      `.reflection.DeclaredField`, which is skipped if an instance doesn't have
+      it
+    :ivar needs_lookup: whether the computed attributes may include names to be
+      looked up on the instance, rather than only ``(key, value)`` or
+      ``(value,)`` tuples
+    :ivar compiled: a specialized repr function generated by
+      `.codegen.compile_repr`, or `None` if the plan has to use the generic path
+    :ivar fragments: the `.cache.FragmentCache` to format attributes with, or
+      `None`
+    :ivar formatters: the `.formatters.FormatterRegistry` to format attribute
+      values with, or `None` if there are no formatters to apply
+    :ivar keys: the keys of the attributes to include, or `None` for all. Static
+      steps are already filtered; the attributes computed by other steps have
+      to be filtered for each instance.
+    """
+
+    __slots__ = (
+        "attributes",
+        "cache",
+        "class_name",
+        "compiled",
+        "formatters",
+        "fragments",
+        "generation",
+        "has_declared_fields",
+        "instance_dependent",
+        "keys",
+        "limits",
+        "methods",
+        "mro_id",
+        "name",
+        "needs_lookup",
+        "steps",
+        "style_fn",
+    )
+
+    def __init__(
+        self,
+        klass,
+        name,
+        contributions,
+        style_fn,
+        limits=None,
+        cache=None,
+        fragments=None,
+        formatters=None,
+        keys=None,
+    ):
+        self.name = name
+        # Remember the MRO by id only: plans are cached weakly by class, so they
+        # must not hold a reference to the class itself.
+        self.mro_id = id(klass.__mro__)
+        self.class_name = klass.__qualname__
+
+        # Remember the exact value in the __dict__ of every class in the MRO,
+        # which may be a plain function wrapping an EasyRepr rather than the
+        # EasyRepr itself. Any of them may be reassigned to add or remove a
+        # contributor, which doesn't call __set_name__.
+        self.methods = tuple(
+            mro_type.__dict__.get(name, None) for mro_type in klass.__mro__
+        )
+        self.keys = keys
+        self.steps = _build_steps(klass, contributions, keys)
+        self.style_fn = style_fn
+        self.limits = limits
+        self.cache = cache
+
+        # Using the formatters may register lazy formatters, which invalidates
+        # plans, so this has to come before the generation is remembered.
+        self.formatters = None if formatters is None else formatters.use()
+        self.generation = _generation
+
+        # Fragments are joined by the built-in styles' own formatting.
+        if limits is None and style_fn in (angle_style, call_style):
+            self.fragments = fragments
+        else:
+            self.fragments = None
+
+        self.instance_dependent = any(action is not STATIC for action, _ in self.steps)
+        self.needs_lookup = any(
+            action is CALL
+            or (action is STATIC and any(isinstance(item, str) for item in argument))
+            for action, argument in self.steps
+        )
+
+        if self.instance_dependent:
+            self.attributes = None
+            self.has_declared_fields = False
+        else:
+            self.attributes = [
+                attribute for _, attributes in self.steps for attribute in attributes
+            ]
+            self.has_declared_fields = any(
+                isinstance(attribute, DeclaredField) for attribute in self.attributes
+            )
+
+        # The generated functions don't know about limits, and format every
+        # attribute each time.
+        if self.instance_dependent or limits is not None or self.fragments is not None:
+            self.compiled = None
+        else:
+            self.compiled = compile_repr(
+                self.class_name,
+                self.attributes,
+                style_fn,
+                format_value=self.format_value,
+                on_unset=self._render_set if self.has_declared_fields else None,
+            )
+
+    @property
+    def format_value(self):
+        """The function to format attribute values with, or `None` to use
+        :func:`repr`."""
+        if self.formatters is None:
+            return None
+        return self.formatters.format_value
+
+    def _render_set(self, instance):
+        # Called by the generated function when an attribute isn't set, to
+        # repr only the declared fields that are.
+        attributes = []
+
+        for attribute in self.attributes:
+            if isinstance(attribute, str):
+                try:
+                    attribute = (attribute, getattr(instance, attribute))
+                except AttributeError:
+                    if isinstance(attribute, DeclaredField):
+                        continue
+                    raise
+
+            attributes.append(attribute)
+
+        if self.formatters is not None:
+            attributes = self.formatters.format_attributes(attributes)
+
+        return self.style_fn(instance, self.class_name, attributes)
+
+    def is_valid_for(self, klass):
+        """Return whether this plan is still up to date for the given class.
+
+        :param klass: the concrete class the plan was built for
+
+        This is checked on every call of the descriptor, and is not O(1): a
+        method reassigned on any class in the MRO doesn't call `__set_name__`,
+        so the only way to notice it is to look up the method in the
+        `__dict__` of each class in the MRO. It costs about a microsecond for a
+        class five deep. Functions generated by `.descriptor.EasyRepr.as_function`
+        inline the same check, without the call overhead.
+        """
+        if self.generation != _generation or id(klass.__mro__) != self.mro_id:
+            return False
+
+        name = self.name
+
+        for mro_type, value in zip(klass.__mro__, self.methods):
+            if mro_type.__dict__.get(name, None) is not value:
+                return False
+
+        return True
+
+
+def attribute_key(attribute):
+    """Return the key (name) of an attribute.
+
+    :param attribute: an attribute name, ``(key, value)``, or ``(value,)``
+    :returns: the key, or `None` for a nameless attribute
+    """
+    if isinstance(attribute, str):
+        return attribute
+    if len(attribute) == 2:
+        return attribute[0]
+    return None
+
+
+def _build_steps(klass, contributions, keys):
+    steps = []
+
+    for _, repr_fn, template in contributions:
+        if template is None:
+            steps.append((CALL, repr_fn))
+            continue
+
+        for item in template:
+            if isinstance(item, Mirror):
+                # Declared fields are the same for every instance, so they
+                # don't need to be reflected each time.
+                fields = item.reflect_fields(klass)
+
+                if fields is None:
+                    steps.append((REFLECT, item))
+                    continue
+
+                items = fields
+            else:
+                items = (item,)
+
+            if keys is not None:
+                items = [item for item in items if attribute_key(item) in keys]
+
+            if steps and steps[-1][0] is STATIC:
+                steps[-1][1].extend(items)
+            else:
+                steps.append((STATIC, list(items)))
+
+    return tuple(steps)
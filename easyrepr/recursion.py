@@ -0,0 +1,36 @@
+"""Protection against reprs of objects that contain themselves.
+
+Like :func:`reprlib.recursive_repr`, each repr adds a key for its instance to
+:any:`running` while it runs, and an instance whose key is already there is
+formatted as :any:`FILL_VALUE` instead. Keys include the thread identity, so
+reprs in other threads are not affected. Reprs never suspend part-way, so this
+is safe with :mod:`asyncio` as well.
+"""
+
+from threading import get_ident
+
+
+__all__ = ["FILL_VALUE", "get_ident", "is_nested", "running"]
+
+
+#: The repr of an object that is already being repr'd.
+FILL_VALUE = "..."
+
+#: The ``(id(instance), get_ident())`` keys of the reprs in progress.
+running = set()
+
+
+def is_nested(key):
+    """Return whether a repr runs inside another repr in the same thread.
+
+    :param key: the key of the repr, which must be in :any:`running`
+
+    The result of a nested repr may show the objects of the outer reprs as
+    :any:`FILL_VALUE`, so it's not the object's full repr.
+    """
+    if len(running) == 1:
+        return False
+
+    ident = key[1]
+    # Copying the set doesn't release the GIL, unlike iterating over it.
+    return any(other[1] == ident and other != key for other in tuple(running))
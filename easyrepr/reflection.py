@@ -1,4 +1,28 @@
-__all__ = ["is_private", "Mirror"]
+import dis
+import fnmatch
+import re
+import types
+import weakref
+
+
+__all__ = [
+    "compile_filter",
+    "DeclaredField",
+    "declared_fields",
+    "is_private",
+    "Mirror",
+    "NOT_CONSTANT",
+    "reflect_constant_return",
+    "SlotLayout",
+]
+
+
+#: Sentinel returned by :any:`reflect_constant_return` for a function that does
+#: not simply return a constant.
+NOT_CONSTANT = object()
+
+# Instructions that may appear in a function's bytecode without doing anything.
+_NO_OP_INSTRUCTIONS = frozenset(("CACHE", "NOP", "RESUME"))
 
 
 def is_private(attribute):
@@ -6,6 +30,173 @@ def is_private(attribute):
     return attribute.startswith("_")
 
 
+def compile_filter(include=None, exclude=None, hide_private=False):
+    """Compile attribute name patterns into a single predicate.
+
+    :param include: if given, only accept names that match one of these
+      patterns
+    :param exclude: if given, reject names that match any of these patterns
+    :param hide_private: reject private names (according to :any:`is_private`)
+    :returns: a function that accepts a name and returns whether it passes the
+      filter, or `None` if every name passes
+
+    Each of `include` and `exclude` may be a single pattern or an iterable of
+    patterns. A pattern is either a `str` glob that must match the whole name
+    (see :mod:`fnmatch`), a compiled regular expression that must match
+    anywhere in the name, or a function that accepts a name and returns
+    whether it matches. All the globs are combined into one regular
+    expression.
+
+    >>> accepts = compile_filter(exclude=["*password*", re.compile("token")])
+    >>> [name for name in ["user", "password", "api_token"] if accepts(name)]
+    ['user']
+    """
+    include_fn = _compile_patterns(include)
+    exclude_fn = _compile_patterns(exclude)
+
+    if hide_private:
+        if exclude_fn is None:
+            exclude_fn = is_private
+        else:
+            exclude_fn = _any_of((is_private, exclude_fn))
+
+    if include_fn is None and exclude_fn is None:
+        return None
+    if include_fn is None:
+        return lambda name: not exclude_fn(name)
+    if exclude_fn is None:
+        return lambda name: bool(include_fn(name))
+
+    return lambda name: bool(include_fn(name)) and not exclude_fn(name)
+
+
+def declared_fields(klass):
+    """Return the names of the fields that a class declares for its instances.
+
+    :param klass: the class to inspect
+    :returns: a tuple of field names in declaration order, or `None` if the
+      class doesn't declare its fields
+
+    Fields are declared by any of the following, checked in this order:
+
+    * :mod:`dataclasses` --- the fields of a class decorated with
+      :func:`~dataclasses.dataclass`, except those with ``repr=False``
+    * attrs --- the attributes of a class decorated by the attrs package,
+      except those with ``repr=False``
+    * :func:`~collections.namedtuple` and :class:`typing.NamedTuple` --- the
+      tuple's `_fields`, unless instances also have a `__dict__`
+
+    Dataclasses and attrs classes only count if `klass` itself was decorated,
+    because a subclass may add attributes of its own. Annotations alone don't
+    declare fields, since instances may not set every annotated name, or may
+    set others.
+
+    >>> import dataclasses
+    >>> @dataclasses.dataclass
+    ... class Point:
+    ...     x: int
+    ...     y: int
+    ...     label: str = dataclasses.field(default="", repr=False)
+    ...
+    >>> declared_fields(Point)
+    ('x', 'y')
+    """
+    declared = _declared_repr_flags(klass)
+
+    if declared is not None:
+        return tuple(name for name, shown in declared if shown)
+
+    tuple_fields = getattr(klass, "_fields", None)
+    if (
+        issubclass(klass, tuple)
+        and isinstance(tuple_fields, tuple)
+        and klass.__dictoffset__ == 0
+    ):
+        return tuple_fields
+
+    return None
+
+
+def reflect_constant_return(function):
+    """Return the constant that a function always returns.
+
+    :param function: the function to inspect
+    :returns: the constant return value, or :any:`NOT_CONSTANT` if the function
+      does anything other than return a constant
+
+    The function's code object is inspected rather than calling it. A function
+    whose body is only a docstring, :keyword:`pass`, or `Ellipsis` (:any:`...`)
+    is considered to return the constant `None`.
+
+    >>> def returns_names(self):
+    ...     return ("foo", "bar")
+    ...
+    >>> reflect_constant_return(returns_names)
+    ('foo', 'bar')
+    >>> reflect_constant_return(lambda self: [self]) is NOT_CONSTANT
+    True
+    """
+    code = getattr(function, "__code__", None)
+
+    if code is None:
+        return NOT_CONSTANT
+
+    instructions = [
+        instruction
+        for instruction in dis.get_instructions(code)
+        if instruction.opname not in _NO_OP_INSTRUCTIONS
+    ]
+
+    if len(instructions) == 1 and instructions[0].opname == "RETURN_CONST":
+        return instructions[0].argval
+
+    if (
+        len(instructions) == 2
+        and instructions[0].opname == "LOAD_CONST"
+        and instructions[1].opname == "RETURN_VALUE"
+    ):
+        return instructions[0].argval
+
+    return NOT_CONSTANT
+
+
+class DeclaredField(str):
+    """The name of a declared field (see :any:`declared_fields`).
+
+    It's a plain :class:`str` in every other respect, but marks the attribute
+    as one that's skipped, rather than raising :exc:`AttributeError`, when an
+    instance doesn't have it, like a slot that isn't set.
+    """
+
+    __slots__ = ()
+
+
+class SlotLayout:
+    """The visible attribute layout of a type.
+
+    :param members: ``(name, member)`` for each visible slot, where `member` is
+      the slot's member descriptor
+    :param has_dict: whether instances have a `__dict__`
+    :param hidden: names that a base dataclass or attrs class declares with
+      ``repr=False``, which are never visible
+
+    :ivar dict_names: ``(keys, names)``, where `keys` are the keys of the last
+      `__dict__` filtered for this type, and `names` are the visible ones, or
+      `None`
+    """
+
+    __slots__ = ("members", "has_dict", "hidden", "dict_names")
+
+    def __init__(self, members, has_dict, hidden=frozenset()):
+        self.members = tuple(members)
+        self.has_dict = has_dict
+        self.hidden = hidden
+        self.dict_names = None
+
+    def __repr__(self):
+        return f"SlotLayout(members={self.members!r}, has_dict={self.has_dict!r})"
+
+
 class Mirror:
     """Class to access attributes via reflection.
 
@@ -16,11 +207,26 @@ class Mirror:
         :any:`object`) to bottom (most derived, i.e., the type of the
         instance); otherwise from bottom to top. Default is `True` (top to
         bottom).
+    :param include: patterns for the only attributes to reflect. Default is
+      `None` (all attributes).
+    :param exclude: patterns for attributes not to reflect. Default is `None`.
+
+    See :any:`compile_filter` for the patterns. The filter is applied once per
+    type to slots and declared fields. The visible names in a `__dict__` are
+    remembered per type, and only filtered again when an instance's
+    `__dict__` has different keys than the last one.
     """
 
-    def __init__(self, hide_private=True, top_down=True):
+    def __init__(self, hide_private=True, top_down=True, include=None, exclude=None):
         self.hide_private = hide_private
         self.top_down = top_down
+        self.include = include
+        self.exclude = exclude
+
+        self._accepts = compile_filter(include, exclude, hide_private)
+
+        self._layouts = weakref.WeakKeyDictionary()
+        self._fields = weakref.WeakKeyDictionary()
 
     def reflect_classes(self, instance):
         """Return all classes in the method resolution order (MRO) for the
@@ -28,7 +234,15 @@ class Mirror:
 
         :param instance: the object whose classes should be reflected
         """
-        classes_bottom_up = type(instance).__mro__
+        return self.reflect_classes_of_type(type(instance))
+
+    def reflect_classes_of_type(self, klass):
+        """Return all classes in the method resolution order (MRO) for the
+        given type.
+
+        :param klass: the type whose classes should be reflected
+        """
+        classes_bottom_up = klass.__mro__
 
         if not self.top_down:
             return classes_bottom_up
@@ -40,31 +254,237 @@ class Mirror:
 
         :param instance: the object whose attributes should be reflected
         """
-        attributes = []
+        return [name for name, _ in self.reflect_attribute_values(instance)]
 
-        for klass in self.reflect_classes(instance):
-            slots = klass.__dict__.get("__slots__", None)
-            if slots is not None:
-                attributes.extend(
-                    attribute
-                    for attribute in self._filter_private_attributes(slots)
-                    if hasattr(instance, attribute)
-                )
+    def reflect_attribute_values(self, instance):
+        """Return all visible attributes of the given instance, with their
+        values.
 
-        if hasattr(instance, "__dict__"):
-            attributes.extend(self._filter_private_attributes(instance.__dict__.keys()))
+        :param instance: the object whose attributes should be reflected
+        :returns: a list of ``(name, value)`` tuples
+
+        If the instance's class declares its fields (see :any:`reflect_fields`),
+        those are the attributes. Otherwise, slots are read directly through
+        their member descriptors, using the layout cached by
+        :any:`reflect_layout`. Slots that are not set are skipped, as are
+        fields that a base dataclass or attrs class shows with ``repr=False``.
+        """
+        fields = self.reflect_fields(type(instance))
 
-        return attributes
+        if fields is not None:
+            attribute_values = []
 
-    def _filter_private_attributes(self, candidate_attributes):
-        if not self.hide_private:
-            return candidate_attributes
+            for name in fields:
+                try:
+                    attribute_values.append((name, getattr(instance, name)))
+                except AttributeError:
+                    pass
 
-        return (
-            attribute for attribute in candidate_attributes if not is_private(attribute)
+            return attribute_values
+
+        layout = self.reflect_layout(type(instance))
+        attribute_values = []
+
+        for name, member in layout.members:
+            try:
+                attribute_values.append((name, member.__get__(instance)))
+            except AttributeError:
+                pass
+
+        if layout.has_dict:
+            attributes = instance.__dict__
+
+            if self._accepts is None and not layout.hidden:
+                attribute_values.extend(attributes.items())
+            else:
+                names = self._filter_dict_names(layout, attributes)
+                attribute_values.extend([(name, attributes[name]) for name in names])
+
+        return attribute_values
+
+    def reflect_fields(self, klass):
+        """Return the visible fields that the given type declares.
+
+        :param klass: the type whose fields should be reflected
+        :returns: a tuple of :any:`DeclaredField` names, or `None` if the type
+          doesn't declare its fields (see :any:`declared_fields`)
+
+        The fields are computed once per type and cached. Unlike other
+        attributes, they're included in declaration order. Like slots, fields
+        that aren't set are skipped.
+        """
+        try:
+            return self._fields[klass]
+        except KeyError:
+            pass
+
+        fields = declared_fields(klass)
+
+        if fields is not None:
+            fields = tuple(
+                DeclaredField(name) for name in self._filter_attributes(fields)
+            )
+
+        self._fields[klass] = fields
+        return fields
+
+    def reflect_layout(self, klass):
+        """Return the visible slot layout of the given type.
+
+        :param klass: the type whose layout should be reflected
+        :returns: a :any:`SlotLayout`
+
+        The layout is computed once per type and cached.
+        """
+        layout = self._layouts.get(klass, None)
+
+        if layout is None:
+            layout = self._compute_layout(klass)
+            self._layouts[klass] = layout
+
+        return layout
+
+    def _compute_layout(self, klass):
+        members = []
+
+        for mro_type in self.reflect_classes_of_type(klass):
+            slots = mro_type.__dict__.get("__slots__", None)
+
+            if slots is None:
+                continue
+            if isinstance(slots, str):
+                slots = (slots,)
+
+            for slot in slots:
+                if slot in ("__dict__", "__weakref__"):
+                    continue
+
+                name = _mangle(mro_type, slot)
+                member = mro_type.__dict__.get(name, None)
+
+                if isinstance(member, types.MemberDescriptorType):
+                    members.append((name, member))
+
+        hidden = _hidden_fields(klass)
+        accepted_names = self._filter_attributes((name for name, _ in members), hidden)
+        members = [(name, member) for name, member in members if name in accepted_names]
+
+        return SlotLayout(members, klass.__dictoffset__ != 0, hidden)
+
+    def _filter_attributes(self, candidate_attributes, hidden=frozenset()):
+        accepts = self._accepts
+
+        if accepts is None and not hidden:
+            return tuple(candidate_attributes)
+
+        return tuple(
+            attribute
+            for attribute in candidate_attributes
+            if attribute not in hidden and (accepts is None or accepts(attribute))
         )
 
+    def _filter_dict_names(self, layout, attributes):
+        # Instances of a type usually have the same attributes, so the names
+        # filtered for the last instance can be reused as long as the keys are
+        # the same.
+        keys = tuple(attributes)
+        dict_names = layout.dict_names
+
+        if dict_names is not None and dict_names[0] == keys:
+            return dict_names[1]
+
+        names = self._filter_attributes(keys, layout.hidden)
+        layout.dict_names = (keys, names)
+        return names
+
     def __repr__(self):
         # No easy way to get EasyRepr in here. "I guide others to a treasure I
         # cannot possess."
         return f"Mirror(skip_private={self.hide_private}, top_down={self.top_down})"
+
+
+def _compile_patterns(patterns):
+    if patterns is None:
+        return None
+    if isinstance(patterns, (str, re.Pattern)) or callable(patterns):
+        patterns = (patterns,)
+
+    globs = []
+    predicates = []
+
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            globs.append(fnmatch.translate(pattern))
+        elif isinstance(pattern, re.Pattern):
+            predicates.append(pattern.search)
+        elif callable(pattern):
+            predicates.append(pattern)
+        else:
+            raise TypeError(f"not a pattern or predicate: {pattern!r}")
+
+    if globs:
+        predicates.insert(0, re.compile("|".join(globs)).match)
+
+    if not predicates:
+        # An empty include matches nothing, and an empty exclude changes
+        # nothing either way.
+        return lambda name: False
+
+    return _any_of(predicates)
+
+
+def _any_of(predicates):
+    if len(predicates) == 1:
+        return predicates[0]
+
+    return lambda name: any(predicate(name) for predicate in predicates)
+
+
+def _declared_repr_flags(klass):
+    # (name, shown) for each field of a dataclass or attrs class, or None if
+    # klass itself wasn't decorated.
+    namespace = klass.__dict__
+
+    if "__dataclass_fields__" in namespace:
+        # Already imported, since klass is a dataclass.
+        import dataclasses
+
+        return [(field.name, field.repr) for field in dataclasses.fields(klass)]
+
+    attrs_attributes = namespace.get("__attrs_attrs__", None)
+
+    if attrs_attributes is not None:
+        return [
+            (attribute.name, attribute.repr is not False)
+            for attribute in attrs_attributes
+        ]
+
+    return None
+
+
+def _hidden_fields(klass):
+    # The fields that the nearest dataclass or attrs class declaring them shows
+    # with repr=False, e.g., for an undecorated subclass of a dataclass.
+    shown_by_name = {}
+
+    for mro_type in klass.__mro__:
+        declared = _declared_repr_flags(mro_type)
+
+        if declared is not None:
+            for name, shown in declared:
+                shown_by_name.setdefault(name, shown)
+
+    return frozenset(name for name, shown in shown_by_name.items() if not shown)
+
+
+def _mangle(klass, name):
+    # Private names in __slots__ are mangled like any other private name.
+    if not name.startswith("__") or name.endswith("__"):
+        return name
+
+    class_name = klass.__name__.lstrip("_")
+
+    if not class_name:
+        return name
+
+    return f"_{class_name}{name}"
@@ -0,0 +1,33 @@
+"""Process-wide state checked by generated repr functions.
+
+The functions that the class decorator installs (see `.codegen.compile_repr`)
+only handle the plain case, so that they can skip the descriptor's checks.
+Features that change how every repr is computed --- e.g., `.instrumentation` or
+`.formatters` --- add a reason here while they're in use, and the generated
+functions defer to their descriptor as long as there is any reason at all. That
+costs them a single check per repr.
+"""
+
+__all__ = ["deferred", "set_reason"]
+
+
+#: Whether generated repr functions must defer to their descriptor.
+deferred = False
+
+_reasons = set()
+
+
+def set_reason(reason, active):
+    """Add or remove a reason for generated repr functions to defer.
+
+    :param reason: a string naming the feature
+    :param active: whether the feature is in use
+    """
+    global deferred
+
+    if active:
+        _reasons.add(reason)
+    else:
+        _reasons.discard(reason)
+
+    deferred = bool(_reasons)
@@ -0,0 +1,258 @@
+from . import fallback, instrumentation
+from .descriptor import find_easyrepr
+from .formatters import FormattedValue
+from .recursion import FILL_VALUE, get_ident, running
+from .style import angle_style, call_style
+
+
+__all__ = ["attributes", "freeze"]
+
+
+# Types whose values are immutable and can be pickled, and so are left as they
+# are by freeze.
+_PLAIN_TYPES = frozenset(
+    [type(None), bool, int, float, complex, str, bytes, type(Ellipsis)]
+)
+
+
+def attributes(obj, *, as_dict=False, recursive=False):
+    """Return the attributes that the repr of an easyrepr object would show.
+
+    :param obj: an object whose class has an easyrepr `__repr__`
+    :param as_dict: return a :class:`dict` rather than a tuple of pairs.
+      Default is `False`.
+    :param recursive: also convert nested easyrepr objects, including those
+      in lists, tuples and dicts, to their attributes. Default is `False`.
+    :returns: a tuple of ``(key, value)`` pairs, in the same order as the repr,
+      or a dict of the same
+    :raises TypeError: if `obj` is not an easyrepr object
+
+    The attributes are resolved the same as for the repr --- including
+    inheritance, `Ellipsis`, and virtual attributes --- but values are not
+    formatted. The key of a nameless virtual attribute is `None` in a pair, or
+    its position in a dict. An object nested within its own attributes is
+    replaced by ``"..."``.
+
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class UseEasyRepr:
+    ...     def __init__(self, foo, bar):
+    ...         self.foo = foo
+    ...         self.bar = bar
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         return (..., ("baz", 3))
+    ...
+    >>> x = UseEasyRepr(1, UseEasyRepr(2, None))
+    >>> attributes(x)
+    (('foo', 1), ('bar', UseEasyRepr(foo=2, bar=None, baz=3)), ('baz', 3))
+    >>> attributes(x, as_dict=True, recursive=True)
+    {'foo': 1, 'bar': {'foo': 2, 'bar': None, 'baz': 3}, 'baz': 3}
+    """
+    repr_fn = find_easyrepr(type(obj).__repr__)
+
+    if repr_fn is None:
+        raise TypeError(f"not an easyrepr object: {type(obj).__qualname__}")
+
+    return _attributes(repr_fn, obj, as_dict, recursive)
+
+
+def freeze(value, *, portable=True):
+    """Return a snapshot of a value that has the same repr, made of plain values.
+
+    :param value: the value to snapshot
+    :param portable: whether the snapshot must be repr'able in another process.
+      If `False`, easyrepr objects with a user-defined style are frozen, too.
+      Default is `True`.
+    :returns: a copy of `value` that is independent of the original, and can
+      be pickled if `portable` is set
+
+    Plain values, such as numbers and strings, are kept as they are, and lists,
+    tuples and dicts are copied with their items frozen in turn. Easyrepr
+    objects are replaced by a record of their frozen attributes, which is
+    formatted by the object's style, within its limits, when it's repr'd.
+    Anything else --- including attribute values that have a formatter, and
+    easyrepr objects with a user-defined style unless `portable` is `False` ---
+    is formatted right away, and replaced by the resulting text.
+
+    So the work left in the repr of the snapshot is mostly formatting plain
+    values and joining strings, which can be done in another thread or
+    process while the original objects keep changing. A snapshot's repr
+    doesn't use or fill the cache of a class with one (see `.cache`), and a
+    user-defined style is called with `None` for the instance.
+
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class UseEasyRepr:
+    ...     def __init__(self, foo):
+    ...         self.foo = foo
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         ...
+    ...
+    >>> x = UseEasyRepr([1, 2])
+    >>> snapshot = freeze(x)
+    >>> x.foo.append(3)
+    >>> repr(snapshot)
+    'UseEasyRepr(foo=[1, 2])'
+    """
+    klass = type(value)
+
+    if klass in _PLAIN_TYPES:
+        return value
+
+    repr_fn = find_easyrepr(klass.__repr__)
+
+    if repr_fn is not None:
+        return _freeze_easyrepr(repr_fn, value, portable)
+
+    # Only containers with a predictable order are converted; e.g., a set of
+    # converted values might be ordered differently.
+    if klass is list:
+        return [freeze(item, portable=portable) for item in value]
+    if klass is tuple:
+        return tuple([freeze(item, portable=portable) for item in value])
+    if klass is dict:
+        return {
+            _freeze_key(key): freeze(item, portable=portable)
+            for key, item in value.items()
+        }
+
+    return _Text(repr(value))
+
+
+def _attributes(repr_fn, obj, as_dict, recursive):
+    key = (id(obj), get_ident())
+
+    if key in running:
+        return FILL_VALUE
+
+    running.add(key)
+
+    try:
+        pairs = []
+
+        for index, attribute in enumerate(repr_fn.compute_attributes(obj)):
+            if len(attribute) == 1:
+                (value,) = attribute
+                name = index if as_dict else None
+            else:
+                name, value = attribute
+
+            if recursive:
+                value = _convert(value, as_dict)
+
+            pairs.append((name, value))
+    finally:
+        running.discard(key)
+
+    if as_dict:
+        return dict(pairs)
+    return tuple(pairs)
+
+
+def _convert(value, as_dict):
+    repr_fn = find_easyrepr(type(value).__repr__)
+
+    if repr_fn is not None:
+        return _attributes(repr_fn, value, as_dict, True)
+
+    # Only plain containers are converted, so that other types (e.g., named
+    # tuples) keep their own identity.
+    if type(value) is list or type(value) is tuple:
+        return type(value)(_convert(item, as_dict) for item in value)
+    if type(value) is dict:
+        return {key: _convert(item, as_dict) for key, item in value.items()}
+
+    return value
+
+
+def _freeze_key(key):
+    if type(key) in _PLAIN_TYPES:
+        return key
+    return _Text(repr(key))
+
+
+def _freeze_easyrepr(repr_fn, obj, portable):
+    plan = repr_fn.get_plan(type(obj))
+
+    # User-defined styles may not be picklable, and instrumentation and
+    # falling back are done by the descriptor, so these are formatted here.
+    if (
+        (portable and plan.style_fn not in (angle_style, call_style))
+        or instrumentation.active
+        or fallback.active
+    ):
+        return _Text(repr(obj))
+
+    key = (id(obj), get_ident())
+
+    if key in running:
+        return _Text(FILL_VALUE)
+
+    running.add(key)
+
+    try:
+        attributes = []
+
+        for attribute in repr_fn.compute_attributes(obj, plan):
+            value = _freeze_value(plan, attribute[-1], portable)
+
+            if len(attribute) == 1:
+                attributes.append((value,))
+            elif isinstance(attribute[0], str):
+                attributes.append((attribute[0], value))
+            else:
+                attributes.append((_freeze_key(attribute[0]), value))
+    finally:
+        running.discard(key)
+
+    return _Record(plan.class_name, plan.style_fn, attributes, plan.limits)
+
+
+def _freeze_value(plan, value, portable):
+    if plan.formatters is not None:
+        formatter = plan.formatters.dispatch(type(value))
+
+        if formatter is not None:
+            return FormattedValue(formatter(value))
+
+    return freeze(value, portable=portable)
+
+
+class _Record:
+    # The attributes of an easyrepr object, which are formatted by the object's
+    # style function, within its limits, when the record is repr'd.
+    __slots__ = ("class_name", "style_fn", "attributes", "limits")
+
+    def __init__(self, class_name, style_fn, attributes, limits):
+        self.class_name = class_name
+        self.style_fn = style_fn
+        self.attributes = attributes
+        self.limits = limits
+
+    def __repr__(self):
+        if self.limits is None:
+            return self.style_fn(None, self.class_name, self.attributes)
+
+        return self.style_fn(None, self.class_name, self.attributes, limits=self.limits)
+
+    def repr_bounded(self, limits):
+        # Counterpart of EasyRepr.repr_bounded, for a record nested in a value
+        # repr'd within limits.
+        limits = limits.combine(self.limits)
+        attributes = () if limits.exhausted else self.attributes
+        return self.style_fn(None, self.class_name, attributes, limits=limits)
+
+
+class _Text:
+    # A value that has already been formatted.
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return self.text
@@ -1,15 +1,16 @@
 import itertools
 
 
-__all__ = ["angle_style", "call_style", "format_attribute"]
+__all__ = ["angle_style", "call_style", "format_attribute", "join_formatted"]
 
 
-def angle_style(instance, class_name, attributes):
+def angle_style(instance, class_name, attributes, *, limits=None):
     """Style function for an angular repr in the style of `object`.
 
     :param instance: the object whose repr is being formatted
     :param klass_name: the class name that should be displayed
     :param attributes: the sequence of attribute tuples
+    :param limits: the `.limits.ReprLimits` to apply, if any
     :returns: the styled repr string
 
     ..
@@ -19,6 +20,14 @@ def angle_style(instance, class_name, attributes):
     '<Klass foo=1 bar=2>'
     """
 
+    if limits is not None:
+        joined_attributes = limits.join_attributes(
+            attributes, " ", reserved=len(class_name) + 3
+        )
+        if not joined_attributes:
+            return f"<{class_name}>"
+        return f"<{class_name} {joined_attributes}>"
+
     formatted_attributes = map(format_attribute, attributes)
     name_and_attributes = itertools.chain((class_name,), formatted_attributes)
     joined_contents = " ".join(name_and_attributes)
@@ -26,12 +35,13 @@ def angle_style(instance, class_name, attributes):
     return f"<{joined_contents}>"
 
 
-def call_style(instance, class_name, attributes):
+def call_style(instance, class_name, attributes, *, limits=None):
     """Style function for an angular repr in the style of a constructor call.
 
     :param instance: the object whose repr is being formatted
     :param klass_name: the class name that should be displayed
     :param attributes: the sequence of attribute tuples
+    :param limits: the `.limits.ReprLimits` to apply, if any
     :returns: the styled repr string
 
     ..
@@ -41,12 +51,37 @@ def call_style(instance, class_name, attributes):
     'Klass(foo=1, bar=2)'
     """
 
+    if limits is not None:
+        joined_attributes = limits.join_attributes(
+            attributes, ", ", reserved=len(class_name) + 2
+        )
+        return f"{class_name}({joined_attributes})"
+
     formatted_attributes = map(format_attribute, attributes)
     joined_attributes = ", ".join(formatted_attributes)
 
     return f"{class_name}({joined_attributes})"
 
 
+def join_formatted(style_fn, class_name, formatted_attributes):
+    """Join attributes that are already formatted, as a built-in style would.
+
+    :param style_fn: either :any:`angle_style` or :any:`call_style`
+    :param class_name: the class name that should be displayed
+    :param formatted_attributes: the sequence of attributes formatted by
+      :any:`format_attribute`
+    :returns: the styled repr string
+
+    >>> join_formatted(call_style, "Klass", ["foo=1", "bar=2"])
+    'Klass(foo=1, bar=2)'
+    """
+    # This must match the formatting in angle_style and call_style.
+    if style_fn is angle_style:
+        return "<" + " ".join([class_name, *formatted_attributes]) + ">"
+
+    return f"{class_name}({', '.join(formatted_attributes)})"
+
+
 def format_attribute(attribute):
     """Format a tuple describing an attribute.
 
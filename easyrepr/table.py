@@ -0,0 +1,102 @@
+from .descriptor import find_easyrepr
+from .recursion import FILL_VALUE, get_ident, running
+
+
+__all__ = ["repr_table"]
+
+
+# Header for a column of nameless virtual attributes.
+_NAMELESS = "_"
+
+
+def repr_table(iterable):
+    """Return a compact, tabular repr of a sequence of easyrepr objects.
+
+    :param iterable: the objects to repr, usually all of the same class
+    :returns: an iterator of strings: a header row, followed by one row per
+      object
+    :raises TypeError: if an object is not an easyrepr object
+
+    The header row shows the class name and the attribute names, in the same
+    order as the "call" style, and each following row shows the attribute
+    values of one object. This leaves out the class name and attribute names
+    that a repr would repeat for every object.
+
+    A new header row is started whenever the class or the attribute names
+    change from one object to the next. Rows are computed only as they're
+    needed, so the whole table is never held in memory.
+
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.x = x
+    ...         self.y = y
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         ...
+    ...
+    >>> for row in repr_table([Point(1, 2), Point(3, "four")]):
+    ...     print(row)
+    Point(x, y)
+    (1, 2)
+    (3, 'four')
+    """
+    header_key = None
+
+    for obj in iterable:
+        klass = type(obj)
+        repr_fn = find_easyrepr(klass.__repr__)
+
+        if repr_fn is None:
+            raise TypeError(f"not an easyrepr object: {klass.__qualname__}")
+
+        key = (id(obj), get_ident())
+
+        if key in running:
+            # Nested in the repr of a row that contains it.
+            row_key = None
+            row = FILL_VALUE
+        else:
+            running.add(key)
+
+            try:
+                row_key, row = _format_row(repr_fn, obj)
+            finally:
+                running.discard(key)
+
+        if row_key is not None and row_key != header_key:
+            header_key = row_key
+            class_name, names = row_key
+            yield f"{class_name}({', '.join(names)})"
+
+        yield row
+
+
+def _format_row(repr_fn, obj):
+    plan = repr_fn.get_plan(type(obj))
+    attributes = repr_fn.compute_attributes(obj, plan)
+
+    if plan.formatters is not None:
+        attributes = plan.formatters.format_attributes(attributes)
+
+    if plan.limits is not None:
+        repr_value = plan.limits.repr_value
+    else:
+        repr_value = repr
+
+    names = []
+    values = []
+
+    for attribute in attributes:
+        if len(attribute) == 1:
+            names.append(_NAMELESS)
+        elif isinstance(attribute[0], str):
+            names.append(attribute[0])
+        else:
+            names.append(repr(attribute[0]))
+
+        values.append(repr_value(attribute[-1]))
+
+    return (plan.class_name, tuple(names)), f"({', '.join(values)})"
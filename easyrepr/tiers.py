@@ -0,0 +1,86 @@
+"""Verbosity tiers, to show fewer attributes where reprs are hot.
+
+By default, reprs include every attribute. A `.descriptor.EasyRepr` may also
+declare tiers, each of which includes only some of the attributes, and the
+tier in effect is selected with :any:`verbosity`. Tiers are scoped by
+:mod:`contextvars`, so each thread and asynchronous task can use its own.
+
+>>> from easyrepr import easyrepr
+...
+>>> class UseEasyRepr:
+...     def __init__(self, id, payload):
+...         self.id = id
+...         self.payload = payload
+...
+...     @easyrepr(tiers={"brief": ["id"]})
+...     def __repr__(self):
+...         ...
+...
+>>> x = UseEasyRepr(1, [2, 3])
+>>> repr(x)
+'UseEasyRepr(id=1, payload=[2, 3])'
+>>> with verbosity("brief"):
+...     repr(x)
+...
+'UseEasyRepr(id=1)'
+
+Each tier has its own repr plan, so a repr costs the same in any tier, except
+for a single check whether any :any:`verbosity` context is active at all.
+"""
+
+import contextlib
+import contextvars
+import threading
+
+from . import runtime
+
+__all__ = ["BRIEF", "current", "FULL", "verbosity"]
+
+
+#: The default tier, which includes every attribute.
+FULL = "full"
+#: A conventional tier for a few identifying attributes, e.g., for logging.
+BRIEF = "brief"
+
+#: Whether any :any:`verbosity` context is active, in any thread. While not,
+#: the tier is :any:`FULL` without having to look it up.
+active = False
+
+_tier = contextvars.ContextVar("easyrepr_tier", default=FULL)
+_active_count = 0
+_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def verbosity(tier):
+    """Context manager to select a verbosity tier.
+
+    :param tier: the name of the tier, e.g., :any:`BRIEF`. Classes that don't
+      declare the tier are shown in full.
+    """
+    token = _tier.set(tier)
+    _update_active(1)
+
+    try:
+        yield
+    finally:
+        _tier.reset(token)
+        _update_active(-1)
+
+
+def current():
+    """Return the name of the tier in effect."""
+    if not active:
+        return FULL
+    return _tier.get()
+
+
+def _update_active(change):
+    global active, _active_count
+
+    with _lock:
+        _active_count += change
+        active = _active_count > 0
+        # The functions installed by the class decorator only know the full
+        # tier.
+        runtime.set_reason("verbosity", active)
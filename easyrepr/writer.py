@@ -0,0 +1,171 @@
+from . import fallback
+from .descriptor import find_easyrepr
+from .recursion import FILL_VALUE, get_ident, running
+from .style import angle_style, call_style
+
+
+__all__ = [
+    "write_angle_style",
+    "write_attribute",
+    "write_call_style",
+    "write_repr",
+    "write_value",
+]
+
+
+def write_repr(obj, stream):
+    """Write the repr of an object to a stream.
+
+    :param obj: the object to repr
+    :param stream: a file-like object with a `write` method (e.g.,
+      :class:`io.StringIO`), or a :class:`list` to append chunks to
+
+    The result is the same as ``repr(obj)``, but an easyrepr object and any
+    easyrepr objects nested in its attributes are written piece by piece into
+    the one stream, rather than each building an intermediate string.
+
+    >>> import io
+    >>> from easyrepr import easyrepr
+    ...
+    >>> class UseEasyRepr:
+    ...     def __init__(self, foo, bar):
+    ...         self.foo = foo
+    ...         self.bar = bar
+    ...
+    ...     @easyrepr
+    ...     def __repr__(self):
+    ...         ...
+    ...
+    >>> stream = io.StringIO()
+    >>> write_repr(UseEasyRepr(1, UseEasyRepr(2, 3)), stream)
+    >>> stream.getvalue()
+    'UseEasyRepr(foo=1, bar=UseEasyRepr(foo=2, bar=3))'
+    """
+    if isinstance(stream, list):
+        write = stream.append
+    else:
+        write = stream.write
+
+    write_value(obj, write)
+
+
+def write_value(value, write):
+    """Write the repr of a value.
+
+    :param value: the value to repr
+    :param write: a function to call with each chunk of the repr
+
+    Easyrepr objects using a built-in style are written piece by piece. Any
+    other value is written as ``repr(value)``.
+    """
+    repr_fn = find_easyrepr(type(value).__repr__)
+
+    if repr_fn is None or fallback.active:
+        write(repr(value))
+        return
+
+    plan = repr_fn.get_plan(type(value))
+    write_style_fn = _WRITE_STYLES.get(plan.style_fn, None)
+
+    # Limits are applied while building the string, so use the usual path.
+    if write_style_fn is None or plan.limits is not None:
+        write(repr(value))
+        return
+
+    key = (id(value), get_ident())
+
+    if key in running:
+        write(FILL_VALUE)
+        return
+
+    running.add(key)
+
+    try:
+        attributes = repr_fn.compute_attributes(value, plan)
+
+        if plan.formatters is not None:
+            attributes = plan.formatters.format_attributes(attributes)
+
+        write_style_fn(value, plan.class_name, attributes, write)
+    finally:
+        running.discard(key)
+
+
+def write_angle_style(instance, class_name, attributes, write):
+    """Writer counterpart of `.style.angle_style`.
+
+    :param instance: the object whose repr is being formatted
+    :param class_name: the class name that should be displayed
+    :param attributes: the sequence of attribute tuples
+    :param write: a function to call with each chunk of the repr
+
+    >>> chunks = []
+    >>> write_angle_style(object(), "Klass", [("foo", 1), ("bar", 2)], chunks.append)
+    >>> "".join(chunks)
+    '<Klass foo=1 bar=2>'
+    """
+    write("<")
+    write(class_name)
+
+    for attribute in attributes:
+        write(" ")
+        write_attribute(attribute, write)
+
+    write(">")
+
+
+def write_call_style(instance, class_name, attributes, write):
+    """Writer counterpart of `.style.call_style`.
+
+    :param instance: the object whose repr is being formatted
+    :param class_name: the class name that should be displayed
+    :param attributes: the sequence of attribute tuples
+    :param write: a function to call with each chunk of the repr
+
+    >>> chunks = []
+    >>> write_call_style(object(), "Klass", [("foo", 1), ("bar", 2)], chunks.append)
+    >>> "".join(chunks)
+    'Klass(foo=1, bar=2)'
+    """
+    write(class_name)
+    write("(")
+
+    first = True
+
+    for attribute in attributes:
+        if not first:
+            write(", ")
+        first = False
+
+        write_attribute(attribute, write)
+
+    write(")")
+
+
+def write_attribute(attribute, write):
+    """Writer counterpart of `.style.format_attribute`.
+
+    :param attribute: attribute tuple, which may be either ``(key, value)`` or
+      ``(value,)``.
+    :param write: a function to call with each chunk of the formatted attribute
+    """
+    if len(attribute) == 1:
+        (value,) = attribute
+        write_value(value, write)
+        return
+
+    key, value = attribute
+
+    if isinstance(key, str):
+        write(key)
+    else:
+        write_value(key, write)
+
+    write("=")
+    write_value(value, write)
+
+
+_WRITE_STYLES = {
+    angle_style: write_angle_style,
+    call_style: write_call_style,
+}
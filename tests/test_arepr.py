@@ -0,0 +1,205 @@
+import asyncio
+import concurrent.futures
+import subprocess
+import sys
+import threading
+
+from easyrepr import arepr, easyrepr, ReprLimits
+from easyrepr.arepr import _timings
+import pytest
+
+
+class Recorder:
+    """Records the thread its repr runs in"""
+
+    def __init__(self, data):
+        self._data = data
+        self.thread = None
+
+    @easyrepr
+    def __repr__(self):
+        return ("data",)
+
+    @property
+    def data(self):
+        self.thread = threading.get_ident()
+        return self._data
+
+
+class Snapshot:
+    def __init__(self, data):
+        self.data = data
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+def thread_style(instance, class_name, attributes):
+    """Style that records the thread it runs in"""
+    thread_style.thread = threading.get_ident()
+    return f"{class_name}!{len(attributes)}"
+
+
+class Styled:
+    def __init__(self, data):
+        self.data = data
+
+    @easyrepr(style=thread_style)
+    def __repr__(self):
+        ...
+
+
+class Limited:
+    def __init__(self, data):
+        self.data = data
+
+    @easyrepr(limits=ReprLimits(max_length=30), cache=True)
+    def __repr__(self):
+        ...
+
+
+class DeferredExecutor(concurrent.futures.Executor):
+    """Executor that runs submitted calls only when asked"""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args):
+        future = concurrent.futures.Future()
+        self.pending.append((future, fn, args))
+        return future
+
+    def run_pending(self):
+        for future, fn, args in self.pending:
+            future.set_result(fn(*args))
+        self.pending.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_timings():
+    _timings.clear()
+    yield
+    _timings.clear()
+
+
+def test_arepr_small_inline():
+    obj = Recorder([1, 2, 3])
+
+    async def main():
+        return await arepr(obj), threading.get_ident()
+
+    text, loop_thread = asyncio.run(main())
+
+    assert text == "Recorder(data=[1, 2, 3])"
+    assert obj.thread == loop_thread
+    assert Recorder in _timings
+
+
+def test_arepr_large_in_executor():
+    obj = Recorder(list(range(100)))
+    executor = DeferredExecutor()
+
+    async def main():
+        task = asyncio.ensure_future(arepr(obj, size_threshold=10, executor=executor))
+        await asyncio.sleep(0)
+        assert len(executor.pending) == 1
+        executor.run_pending()
+        return await task
+
+    assert asyncio.run(main()) == repr(obj)
+
+
+def test_arepr_timing_based():
+    """Classes that were slow last time are sent to the executor"""
+    executor = DeferredExecutor()
+    obj = Recorder(1)
+
+    async def main():
+        # Cheap by size, and not timed yet.
+        assert await arepr(obj, executor=executor) == "Recorder(data=1)"
+        assert not executor.pending
+
+        _timings[Recorder] = 1.0
+        task = asyncio.ensure_future(arepr(obj, executor=executor))
+        await asyncio.sleep(0)
+        assert len(executor.pending) == 1
+        executor.run_pending()
+        return await task
+
+    assert asyncio.run(main()) == "Recorder(data=1)"
+    # The timing was updated by the repr in the executor.
+    assert _timings[Recorder] < 1.0
+
+
+def test_arepr_snapshot():
+    obj = Snapshot([1, 2])
+    executor = DeferredExecutor()
+
+    async def main(snapshot):
+        task = asyncio.ensure_future(
+            arepr(obj, size_threshold=0, snapshot=snapshot, executor=executor)
+        )
+        await asyncio.sleep(0)
+        obj.data.append(3)
+        executor.run_pending()
+        return await task
+
+    assert asyncio.run(main(snapshot=True)) == "Snapshot(data=[1, 2])"
+
+    obj.data = [1, 2]
+    _timings.clear()
+
+    assert asyncio.run(main(snapshot=False)) == "Snapshot(data=[1, 2, 3])"
+
+
+def test_arepr_snapshot_style_in_executor():
+    """Snapshots of objects with a user-defined style are styled in the executor"""
+    obj = Styled(list(range(100)))
+
+    async def main():
+        text = await arepr(obj, size_threshold=10, snapshot=True)
+        return text, threading.get_ident()
+
+    text, loop_thread = asyncio.run(main())
+
+    assert text == "Styled!1"
+    assert thread_style.thread != loop_thread
+
+
+def test_arepr_snapshot_limits():
+    obj = Limited(list(range(100)))
+    executor = DeferredExecutor()
+
+    async def main():
+        task = asyncio.ensure_future(
+            arepr(obj, size_threshold=0, snapshot=True, executor=executor)
+        )
+        await asyncio.sleep(0)
+        obj.data = []
+        executor.run_pending()
+        return await task
+
+    assert asyncio.run(main()) == repr(Limited(list(range(100))))
+
+
+def test_arepr_default_executor():
+    obj = Recorder(list(range(100)))
+
+    async def main():
+        return await arepr(obj, size_threshold=10), threading.get_ident()
+
+    text, loop_thread = asyncio.run(main())
+
+    assert obj.thread != loop_thread
+    assert text == f"Recorder(data={list(range(100))!r})"
+
+
+def test_import_is_lazy():
+    """Importing easyrepr doesn't import asyncio"""
+    code = "import sys, easyrepr; print('asyncio' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,113 @@
+import subprocess
+import sys
+
+from easyrepr import easyrepr
+from easyrepr.arrays import (
+    summarize_dataframe,
+    summarize_index,
+    summarize_ndarray,
+    summarize_series,
+)
+import pytest
+
+
+@easyrepr
+class Holder:
+    def __init__(self, value):
+        self.value = value
+
+
+def test_import_is_lazy():
+    """Importing easyrepr doesn't import NumPy or pandas"""
+    code = "import sys, easyrepr; print({'numpy', 'pandas'} & set(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "set()"
+
+
+def test_ndarray_imported_after_class():
+    """Classes decorated before NumPy is imported still summarize arrays"""
+    pytest.importorskip("numpy")
+    code = (
+        "import easyrepr\n"
+        "@easyrepr.easyrepr\n"
+        "class Decorated:\n"
+        "    def __init__(self, value):\n"
+        "        self.value = value\n"
+        "    def __repr__(self):\n"
+        "        return ('value',)\n"
+        "print(repr(Decorated(1)))\n"
+        "import numpy\n"
+        "print(repr(Decorated(numpy.zeros(2, dtype=numpy.int8))))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines() == [
+        "Decorated(value=1)",
+        "Decorated(value=ndarray(shape=(2,), dtype=int8, nbytes=2, head=[0, 0]))",
+    ]
+
+
+def test_summarize_ndarray():
+    numpy = pytest.importorskip("numpy")
+
+    assert summarize_ndarray(numpy.arange(1000.0)) == (
+        "ndarray(shape=(1000,), dtype=float64, nbytes=8000, "
+        "head=[0.0, 1.0, 2.0, ...])"
+    )
+    assert summarize_ndarray(numpy.zeros((2, 3), dtype=numpy.int32), head=0) == (
+        "ndarray(shape=(2, 3), dtype=int32, nbytes=24)"
+    )
+    assert summarize_ndarray(numpy.array([True, False])) == (
+        "ndarray(shape=(2,), dtype=bool, nbytes=2, head=[True, False])"
+    )
+
+
+def test_ndarray_formatted_by_default():
+    numpy = pytest.importorskip("numpy")
+
+    assert repr(Holder(numpy.arange(5, dtype=numpy.int64))) == (
+        "Holder(value=ndarray(shape=(5,), dtype=int64, nbytes=40, "
+        "head=[0, 1, 2, ...]))"
+    )
+
+
+def test_summarize_series():
+    pandas = pytest.importorskip("pandas")
+    series = pandas.Series([1, 2], name="x", dtype="int64")
+    nbytes = series.memory_usage(index=True, deep=False)
+
+    assert summarize_series(series) == (
+        f"Series(name='x', shape=(2,), dtype=int64, nbytes={nbytes}, head=[1, 2])"
+    )
+
+
+def test_summarize_index():
+    pandas = pytest.importorskip("pandas")
+    index = pandas.Index([10, 20, 30, 40], dtype="int64")
+
+    assert summarize_index(index) == (
+        "Index(shape=(4,), dtype=int64, nbytes=32, head=[10, 20, 30, ...])"
+    )
+
+
+def test_summarize_dataframe():
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame(
+        {
+            "a": pandas.Series([1, 2], dtype="int64"),
+            "b": pandas.Series([1.0, 2.0], dtype="float64"),
+            "c": pandas.Series([True, False], dtype="bool"),
+            "d": pandas.Series([3, 4], dtype="int64"),
+        }
+    )
+    nbytes = frame.memory_usage(index=True, deep=False).sum()
+
+    assert summarize_dataframe(frame) == (
+        "DataFrame(shape=(2, 4), dtypes={int64: 2, float64: 1, bool: 1}, "
+        f"nbytes={nbytes}, columns=['a', 'b', 'c', ...])"
+    )
@@ -0,0 +1,108 @@
+from easyrepr import easyrepr, instrumentation, repr_many
+from easyrepr.recursion import running
+import pytest
+
+
+class Names:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+    @easyrepr
+    def __repr__(self):
+        return ("foo", "bar")
+
+
+class Reflected(Names):
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Cached(Names):
+    @easyrepr(cache=True)
+    def __repr__(self):
+        ...
+
+
+@easyrepr
+class Decorated:
+    def __init__(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def objects():
+    return [
+        Names(1, 2),
+        Reflected("a", None),
+        Names(3, [4]),
+        Cached(5, 6),
+        Decorated(7),
+        8,
+        "nine",
+        Reflected(10, 11),
+    ]
+
+
+def test_repr_many(objects):
+    """The reprs are the same as repr, in the same order"""
+    assert list(repr_many(objects)) == [repr(obj) for obj in objects]
+
+
+def test_repr_many_lazy():
+    def generate():
+        yield Names(1, 2)
+        raise AssertionError("consumed too far")
+
+    reprs = repr_many(generate())
+
+    assert next(reprs) == "Names(foo=1, bar=2)"
+
+
+def test_repr_many_plan_resolved_once(monkeypatch):
+    objects = [Names(index, index) for index in range(10)]
+    repr_fn = Names.__dict__["__repr__"]
+    calls = []
+    original_get_plan = repr_fn.get_plan
+
+    def get_plan(klass):
+        calls.append(klass)
+        return original_get_plan(klass)
+
+    monkeypatch.setattr(repr_fn, "get_plan", get_plan)
+
+    assert len(list(repr_many(objects))) == 10
+    assert calls == [Names]
+
+
+def test_repr_many_recursive():
+    obj = Names(1, None)
+    obj.bar = obj
+
+    assert list(repr_many([obj])) == ["Names(foo=1, bar=...)"]
+    assert not running
+
+
+def test_repr_many_not_marked_while_suspended():
+    """Objects aren't marked as being repr'd between items"""
+    obj = Names(1, 2)
+    reprs = repr_many([obj, obj])
+
+    assert next(reprs) == "Names(foo=1, bar=2)"
+    assert not running
+    assert repr(Names(obj, 3)) == "Names(foo=Names(foo=1, bar=2), bar=3)"
+    assert next(reprs) == "Names(foo=1, bar=2)"
+
+
+def test_repr_many_instrumented(objects):
+    instrumentation.reset()
+    instrumentation.enable()
+
+    try:
+        list(repr_many(objects))
+    finally:
+        instrumentation.disable()
+
+    assert instrumentation.snapshot()["Names"].calls == 2
+    instrumentation.reset()
@@ -0,0 +1,143 @@
+import dataclasses
+import gc
+
+from easyrepr import easyrepr
+from easyrepr.cache import ReprCache
+
+
+class Cached:
+    def __init__(self, foo):
+        self.foo = foo
+
+    @easyrepr(cache=True)
+    def __repr__(self):
+        ...
+
+
+class CachedSlots:
+    __slots__ = ("foo",)
+
+    def __init__(self, foo):
+        self.foo = foo
+
+    @easyrepr(cache=ReprCache(maxsize=2))
+    def __repr__(self):
+        ...
+
+
+@dataclasses.dataclass(frozen=True)
+class Frozen:
+    foo: object
+
+    @easyrepr(cache=True)
+    def __repr__(self):
+        ...
+
+
+class DerivedCached(Cached):
+    @easyrepr
+    def __repr__(self):
+        return (("extra", 1),)
+
+
+def test_cache_hits_and_misses():
+    cache = Cached.__repr__.cache
+    cache.cache_clear()
+    obj = Cached(1)
+
+    assert repr(obj) == "Cached(foo=1)"
+    assert repr(obj) == "Cached(foo=1)"
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_cache_invalidated_by_setattr():
+    obj = Cached(1)
+    assert repr(obj) == "Cached(foo=1)"
+
+    obj.foo = 2
+    assert repr(obj) == "Cached(foo=2)"
+
+    del obj.foo
+    assert repr(obj) == "Cached()"
+
+
+def test_cache_invalidated_while_computing():
+    """A repr is not cached if its instance changes while it's computed"""
+    cache = ReprCache()
+    obj = Cached(1)
+
+    def compute(instance):
+        result = repr(instance)
+        cache.invalidate(instance)
+        return result
+
+    assert cache.get_or_compute(obj, compute) == "Cached(foo=1)"
+    assert cache.get_or_compute(obj, lambda instance: "fresh") == "fresh"
+    assert cache.cache_info().currsize == 1
+
+
+def test_cache_frozen_not_watched():
+    """Frozen dataclasses keep their default __setattr__"""
+    obj = Frozen([1])
+    assert repr(obj) == "Frozen(foo=[1])"
+
+    assert "ReprCache" not in Frozen.__setattr__.__qualname__
+
+    # Mutating a contained value isn't tracked, so the cached repr is stale.
+    obj.foo.append(2)
+    assert repr(obj) == "Frozen(foo=[1])"
+
+
+def test_cache_not_weakrefable():
+    """Instances that don't support weak references are still cached"""
+    cache = CachedSlots.__repr__.cache
+    cache.cache_clear()
+    obj = CachedSlots(1)
+
+    assert repr(obj) == "CachedSlots(foo=1)"
+    assert repr(obj) == "CachedSlots(foo=1)"
+    assert cache.cache_info().hits == 1
+
+    obj.foo = 2
+    assert repr(obj) == "CachedSlots(foo=2)"
+
+
+def test_cache_lru_eviction():
+    cache = CachedSlots.__repr__.cache
+    cache.cache_clear()
+    first, second, third = CachedSlots(1), CachedSlots(2), CachedSlots(3)
+
+    repr(first)
+    repr(second)
+    repr(first)
+    repr(third)
+
+    info = cache.cache_info()
+    assert (info.evictions, info.currsize) == (1, 2)
+
+    # second was least recently used, so it was evicted.
+    repr(first)
+    repr(second)
+    assert cache.cache_info().hits == 2
+
+
+def test_cache_drops_dead_instances():
+    cache = Cached.__repr__.cache
+    cache.cache_clear()
+
+    repr(Cached(1))
+    gc.collect()
+
+    assert cache.cache_info().currsize == 0
+
+
+def test_cache_inherited():
+    cache = Cached.__repr__.cache
+    cache.cache_clear()
+    obj = DerivedCached(1)
+
+    assert repr(obj) == "DerivedCached(foo=1, extra=1)"
+    assert repr(obj) == "DerivedCached(foo=1, extra=1)"
+    assert cache.cache_info().hits == 1
@@ -0,0 +1,154 @@
+import types
+
+from easyrepr import easyrepr
+import pytest
+
+
+class Base:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+    @easyrepr(style="<>")
+    def __repr__(self):
+        return ("foo",)
+
+
+@easyrepr
+class AllAttributes:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+
+@easyrepr
+class DescribedAttributes(Base):
+    def __repr__(self):
+        return ("bar", ("virtual", 42))
+
+
+class DerivedFromDecorated(DescribedAttributes):
+    def __init__(self, foo, bar, baz):
+        super().__init__(foo, bar)
+        self.baz = baz
+
+    @easyrepr
+    def __repr__(self):
+        return ("baz",)
+
+
+class InheritsDecorated(DescribedAttributes):
+    pass
+
+
+def test_class_all_attributes():
+    obj = AllAttributes(1, 2)
+
+    assert repr(obj) == "AllAttributes(foo=1, bar=2)"
+
+
+def test_class_installs_function():
+    """Decorating a class installs a plain function rather than a descriptor"""
+    assert isinstance(AllAttributes.__dict__["__repr__"], types.FunctionType)
+    assert isinstance(DescribedAttributes.__dict__["__repr__"], types.FunctionType)
+
+
+def test_class_function_names():
+    """The installed function is named for the class, not the wrapped function"""
+    assert AllAttributes.__repr__.__name__ == "__repr__"
+    assert AllAttributes.__repr__.__qualname__ == "AllAttributes.__repr__"
+    assert DescribedAttributes.__repr__.__qualname__ == "DescribedAttributes.__repr__"
+
+
+def test_class_merges_ancestors():
+    """Decorated class merges ancestor reprs and inherits style"""
+    obj = DescribedAttributes(1, 2)
+
+    assert repr(obj) == "<DescribedAttributes foo=1 bar=2 virtual=42>"
+
+
+def test_class_descendant_merges_decorated():
+    """Descendant of a decorated class merges the decorated class's repr"""
+    obj = DerivedFromDecorated(1, 2, 3)
+
+    assert repr(obj) == "<DerivedFromDecorated foo=1 bar=2 virtual=42 baz=3>"
+
+
+def test_class_descendant_without_repr():
+    """Descendant of a decorated class uses its own class name"""
+    obj = InheritsDecorated(1, 2)
+
+    assert repr(obj) == "<InheritsDecorated foo=1 bar=2 virtual=42>"
+
+
+def test_class_with_easyrepr_method():
+    """Decorating a class whose method is already an EasyRepr reuses it"""
+
+    @easyrepr
+    class Local:
+        def __init__(self, foo):
+            self.foo = foo
+
+        @easyrepr(style="<>")
+        def __repr__(self):
+            ...
+
+    assert repr(Local(1)).endswith("Local foo=1>")
+
+
+def test_class_with_easyrepr_method_and_arguments():
+    """Decorating a class whose method is an EasyRepr rejects new arguments"""
+
+    with pytest.raises(TypeError):
+
+        @easyrepr(style="<>")
+        class Local:
+            @easyrepr
+            def __repr__(self):
+                ...
+
+
+def test_class_base_repr_reassigned():
+    """Reassigning a base class's repr invalidates the installed function"""
+
+    class LocalBase:
+        def __init__(self, a, b, c):
+            self.a = a
+            self.b = b
+            self.c = c
+
+        @easyrepr
+        def __repr__(self):
+            return ("a",)
+
+    @easyrepr
+    class Child(LocalBase):
+        def __repr__(self):
+            return ("c",)
+
+    obj = Child(1, 2, 3)
+    assert repr(obj).endswith(".Child(a=1, c=3)")
+
+    LocalBase.__repr__ = easyrepr(lambda self: ("b",))
+    assert repr(obj).endswith(".Child(b=2, c=3)")
+
+
+def test_class_bases_changed():
+    """Changing the bases of a decorated class invalidates the installed
+    function"""
+
+    class Mixin:
+        @easyrepr
+        def __repr__(self):
+            return (("mixin", True),)
+
+    @easyrepr
+    class Local(Base):
+        def __repr__(self):
+            return ("bar",)
+
+    obj = Local(1, 2)
+    assert repr(obj).endswith(".Local foo=1 bar=2>")
+
+    Local.__bases__ = (Mixin, Base)
+    assert repr(obj).endswith(".Local foo=1 mixin=True bar=2>")
@@ -0,0 +1,83 @@
+from easyrepr import easyrepr
+from easyrepr.codegen import compile_repr
+from easyrepr.style import angle_style, call_style
+import pytest
+
+
+class Attributes:
+    def __init__(self):
+        self.foo = 1
+        self.bar = "two"
+        setattr(self, "class", 3)
+        setattr(self, "not an identifier", 4)
+
+
+@pytest.mark.parametrize("style_fn", [angle_style, call_style])
+@pytest.mark.parametrize(
+    ("class_name", "attributes"),
+    [
+        pytest.param("Klass", [], id="empty"),
+        pytest.param("Klass", ["foo", "bar"], id="names"),
+        pytest.param("Klass", ["class", "not an identifier"], id="odd names"),
+        pytest.param("Klass", [("key", {"a": "{b}"}), ('"quoted\\n"',)], id="virtual"),
+        pytest.param("Klass", [(1, 2), ("foo",)], id="non-str key"),
+        pytest.param("Outer.<locals>.{Klass}'\"", ["foo"], id="odd class name"),
+    ],
+)
+def test_compiled_matches_style(style_fn, class_name, attributes):
+    """Compiled repr returns the same string as the style function"""
+    instance = Attributes()
+    processed_attributes = [
+        (attribute, getattr(instance, attribute))
+        if isinstance(attribute, str)
+        else attribute
+        for attribute in attributes
+    ]
+
+    expected_repr = style_fn(instance, class_name, processed_attributes)
+    repr_fn = compile_repr(class_name, attributes, style_fn)
+
+    assert repr_fn(instance) == expected_repr
+
+
+def test_compile_custom_style():
+    """Custom style functions are not compiled"""
+    assert compile_repr("Klass", ["foo"], lambda *args: "custom") is None
+
+
+def test_compiled_missing_attribute():
+    """Compiled repr raises AttributeError for a missing attribute"""
+    repr_fn = compile_repr("Klass", ["missing"], call_style)
+
+    with pytest.raises(AttributeError):
+        repr_fn(Attributes())
+
+
+class Static:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+    @easyrepr
+    def __repr__(self):
+        return ("foo", "bar", ("virtual", 42))
+
+
+class Dynamic(Static):
+    @easyrepr
+    def __repr__(self):
+        return (("double", self.foo * 2),)
+
+
+def test_static_repr_is_compiled():
+    obj = Static(1, [2])
+
+    assert repr(obj) == "Static(foo=1, bar=[2], virtual=42)"
+    assert Static.__repr__._plans[Static].compiled is not None
+
+
+def test_dynamic_repr_is_not_compiled():
+    obj = Dynamic(1, [2])
+
+    assert repr(obj) == "Dynamic(foo=1, bar=[2], virtual=42, double=2)"
+    assert Dynamic.__repr__._plans[Dynamic].compiled is None
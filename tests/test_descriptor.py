@@ -1,3 +1,5 @@
+import re
+
 from easyrepr.descriptor import EasyRepr
 import pytest
 
@@ -95,3 +97,31 @@ class TestOverrideParamStyle:
         actual_repr = repr(instance)
 
         assert actual_repr == "TestOverrideParamStyle.Derived(derived='only')"
+
+
+class TestFilterParams:
+    """Tests related to the include and exclude parameters."""
+
+    class Credentials:
+        def __init__(self):
+            self.user = "me"
+            self.password = "hunter2"
+            self.api_token = "abc"
+            self._secret = 1
+
+        __repr__ = EasyRepr(
+            lambda self: None, exclude=["password", re.compile("token")]
+        )
+
+    class Allowlisted(Credentials):
+        __repr__ = EasyRepr(
+            lambda self: (..., ("extra", 1)), override=True, include="user*"
+        )
+
+    def test_exclude(self):
+        assert repr(self.Credentials()) == "TestFilterParams.Credentials(user='me')"
+
+    def test_include(self):
+        assert repr(self.Allowlisted()) == (
+            "TestFilterParams.Allowlisted(user='me', extra=1)"
+        )
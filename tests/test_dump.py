@@ -0,0 +1,104 @@
+import io
+import pickle
+import subprocess
+import sys
+
+from easyrepr import dump, easyrepr, ReprLimits
+from easyrepr.dump import _prepare_records
+import pytest
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Angle(Point):
+    @easyrepr(style="<>")
+    def __repr__(self):
+        return (("virtual", {1, 2}), (Point(0, 0), "point key"), ("nameless",))
+
+
+class Limited(Point):
+    @easyrepr(limits=ReprLimits(max_items=2))
+    def __repr__(self):
+        ...
+
+
+def _objects():
+    def unpicklable():
+        pass
+
+    objects = [
+        Point(1, "two"),
+        Point([Point(3, None), (4,)], {"key": Point(5, 6), Point(7, 8): 9}),
+        Angle(1.5, b"bytes"),
+        Limited(list(range(10)), unpicklable),
+        Point(unpicklable, ...),
+        10,
+        "eleven",
+    ]
+    recursive = Point(12, None)
+    recursive.y = [recursive]
+    objects.append(recursive)
+    return objects
+
+
+def _expected(objects):
+    return "".join(repr(obj) + "\n" for obj in objects)
+
+
+@pytest.mark.parametrize("processes", [False, True], ids=["threads", "processes"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_dump(processes, chunk_size):
+    objects = _objects()
+    file = io.StringIO()
+
+    dump(objects, file, workers=2, chunk_size=chunk_size, processes=processes)
+
+    assert file.getvalue() == _expected(objects)
+
+
+def test_dump_chunked_writes():
+    """Each chunk is written at once, in order"""
+    objects = [Point(index, index) for index in range(10)]
+    chunks = []
+
+    class File:
+        write = chunks.append
+
+    dump(objects, File(), workers=3, chunk_size=4)
+
+    assert len(chunks) == 3
+    assert "".join(chunks) == _expected(objects)
+
+
+def test_dump_empty():
+    file = io.StringIO()
+
+    dump([], file, workers=2)
+
+    assert file.getvalue() == ""
+
+
+def test_dump_records_picklable():
+    """Only plain values are sent to worker processes"""
+    objects = _objects()
+    records = pickle.loads(pickle.dumps(_prepare_records(objects)))
+
+    assert [repr(record) for record in records] == [repr(obj) for obj in objects]
+
+
+def test_import_is_lazy():
+    """Importing easyrepr doesn't import concurrent.futures"""
+    code = "import sys, easyrepr; print('concurrent.futures' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
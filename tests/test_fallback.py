@@ -0,0 +1,175 @@
+import io
+import os
+import re
+import subprocess
+import sys
+
+from easyrepr import easyrepr, fallback, lazy, repr_many, ReprLimits, write_repr
+import pytest
+
+
+class Base:
+    def __init__(self, foo):
+        self.foo = foo
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Derived(Base):
+    pass
+
+
+@easyrepr
+class Decorated:
+    def __init__(self, foo):
+        self.foo = foo
+
+    def __repr__(self):
+        return ("foo",)
+
+
+FALLBACK_PATTERN = re.compile(r"<(\w+) at 0x[0-9a-f]+>")
+
+
+@pytest.fixture(autouse=True)
+def reset_fallback():
+    yield
+    fallback.disable()
+    fallback.clear_override(Base)
+    fallback.clear_override(Decorated)
+    fallback.reset_counts()
+
+
+def is_fallback(text, class_name):
+    match = FALLBACK_PATTERN.fullmatch(text)
+    return match is not None and match.group(1) == class_name
+
+
+def test_enable():
+    obj = Base(1)
+
+    fallback.enable()
+
+    assert is_fallback(repr(obj), "Base")
+    assert is_fallback(repr(Decorated(1)), "Decorated")
+
+    fallback.disable()
+
+    assert repr(obj) == "Base(foo=1)"
+    assert repr(Decorated(1)) == "Decorated(foo=1)"
+    assert not fallback.active
+
+
+def test_sample():
+    obj = Base(1)
+
+    fallback.enable(sample=3)
+    reprs = [repr(obj) for _ in range(6)]
+
+    assert [text == "Base(foo=1)" for text in reprs] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert fallback.counts() == {"Base": fallback.FallbackCounts(2, 4)}
+
+
+def test_override():
+    fallback.override(Base)
+
+    assert fallback.active
+    assert is_fallback(repr(Base(1)), "Base")
+    assert is_fallback(repr(Derived(1)), "Derived")
+    assert repr(Decorated(1)) == "Decorated(foo=1)"
+
+    fallback.clear_override(Base)
+
+    assert not fallback.active
+    assert repr(Base(1)) == "Base(foo=1)"
+
+
+def test_override_exempt():
+    fallback.enable()
+    fallback.override(Base, enabled=False)
+
+    assert repr(Derived(1)) == "Derived(foo=1)"
+    assert is_fallback(repr(Decorated(1)), "Decorated")
+
+
+def test_other_entry_points():
+    stream = io.StringIO()
+
+    fallback.enable()
+    write_repr(Base(1), stream)
+
+    assert is_fallback(stream.getvalue(), "Base")
+    assert all(is_fallback(text, "Base") for text in repr_many([Base(1), Base(2)]))
+
+
+def test_limits():
+    """Reprs computed within limits fall back too, including nested ones"""
+    obj = Base(Decorated(1))
+
+    fallback.override(Decorated)
+
+    assert re.fullmatch(
+        r"Base\(foo=<Decorated at 0x[0-9a-f]+>\)",
+        str(lazy(obj, limits=ReprLimits(max_length=100))),
+    )
+
+    fallback.enable()
+
+    assert is_fallback(str(lazy(obj, limits=ReprLimits(max_length=100))), "Base")
+
+
+def test_bad_sample():
+    with pytest.raises(ValueError):
+        fallback.enable(sample=0)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_active"),
+    [
+        pytest.param("", False, id="empty"),
+        pytest.param("off", False),
+        pytest.param("1", True),
+        pytest.param(" On ", True),
+        pytest.param("sample:100", True),
+    ],
+)
+def test_load_environment(value, expected_active):
+    fallback.load_environment({fallback.ENVIRONMENT_VARIABLE: value})
+
+    assert fallback.active == expected_active
+
+
+@pytest.mark.parametrize("value", ["yes", "sample:", "sample:0"])
+def test_load_environment_invalid(value):
+    with pytest.warns(RuntimeWarning):
+        fallback.load_environment({fallback.ENVIRONMENT_VARIABLE: value})
+
+    assert not fallback.active
+
+
+def test_environment_read_on_import():
+    code = (
+        "import easyrepr\n"
+        "@easyrepr.easyrepr\n"
+        "class Klass:\n"
+        "    pass\n"
+        "print(repr(Klass()))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, fallback.ENVIRONMENT_VARIABLE: "1"},
+    )
+
+    assert is_fallback(result.stdout.strip(), "Klass")
@@ -0,0 +1,268 @@
+import io
+import sys
+import types
+
+from easyrepr import (
+    easyrepr,
+    FormatterRegistry,
+    register_formatter,
+    repr_table,
+    ReprLimits,
+    write_repr,
+)
+from easyrepr import runtime
+from easyrepr.formatters import default_formatters, summarize_bytes
+import pytest
+
+
+class Blob:
+    def __init__(self, data, name):
+        self.data = data
+        self.name = name
+
+    @easyrepr(formatters={bytes: summarize_bytes})
+    def __repr__(self):
+        ...
+
+
+class DerivedBlob(Blob):
+    @easyrepr(style="<>")
+    def __repr__(self):
+        return (("extra", b"xyz"),)
+
+
+class LimitedBlob(Blob):
+    @easyrepr(limits=ReprLimits(max_attribute_length=20))
+    def __repr__(self):
+        return ()
+
+
+@easyrepr
+class Decorated:
+    def __init__(self, value):
+        self.value = value
+
+
+class Point(tuple):
+    pass
+
+
+@pytest.fixture
+def global_formatter():
+    register_formatter(complex, lambda value: "complex!")
+    yield
+    default_formatters.unregister(complex)
+
+
+def test_formatters_per_easyrepr():
+    obj = Blob(bytes(range(20)), "name")
+
+    assert repr(obj) == (
+        "Blob(data=bytes(len=20, hex='0001020304050607...'), name='name')"
+    )
+
+
+def test_formatters_inherited():
+    obj = DerivedBlob(b"ab", 1)
+
+    assert repr(obj) == (
+        "<DerivedBlob data=bytes(len=2, hex='6162') name=1 "
+        "extra=bytes(len=3, hex='78797a')>"
+    )
+
+
+def test_formatters_with_limits():
+    obj = LimitedBlob(bytes(100), "name")
+
+    assert repr(obj) == "LimitedBlob(data=bytes(len=10..., name='name')"
+
+
+def test_formatters_subclass_dispatch():
+    registry = FormatterRegistry({tuple: lambda value: f"tuple of {len(value)}"})
+
+    formatted = registry.format_attributes([("foo", Point((1, 2))), ("bar", [1])])
+
+    assert repr(formatted) == "[('foo', tuple of 2), ('bar', [1])]"
+
+
+def test_formatters_dispatch_cached(monkeypatch):
+    registry = FormatterRegistry({bytes: summarize_bytes}, parent=None)
+    looked_up = []
+    original_find_formatter = registry._find_formatter
+
+    def find_formatter(klass):
+        looked_up.append(klass)
+        return original_find_formatter(klass)
+
+    monkeypatch.setattr(registry, "_find_formatter", find_formatter)
+
+    for _ in range(3):
+        registry.format_attributes([("foo", 1), ("bar", "baz"), ("blob", b"")])
+
+    assert looked_up == [int, str, bytes]
+
+
+def test_formatters_unchanged_attributes_not_copied():
+    registry = FormatterRegistry({bytes: summarize_bytes}, parent=None)
+    attributes = [("foo", 1), ("bar", "baz")]
+
+    assert registry.format_attributes(attributes) is attributes
+
+
+def test_formatters_register_decorator():
+    registry = FormatterRegistry(parent=None)
+
+    @registry.register(int)
+    def format_int(value):
+        return hex(value)
+
+    assert registry.dispatch(bool) is format_int
+    assert registry.dispatch(str) is None
+
+
+def test_formatters_global(global_formatter):
+    """Global formatters apply everywhere, even to decorated classes"""
+    assert repr(Decorated(1j)) == "Decorated(value=complex!)"
+    assert repr(Blob(b"", 1j)) == "Blob(data=bytes(len=0, hex=''), name=complex!)"
+
+
+def test_formatters_global_unregister(global_formatter):
+    assert repr(Decorated(1j)) == "Decorated(value=complex!)"
+
+    default_formatters.unregister(complex)
+
+    assert repr(Decorated(1j)) == "Decorated(value=1j)"
+
+
+def test_formatters_writer_and_table():
+    obj = Blob(bytes(20), "name")
+    stream = io.StringIO()
+
+    write_repr(obj, stream)
+
+    assert stream.getvalue() == repr(obj)
+    assert list(repr_table([obj])) == [
+        "Blob(data, name)",
+        "(bytes(len=20, hex='0000000000000000...'), 'name')",
+    ]
+
+
+def test_summarize_bytes():
+    assert summarize_bytes(bytearray(b"\xff" * 3), max_bytes=2) == (
+        "bytearray(len=3, hex='ffff...')"
+    )
+
+
+@easyrepr(formatters={bytes: summarize_bytes})
+class DecoratedBlob:
+    def __init__(self, data, value):
+        self.data = data
+        self.value = value
+
+    def __repr__(self):
+        return ("data", "value")
+
+
+@pytest.fixture
+def lazy_module():
+    module = types.ModuleType("easyrepr_lazy_module")
+
+    class Outer:
+        class Inner:
+            pass
+
+    module.Outer = Outer
+    yield module
+    sys.modules.pop(module.__name__, None)
+
+
+def test_formatters_compiled():
+    """Plans with formatters still use generated functions"""
+    plan = DecoratedBlob.__repr__.__easyrepr__.get_plan(DecoratedBlob)
+
+    assert plan.compiled is not None
+    assert repr(DecoratedBlob(b"a", 1)) == (
+        "DecoratedBlob(data=bytes(len=1, hex='61'), value=1)"
+    )
+
+
+def test_formatters_registered_later_without_deferring():
+    """Functions generated with formatters pick up new formatters by themselves"""
+    registry = DecoratedBlob.__repr__.__easyrepr__.formatters
+    assert (
+        repr(DecoratedBlob(b"", 1))
+        == "DecoratedBlob(data=bytes(len=0, hex=''), value=1)"
+    )
+
+    registry.register(int, hex)
+
+    try:
+        assert not runtime.deferred
+        assert repr(DecoratedBlob(b"", 255)) == (
+            "DecoratedBlob(data=bytes(len=0, hex=''), value=0xff)"
+        )
+    finally:
+        registry.unregister(int)
+
+
+def test_formatters_lazy(lazy_module):
+    registry = FormatterRegistry(parent=None)
+    registry.register_lazy("easyrepr_lazy_module.Outer.Inner", ascii)
+
+    assert registry.use() is registry
+    assert not registry.active
+
+    sys.modules[lazy_module.__name__] = lazy_module
+
+    assert registry.dispatch(lazy_module.Outer.Inner) is ascii
+    assert registry.active
+
+
+def test_formatters_lazy_does_not_replace(lazy_module):
+    sys.modules[lazy_module.__name__] = lazy_module
+    registry = FormatterRegistry({lazy_module.Outer: str}, parent=None)
+
+    registry.register_lazy("easyrepr_lazy_module.Outer", repr)
+
+    assert registry.dispatch(lazy_module.Outer) is str
+
+
+def test_formatters_lazy_imported_late(lazy_module):
+    """Lazy formatters apply to existing classes once resolved"""
+    obj = Decorated(lazy_module.Outer())
+    assert repr(obj).startswith("Decorated(value=<")
+
+    default_formatters.register_lazy(
+        "easyrepr_lazy_module.Outer", lambda value: "outer!"
+    )
+    sys.modules[lazy_module.__name__] = lazy_module
+
+    try:
+        default_formatters.resolve_lazy()
+
+        assert repr(obj) == "Decorated(value=outer!)"
+    finally:
+        default_formatters.unregister(lazy_module.Outer)
+
+    assert repr(obj).startswith("Decorated(value=<")
+
+
+def test_formatters_lazy_imported_after_class(lazy_module):
+    """Generated functions pick up lazy formatters once their module is imported"""
+    registry = FormatterRegistry(parent=None)
+    registry.register_lazy("easyrepr_lazy_module.Outer", lambda value: "outer!")
+
+    @easyrepr(formatters=registry)
+    class Local:
+        def __init__(self, value):
+            self.value = value
+
+        def __repr__(self):
+            return ("value",)
+
+    assert repr(Local(1)).endswith(".Local(value=1)")
+
+    sys.modules[lazy_module.__name__] = lazy_module
+
+    assert repr(Local(lazy_module.Outer())).endswith(".Local(value=outer!)")
+    assert not runtime.deferred
@@ -0,0 +1,117 @@
+import gc
+
+from easyrepr import easyrepr
+from easyrepr.cache import FragmentCache
+from easyrepr.style import format_attribute
+import pytest
+
+
+class Tick:
+    def __init__(self, count, label, data):
+        self.count = count
+        self.label = label
+        self.data = data
+
+    @easyrepr(incremental=True)
+    def __repr__(self):
+        ...
+
+
+class AngleTick(Tick):
+    @easyrepr(style="<>")
+    def __repr__(self):
+        return (("virtual", "v"),)
+
+
+class SlotsTick:
+    __slots__ = ("count",)
+
+    def __init__(self, count):
+        self.count = count
+
+    @easyrepr(incremental=True)
+    def __repr__(self):
+        ...
+
+
+@pytest.fixture
+def formatted(monkeypatch):
+    """Records the attributes that are formatted"""
+    calls = []
+
+    def record_format_attribute(attribute):
+        calls.append(attribute[0])
+        return format_attribute(attribute)
+
+    monkeypatch.setattr("easyrepr.cache.format_attribute", record_format_attribute)
+    return calls
+
+
+def test_incremental_reuses_unchanged(formatted):
+    obj = Tick(1, "label", [1])
+
+    assert repr(obj) == "Tick(count=1, label='label', data=[1])"
+    assert formatted == ["count", "label", "data"]
+
+    formatted.clear()
+    obj.count = 2
+    obj.data.append(2)
+
+    assert repr(obj) == "Tick(count=2, label='label', data=[1, 2])"
+    # Mutable values are always formatted again.
+    assert formatted == ["count", "data"]
+
+
+def test_incremental_attributes_added_and_removed(formatted):
+    obj = Tick(1, "label", None)
+    repr(obj)
+
+    obj.extra = 3
+    assert repr(obj) == "Tick(count=1, label='label', data=None, extra=3)"
+
+    del obj.label
+    assert repr(obj) == "Tick(count=1, data=None, extra=3)"
+
+    formatted.clear()
+    assert repr(obj) == "Tick(count=1, data=None, extra=3)"
+    assert formatted == []
+
+
+def test_incremental_per_instance():
+    first = Tick(1, "a", None)
+    second = Tick(2, "b", None)
+
+    assert repr(first) == "Tick(count=1, label='a', data=None)"
+    assert repr(second) == "Tick(count=2, label='b', data=None)"
+    assert repr(first) == "Tick(count=1, label='a', data=None)"
+
+
+def test_incremental_inherited():
+    obj = AngleTick(1, "label", None)
+
+    assert repr(obj) == "<AngleTick count=1 label='label' data=None virtual='v'>"
+    obj.count = 2
+    assert repr(obj) == "<AngleTick count=2 label='label' data=None virtual='v'>"
+
+
+def test_incremental_without_weakref(formatted):
+    """Instances without weak references are formatted in full"""
+    obj = SlotsTick(1)
+
+    assert repr(obj) == "SlotsTick(count=1)"
+    assert repr(obj) == "SlotsTick(count=1)"
+    assert formatted == []
+
+
+def test_incremental_does_not_keep_alive():
+    cache = FragmentCache()
+
+    class Klass:
+        pass
+
+    obj = Klass()
+    cache.format_attributes(obj, [("foo", 1)])
+    del obj
+    gc.collect()
+
+    assert cache._tables == {}
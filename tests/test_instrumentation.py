@@ -0,0 +1,100 @@
+from easyrepr import easyrepr, instrumentation, lazy, ReprLimits
+import pytest
+
+
+class Inner:
+    def __init__(self, value):
+        self.value = value
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Outer:
+    def __init__(self, inner):
+        self.inner = inner
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+@easyrepr
+class Decorated:
+    def __init__(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_instrumentation_records(instrumented):
+    repr(Outer(Inner(1)))
+    repr(Outer(Inner(22)))
+
+    stats = instrumentation.snapshot()
+
+    assert stats["Outer"].calls == 2
+    assert stats["Inner"].calls == 2
+    assert stats["Inner"].total_length == len("Inner(value=1)") + len("Inner(value=22)")
+    assert stats["Inner"].max_length == len("Inner(value=22)")
+    assert stats["Outer"].max_time <= stats["Outer"].total_time
+    # Nested reprs are included in the time of their parent.
+    assert stats["Outer"].total_time >= stats["Inner"].total_time
+
+
+def test_instrumentation_class_decorator(instrumented):
+    """Compiled reprs installed by the class decorator are recorded, too"""
+    assert repr(Decorated(1)) == "Decorated(value=1)"
+
+    assert instrumentation.snapshot()["Decorated"].calls == 1
+
+
+def test_instrumentation_limits(instrumented):
+    """Reprs within limits are recorded, including nested ones"""
+    text = str(lazy(Outer(Inner(1)), limits=ReprLimits(max_length=100)))
+
+    assert text == "Outer(inner=Inner(value=1))"
+
+    stats = instrumentation.snapshot()
+
+    assert stats["Outer"].calls == 1
+    assert stats["Outer"].total_length == len(text)
+    assert stats["Inner"].calls == 1
+
+
+def test_instrumentation_snapshot_is_a_copy(instrumented):
+    repr(Inner(1))
+    stats = instrumentation.snapshot()
+    repr(Inner(1))
+
+    assert stats["Inner"].calls == 1
+
+
+def test_instrumentation_reset(instrumented):
+    repr(Inner(1))
+    instrumentation.reset()
+
+    assert instrumentation.snapshot() == {}
+
+
+def test_instrumentation_disabled(monkeypatch):
+    """Disabled instrumentation neither times nor records anything"""
+
+    def fail(*args):
+        raise AssertionError("instrumentation used while disabled")
+
+    instrumentation.reset()
+    monkeypatch.setattr(instrumentation, "clock", fail)
+    monkeypatch.setattr(instrumentation, "record", fail)
+
+    assert repr(Outer(Inner(1))) == "Outer(inner=Inner(value=1))"
+    assert repr(Decorated(1)) == "Decorated(value=1)"
+    assert instrumentation.snapshot() == {}
@@ -0,0 +1,70 @@
+import logging
+
+from easyrepr import easyrepr, lazy, ReprLimits
+
+
+class Counted:
+    calls = 0
+
+    def __init__(self, foo):
+        self.foo = foo
+
+    @easyrepr
+    def __repr__(self):
+        type(self).calls += 1
+        return ("foo",)
+
+
+def test_lazy_not_computed_until_used():
+    obj = Counted(1)
+    Counted.calls = 0
+
+    proxy = lazy(obj)
+
+    assert Counted.calls == 0
+    assert repr(proxy) == "Counted(foo=1)"
+    assert Counted.calls == 1
+
+
+def test_lazy_str_and_repr():
+    proxy = lazy(Counted([1, 2]))
+
+    assert str(proxy) == repr(proxy) == "Counted(foo=[1, 2])"
+    assert f"{proxy}" == "Counted(foo=[1, 2])"
+
+
+def test_lazy_memoized():
+    """The repr is computed only once per proxy"""
+    proxy = lazy(Counted(1))
+    Counted.calls = 0
+
+    str(proxy)
+    repr(proxy)
+    str(proxy)
+
+    assert Counted.calls == 1
+
+
+def test_lazy_limits():
+    proxy = lazy(Counted(list(range(100))), limits=ReprLimits(max_items=2))
+
+    assert repr(proxy) == "Counted(foo=[0, 1, ...])"
+
+
+def test_lazy_plain_object():
+    proxy = lazy([1, 2], limits=ReprLimits(max_items=1))
+
+    assert repr(proxy) == "[1, 2]"
+
+
+def test_lazy_suppressed_log_record(caplog):
+    """A log record that is never formatted never computes the repr"""
+    logger = logging.getLogger("tests.test_lazy")
+    Counted.calls = 0
+
+    with caplog.at_level(logging.INFO, logger="tests.test_lazy"):
+        logger.debug("state %s", lazy(Counted(1)))
+        logger.info("state %s", lazy(Counted(2)))
+
+    assert Counted.calls == 1
+    assert "state Counted(foo=2)" in caplog.text
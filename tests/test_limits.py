@@ -0,0 +1,141 @@
+from easyrepr import easyrepr, ReprLimits
+from easyrepr.style import angle_style, call_style
+import pytest
+
+
+class Node:
+    def __init__(self, name, child=None, data=None):
+        self.name = name
+        self.child = child
+        self.data = data
+
+    @easyrepr(limits=ReprLimits(max_length=60, max_items=3, max_depth=1))
+    def __repr__(self):
+        ...
+
+
+class Deep:
+    def __init__(self, child=None, data=None):
+        self.child = child
+        self.data = data
+
+    @easyrepr(limits=ReprLimits(max_depth=1))
+    def __repr__(self):
+        ...
+
+
+class Unlimited:
+    def __init__(self, value):
+        self.value = value
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class DerivedNode(Node):
+    @easyrepr(style="<>")
+    def __repr__(self):
+        return (("extra", "x" * 100),)
+
+
+def test_limits_max_items():
+    obj = Node("a", data=list(range(1000)))
+
+    assert repr(obj) == "Node(name='a', child=None, data=[0, 1, 2, ...])"
+
+
+def test_limits_max_length():
+    obj = Node("a" * 100)
+    actual_repr = repr(obj)
+
+    assert actual_repr.startswith("Node(name='aaaa")
+    assert len(actual_repr) == 60
+    assert actual_repr.endswith("..., ...)")
+
+
+@pytest.mark.parametrize("max_length", range(10, 100, 7))
+def test_limits_max_length_includes_marker(max_length):
+    """The marker for left out attributes fits within the maximum length"""
+    limits = ReprLimits(max_length=max_length)
+    attributes = [("foo", "x" * 50), ("bar", list(range(100))), ("baz", 1)]
+
+    actual_repr = call_style(object(), "Klass", attributes, limits=limits)
+
+    assert len(actual_repr) <= max_length
+    assert actual_repr.endswith("...)")
+
+
+def test_limits_max_length_large_container():
+    """Containers are only formatted as far as the maximum length"""
+    limits = ReprLimits(max_length=40)
+    data = [list(range(100))] * 1_000_000
+
+    actual_repr = call_style(object(), "Klass", [("data", data)], limits=limits)
+
+    assert actual_repr == "Klass(data=[[0, 1, 2, 3, 4, 5, 6, 7,...)"
+
+
+def test_limits_max_depth():
+    obj = Deep(child=Deep(child=Deep()), data=[[1]])
+
+    assert repr(obj) == "Deep(child=Deep(child=Deep(...), data=None), data=[[...]])"
+
+
+def test_limits_carry_through_nested():
+    """Limits of the outer repr apply to nested easyrepr objects"""
+    obj = Node("a", data=Unlimited(list(range(1000))))
+
+    assert repr(obj) == "Node(name='a', child=None, data=Unlimited(value=[...]))"
+
+    obj = Deep(data=Unlimited(Unlimited(1)))
+
+    assert repr(obj) == "Deep(child=None, data=Unlimited(value=Unlimited(...)))"
+
+
+def test_limits_nested_without_limits():
+    """Objects without limits are formatted in full"""
+    obj = Unlimited(Unlimited(list(range(10))))
+
+    assert repr(obj) == f"Unlimited(value=Unlimited(value={list(range(10))!r}))"
+
+
+def test_limits_inherited():
+    """Limits are inherited from ancestors, like style"""
+    obj = DerivedNode("a")
+    actual_repr = repr(obj)
+
+    assert actual_repr.startswith("<DerivedNode name='a' child=None data=None extra=")
+    assert actual_repr.endswith("...>")
+
+
+@pytest.mark.parametrize(
+    ("style_fn", "expected_repr"),
+    [
+        pytest.param(
+            angle_style, "<Klass foo=[1, 2, ...] bar='xxxxxxxxxx...>", id="angle"
+        ),
+        pytest.param(
+            call_style, "Klass(foo=[1, 2, ...], bar='xxxxxxxxxx...)", id="call"
+        ),
+    ],
+)
+def test_limits_style(style_fn, expected_repr):
+    limits = ReprLimits(max_attribute_length=18, max_items=2)
+    attributes = [("foo", [1, 2, 3]), ("bar", "x" * 1000)]
+
+    actual_repr = style_fn(object(), "Klass", attributes, limits=limits)
+
+    assert actual_repr == expected_repr
+
+
+def test_limits_combine():
+    first = ReprLimits(max_length=10, max_items=3)
+    second = ReprLimits(max_length=20, max_depth=2)
+
+    combined = first.combine(second)
+
+    assert combined.max_length == 10
+    assert combined.max_items == 3
+    assert combined.max_depth == 2
+    assert combined.max_attribute_length is None
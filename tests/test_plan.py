@@ -0,0 +1,261 @@
+import dataclasses
+
+from easyrepr import easyrepr
+from easyrepr.plan import invalidate_plans, REFLECT, STATIC
+
+
+class Base:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+    @easyrepr
+    def __repr__(self):
+        return ("foo",)
+
+
+class Derived(Base):
+    @easyrepr
+    def __repr__(self):
+        return ("bar",)
+
+
+class Other:
+    def __init__(self, baz):
+        self.baz = baz
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+def test_plan_is_cached():
+    """Repeated reprs of the same class reuse the plan"""
+    obj = Derived(1, 2)
+    repr(obj)
+
+    plan = Derived.__repr__._plans[Derived]
+    repr(obj)
+
+    assert Derived.__repr__._plans[Derived] is plan
+
+
+def test_plan_static_attributes():
+    """A plan for constant attribute names does not depend on the instance"""
+    repr(Derived(1, 2))
+    plan = Derived.__repr__._plans[Derived]
+
+    assert not plan.instance_dependent
+    assert plan.attributes == ["foo", "bar"]
+
+
+def test_plan_ellipsis_is_instance_dependent():
+    """A plan for an ellipsis repr depends on the instance"""
+    repr(Other(1))
+    plan = Other.__repr__._plans[Other]
+
+    assert plan.instance_dependent
+
+
+def test_plan_new_subclass():
+    """A subclass created after the first repr gets its own plan"""
+    assert repr(Derived(1, 2)) == "Derived(foo=1, bar=2)"
+
+    class MoreDerived(Derived):
+        def __init__(self, foo, bar, baz):
+            super().__init__(foo, bar)
+            self.baz = baz
+
+        @easyrepr
+        def __repr__(self):
+            return ("baz",)
+
+    obj = MoreDerived(1, 2, 3)
+    assert repr(obj).endswith("MoreDerived(foo=1, bar=2, baz=3)")
+
+
+def test_plan_reassigned_repr():
+    """Reassigning an ancestor's repr invalidates cached plans"""
+
+    class LocalBase:
+        def __init__(self, foo, bar):
+            self.foo = foo
+            self.bar = bar
+
+        @easyrepr
+        def __repr__(self):
+            return ("foo",)
+
+    class LocalDerived(LocalBase):
+        @easyrepr
+        def __repr__(self):
+            return ("bar",)
+
+    obj = LocalDerived(1, 2)
+    assert repr(obj).endswith("LocalDerived(foo=1, bar=2)")
+
+    LocalBase.__repr__ = lambda self: "plain"
+    assert repr(obj).endswith("LocalDerived(bar=2)")
+
+
+def test_plan_repr_assigned_on_intermediate_class():
+    """Assigning an EasyRepr to a class between contributors invalidates cached
+    plans"""
+
+    class LocalBase:
+        def __init__(self, foo, bar, baz):
+            self.foo = foo
+            self.bar = bar
+            self.baz = baz
+
+        @easyrepr
+        def __repr__(self):
+            return ("foo",)
+
+    class Middle(LocalBase):
+        pass
+
+    class Leaf(Middle):
+        @easyrepr
+        def __repr__(self):
+            return ("baz",)
+
+    obj = Leaf(1, 2, 3)
+    assert repr(obj).endswith("Leaf(foo=1, baz=3)")
+
+    Middle.__repr__ = easyrepr(lambda self: ("bar",))
+    assert repr(obj).endswith("Leaf(foo=1, bar=2, baz=3)")
+
+
+def test_plan_changed_bases():
+    """Changing a class's bases invalidates cached plans"""
+
+    class Mixin:
+        @easyrepr
+        def __repr__(self):
+            return ("bar",)
+
+    class Local(Other):
+        pass
+
+    obj = Local(1)
+    obj.bar = 2
+    assert repr(obj).endswith("Local(baz=1, bar=2)")
+
+    Local.__bases__ = (Mixin, Other)
+    assert repr(obj).endswith("Local(baz=1, bar=2, bar=2)")
+
+
+def test_invalidate_plans():
+    """Invalidating plans forces them to be rebuilt"""
+    obj = Derived(1, 2)
+    repr(obj)
+    plan = Derived.__repr__._plans[Derived]
+
+    invalidate_plans()
+    repr(obj)
+
+    assert Derived.__repr__._plans[Derived] is not plan
+
+
+class EllipsisInList(Other):
+    @easyrepr
+    def __repr__(self):
+        return (("first", 0), ...)
+
+
+def test_plan_trivial_body_not_called():
+    """A wrapped function whose body is ellipsis is never called"""
+
+    class Local:
+        def __init__(self, foo):
+            self.foo = foo
+
+        @easyrepr
+        def __repr__(self):
+            ...
+
+    def fail(self):
+        raise AssertionError("wrapped function was called")
+
+    Local.__repr__.__wrapped__ = fail
+
+    assert repr(Local(1)).endswith("Local(foo=1)")
+
+
+def test_plan_trivial_body_reflects():
+    """A plan for an ellipsis body just reflects attributes"""
+    repr(Other(1))
+    plan = Other.__repr__._plans[Other]
+
+    assert [action for action, _ in plan.steps] == [REFLECT]
+    assert not plan.needs_lookup
+
+
+def test_plan_constant_with_ellipsis():
+    """A constant list containing ellipsis mixes static and reflect steps"""
+    obj = EllipsisInList(1)
+
+    assert repr(obj) == "EllipsisInList(baz=1, first=0, baz=1)"
+
+    plan = EllipsisInList.__repr__._plans[EllipsisInList]
+    assert [action for action, _ in plan.steps] == [REFLECT, STATIC, REFLECT]
+
+
+@dataclasses.dataclass
+class Declared:
+    foo: int
+    bar: int = dataclasses.field(default=0, repr=False)
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+def test_plan_declared_fields_are_static():
+    """Declared fields are part of the plan rather than reflected per instance"""
+    assert repr(Declared(1, 2)) == "Declared(foo=1)"
+    plan = Declared.__repr__._plans[Declared]
+
+    assert not plan.instance_dependent
+    assert plan.attributes == ["foo"]
+    assert plan.compiled is not None
+
+
+@easyrepr
+@dataclasses.dataclass
+class PartlySet:
+    x: int
+    y: int = dataclasses.field(init=False)
+
+    def __repr__(self):
+        ...
+
+
+@dataclasses.dataclass
+class PostInit:
+    x: int
+
+    def __post_init__(self):
+        self.extra = 5
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+def test_plan_declared_fields_unset():
+    """Declared fields that aren't set are skipped, like slots"""
+    obj = PartlySet(1)
+
+    assert repr(obj) == "PartlySet(x=1)"
+    assert PartlySet.__repr__.__easyrepr__(obj) == "PartlySet(x=1)"
+
+    obj.y = 2
+
+    assert repr(obj) == "PartlySet(x=1, y=2)"
+
+
+def test_plan_declared_fields_only():
+    """Attributes that aren't declared fields aren't included"""
+    assert repr(PostInit(1)) == "PostInit(x=1)"
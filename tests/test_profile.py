@@ -0,0 +1,151 @@
+import dataclasses
+
+from easyrepr import easyrepr, instrumentation, profile
+import pytest
+
+
+class FakeClock:
+    """Clock that advances by a fixed step on each reading"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+class Slow:
+    def __init__(self, value):
+        self.value = value
+
+    @easyrepr
+    def __repr__(self):
+        return ("value", "computed", ("virtual", 1), (2,))
+
+    @property
+    def computed(self):
+        return self.value
+
+
+class Parent:
+    def __init__(self, child):
+        self.child = child
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Custom:
+    def __init__(self, foo):
+        self.foo = foo
+
+    @easyrepr(style=lambda instance, class_name, attributes: "custom")
+    def __repr__(self):
+        ...
+
+
+@easyrepr
+class Decorated:
+    def __init__(self, foo):
+        self.foo = foo
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(instrumentation, "clock", clock)
+    return clock
+
+
+def test_profile_attributes():
+    with profile() as report:
+        assert repr(Slow(1)) == "Slow(value=1, computed=1, virtual=1, 2)"
+
+    entries = {(entry.class_name, entry.attribute): entry for entry in report.top()}
+
+    assert set(entries) == {
+        ("Slow", "value"),
+        ("Slow", "computed"),
+        ("Slow", "virtual"),
+        ("Slow", 3),
+    }
+    assert all(entry.calls == 1 for entry in entries.values())
+
+
+def test_profile_nested(fake_clock):
+    """Nested objects are profiled, and included in their parent's time"""
+    with profile() as report:
+        repr(Parent(Slow(1)))
+
+    entries = {(entry.class_name, entry.attribute): entry for entry in report.top()}
+
+    assert ("Slow", "computed") in entries
+    assert (
+        entries[("Parent", "child")].repr_time > entries[("Slow", "value")].total_time
+    )
+    assert report.top(1) == [entries[("Parent", "child")]]
+
+
+def test_profile_sorted(fake_clock):
+    with profile() as report:
+        repr(Parent(Slow(1)))
+
+    total_times = [entry.total_time for entry in report.top()]
+
+    assert total_times == sorted(total_times, reverse=True)
+    assert len(report.top(2)) == 2
+
+
+def test_profile_custom_style():
+    """Custom styles are timed as a whole"""
+    with profile() as report:
+        assert repr(Custom(1)) == "custom"
+
+    attributes = {entry.attribute for entry in report.top()}
+
+    assert attributes == {"foo", None}
+
+
+def test_profile_class_decorator():
+    with profile() as report:
+        assert repr(Decorated(1)) == "Decorated(foo=1)"
+
+    assert [entry.attribute for entry in report.top()] == ["foo"]
+
+
+def test_profile_format(fake_clock):
+    with profile() as report:
+        repr(Slow(1))
+
+    lines = report.format(n=2).splitlines()
+
+    assert lines[0].split() == ["attribute", "calls", "getattr", "repr", "total"]
+    assert len(lines) == 3
+
+
+def test_profile_inactive_after_exit():
+    with profile() as report:
+        pass
+
+    repr(Slow(1))
+
+    assert report.top() == []
+    assert not instrumentation.active
+
+
+def test_profile_declared_field_unset():
+    """Declared fields that aren't set are skipped while profiling too"""
+
+    @dataclasses.dataclass
+    class PartlySet:
+        x: int
+        y: int = dataclasses.field(init=False)
+
+        @easyrepr
+        def __repr__(self):
+            ...
+
+    with profile():
+        assert repr(PartlySet(1)).endswith(".PartlySet(x=1)")
@@ -0,0 +1,171 @@
+import io
+import threading
+
+from easyrepr import easyrepr, ReprLimits, write_repr
+from easyrepr.recursion import running
+import pytest
+
+
+class Node:
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.children = []
+
+        if parent is not None:
+            parent.children.append(self)
+
+    @easyrepr
+    def __repr__(self):
+        return ("name", "children")
+
+
+@easyrepr
+class DecoratedNode:
+    def __init__(self):
+        self.other = None
+
+
+class LimitedNode(Node):
+    @easyrepr(override=True, limits=ReprLimits(max_items=10))
+    def __repr__(self):
+        ...
+
+
+class Blocking:
+    """Blocks in its first repr until released"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    @easyrepr
+    def __repr__(self):
+        return ("value",)
+
+    @property
+    def value(self):
+        self.calls += 1
+
+        if self.calls == 1:
+            self.started.set()
+            self.release.wait(5)
+
+        return 1
+
+
+class CachedNode:
+    def __init__(self, name):
+        self.name = name
+        self.other = None
+
+    @easyrepr(cache=True)
+    def __repr__(self):
+        ...
+
+
+class Failing:
+    def __init__(self):
+        self.me = self
+
+    @easyrepr
+    def __repr__(self):
+        return ("me", "missing")
+
+
+def test_recursion_self_reference():
+    root = Node("root")
+    root.children.append(root)
+
+    assert repr(root) == "Node(name='root', children=[...])"
+    assert not running
+
+
+def test_recursion_back_reference():
+    """node.parent.children[0] is node"""
+    root = Node("root")
+    child = Node("child", root)
+
+    assert repr(root) == "Node(name='root', children=[Node(name='child', children=[])])"
+
+    child.children.append(root)
+
+    assert (
+        repr(root) == "Node(name='root', children=[Node(name='child', children=[...])])"
+    )
+
+
+def test_recursion_repeated_reference_not_elided():
+    """Only objects already being repr'd are elided, not repeated ones"""
+    root = Node("root")
+    leaf = Node("leaf")
+    root.children.extend([leaf, leaf])
+
+    assert repr(root).count("Node(name='leaf'") == 2
+
+
+def test_recursion_class_decorator():
+    first = DecoratedNode()
+    second = DecoratedNode()
+    first.other = second
+    second.other = first
+
+    assert repr(first) == "DecoratedNode(other=DecoratedNode(other=...))"
+    assert not running
+
+
+def test_recursion_not_cached():
+    """Reprs cut short because of an outer repr are not cached"""
+    first = CachedNode("a")
+    second = CachedNode("b")
+    first.other = second
+    second.other = first
+
+    assert repr(first) == "CachedNode(name='a', other=CachedNode(name='b', other=...))"
+    assert repr(second) == (
+        "CachedNode(name='b', other=CachedNode(name='a', other=...))"
+    )
+
+
+def test_recursion_limits():
+    root = LimitedNode("root")
+    root.children.append(root)
+
+    assert repr(root) == "LimitedNode(name='root', parent=None, children=[...])"
+
+
+def test_recursion_writer():
+    root = Node("root")
+    root.children.append(root)
+    stream = io.StringIO()
+
+    write_repr(root, stream)
+
+    assert stream.getvalue() == repr(root)
+    assert not running
+
+
+def test_recursion_cleanup_on_error():
+    with pytest.raises(AttributeError):
+        repr(Failing())
+
+    assert not running
+
+
+def test_recursion_per_thread():
+    """Reprs in progress in one thread don't affect other threads"""
+    obj = Blocking()
+    results = []
+    thread = threading.Thread(target=lambda: results.append(repr(obj)))
+    thread.start()
+
+    try:
+        obj.started.wait(5)
+        # obj is being repr'd in the other thread right now.
+        assert repr(obj) == "Blocking(value=1)"
+    finally:
+        obj.release.set()
+        thread.join()
+
+    assert results == ["Blocking(value=1)"]
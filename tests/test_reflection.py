@@ -1,4 +1,17 @@
-from easyrepr.reflection import is_private, Mirror
+import collections
+import dataclasses
+import re
+import typing
+
+from easyrepr import easyrepr
+from easyrepr.reflection import (
+    compile_filter,
+    declared_fields,
+    is_private,
+    Mirror,
+    NOT_CONSTANT,
+    reflect_constant_return,
+)
 import pytest
 
 
@@ -180,3 +193,311 @@ def test_mirror_reflect_attributes(test_class, mirror_args, expected_attributes)
     actual_attributes = list(mirror.reflect_attributes(instance))
 
     assert actual_attributes == expected_attributes
+
+
+def ellipsis_function(self):
+    ...
+
+
+def pass_function(self):
+    pass
+
+
+def docstring_function(self):
+    """Only a docstring."""
+
+
+def names_function(self):
+    """Docstring before the return."""
+    return ("foo", "bar")
+
+
+def dynamic_function(self):
+    return (self.foo,)
+
+
+def side_effect_function(self):
+    print("side effect")
+
+
+@pytest.mark.parametrize(
+    ("function", "expected_value"),
+    [
+        pytest.param(ellipsis_function, None, id="ellipsis"),
+        pytest.param(pass_function, None, id="pass"),
+        pytest.param(docstring_function, None, id="docstring"),
+        pytest.param(names_function, ("foo", "bar"), id="names"),
+        pytest.param(dynamic_function, NOT_CONSTANT, id="dynamic"),
+        pytest.param(side_effect_function, NOT_CONSTANT, id="side effect"),
+        pytest.param(len, NOT_CONSTANT, id="builtin"),
+    ],
+)
+def test_reflect_constant_return(function, expected_value):
+    assert reflect_constant_return(function) == expected_value
+
+
+class SlotsSingleString:
+    __slots__ = "f1"
+
+    def __init__(self):
+        self.f1 = 10
+
+
+class SlotsWithDictAndWeakref(SlotsSingleString):
+    __slots__ = ("g1", "__private", "__dict__", "__weakref__")
+
+    def __init__(self):
+        super().__init__()
+        self.g1 = 11
+        self.__private = 12
+        self.h1 = 13
+
+
+@pytest.mark.parametrize(
+    ("test_class", "mirror_args", "expected_values"),
+    [
+        pytest.param(
+            SlotsSingleString,
+            {},
+            [("f1", 10)],
+            id="SlotsSingleString with defaults",
+        ),
+        pytest.param(
+            SlotsWithDictAndWeakref,
+            {},
+            [("f1", 10), ("g1", 11), ("h1", 13)],
+            id="SlotsWithDictAndWeakref with defaults",
+        ),
+        pytest.param(
+            SlotsWithDictAndWeakref,
+            {"hide_private": False},
+            [
+                ("f1", 10),
+                ("g1", 11),
+                ("_SlotsWithDictAndWeakref__private", 12),
+                ("h1", 13),
+            ],
+            id="SlotsWithDictAndWeakref with hide_private=False",
+        ),
+        pytest.param(
+            SlotsOneAttrUnset,
+            {},
+            [("b1", 3), ("c1", 5), ("e1", 9)],
+            id="SlotsOneAttrUnset with defaults",
+        ),
+    ],
+)
+def test_mirror_reflect_attribute_values(test_class, mirror_args, expected_values):
+    instance = test_class()
+    mirror = Mirror(**mirror_args)
+
+    actual_values = mirror.reflect_attribute_values(instance)
+
+    assert actual_values == expected_values
+
+
+def test_mirror_reflect_layout_is_cached():
+    mirror = Mirror()
+
+    layout = mirror.reflect_layout(SlotsDerived)
+
+    assert mirror.reflect_layout(SlotsDerived) is layout
+    assert [name for name, _ in layout.members] == ["b1", "c1"]
+    assert not layout.has_dict
+    assert mirror.reflect_layout(DictAndSlots).has_dict
+
+
+@dataclasses.dataclass
+class DataBase:
+    x: int
+    hidden: int = dataclasses.field(default=0, repr=False)
+    counter: typing.ClassVar[int] = 0
+
+
+@dataclasses.dataclass
+class DataDerived(DataBase):
+    y: int = 0
+    _private: int = 0
+
+
+class NotADataclass(DataBase):
+    pass
+
+
+Pair = collections.namedtuple("Pair", ["left", "right"])
+
+
+class TypedPair(typing.NamedTuple):
+    left: int
+    right: int
+
+
+class PairWithDict(Pair):
+    pass
+
+
+@dataclasses.dataclass(init=False)
+class Reordered:
+    first: int
+    second: int
+
+    def __init__(self):
+        self.second = 2
+        self.first = 1
+
+
+@dataclasses.dataclass
+class Secretive:
+    x: int
+    secret: str = dataclasses.field(default="", repr=False)
+
+
+class AnnotatedSubclass(Secretive):
+    y: int = 0
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Annotated:
+    x: int
+    unset: int
+    default: int = 0
+    count: typing.ClassVar[int] = 0
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+@pytest.mark.parametrize(
+    ("test_class", "expected_fields"),
+    [
+        pytest.param(DataBase, ("x",), id="dataclass"),
+        pytest.param(DataDerived, ("x", "y", "_private"), id="derived dataclass"),
+        pytest.param(NotADataclass, None, id="dataclass subclass"),
+        pytest.param(Pair, ("left", "right"), id="namedtuple"),
+        pytest.param(TypedPair, ("left", "right"), id="NamedTuple"),
+        pytest.param(PairWithDict, None, id="namedtuple with dict"),
+        pytest.param(Annotated, None, id="annotations"),
+        pytest.param(AnnotatedSubclass, None, id="annotated dataclass subclass"),
+        pytest.param(DictBase, None, id="undeclared"),
+    ],
+)
+def test_declared_fields(test_class, expected_fields):
+    assert declared_fields(test_class) == expected_fields
+
+
+def test_declared_fields_attrs():
+    attr = pytest.importorskip("attr")
+
+    @attr.s
+    class AttrsClass:
+        a = attr.ib()
+        b = attr.ib(repr=False)
+        c = attr.ib(repr=lambda value: "custom")
+
+    assert declared_fields(AttrsClass) == ("a", "c")
+
+
+def test_annotations_reflected_per_instance():
+    """Annotations alone don't declare fields, so instances are reflected"""
+    assert repr(Annotated(1, 2)) == "Annotated(x=1, y=2)"
+    assert repr(AnnotatedSubclass(1, "hidden")) == "AnnotatedSubclass(x=1)"
+
+
+def test_mirror_reflect_fields():
+    mirror = Mirror()
+
+    fields = mirror.reflect_fields(DataDerived)
+
+    assert fields == ("x", "y")
+    assert mirror.reflect_fields(DataDerived) is fields
+    assert Mirror(hide_private=False).reflect_fields(DataDerived) == (
+        "x",
+        "y",
+        "_private",
+    )
+    assert mirror.reflect_attribute_values(DataDerived(1, y=2)) == [
+        ("x", 1),
+        ("y", 2),
+    ]
+
+
+def test_mirror_reflect_fields_in_order():
+    """Declared fields are reflected in declaration order, not assignment order"""
+    instance = Reordered()
+
+    assert Mirror().reflect_attribute_values(instance) == [
+        ("first", 1),
+        ("second", 2),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("filter_args", "expected_names"),
+    [
+        pytest.param({}, ["a", "_b", "password", "api_token", "c1"], id="none"),
+        pytest.param({"hide_private": True}, ["a", "password", "api_token", "c1"]),
+        pytest.param({"include": "*1"}, ["c1"], id="glob"),
+        pytest.param({"include": ["a", "c?"]}, ["a", "c1"], id="globs"),
+        pytest.param(
+            {"exclude": [re.compile("pass|token"), "_*"]}, ["a", "c1"], id="regex"
+        ),
+        pytest.param(
+            {"include": lambda name: len(name) == 2, "exclude": "_*"},
+            ["c1"],
+            id="predicate",
+        ),
+        pytest.param({"include": []}, [], id="empty include"),
+    ],
+)
+def test_compile_filter(filter_args, expected_names):
+    names = ["a", "_b", "password", "api_token", "c1"]
+    accepts = compile_filter(**filter_args)
+
+    if accepts is None:
+        actual_names = names
+    else:
+        actual_names = [name for name in names if accepts(name)]
+
+    assert actual_names == expected_names
+
+
+def test_compile_filter_bad_pattern():
+    with pytest.raises(TypeError):
+        compile_filter(include=[1])
+
+
+def test_mirror_filters():
+    """Filters apply to slots and to __dict__"""
+    mirror = Mirror(include=["a*", "c*", "d*"], exclude="d*")
+
+    assert mirror.reflect_attributes(DictAndSlots()) == ["c1", "a1"]
+
+
+def test_mirror_dict_names_cached():
+    mirror = Mirror(exclude="a1")
+    calls = []
+
+    def accepts(name):
+        calls.append(name)
+        return True
+
+    mirror._accepts = accepts
+    first = DictBase()
+    second = DictBase()
+
+    assert mirror.reflect_attributes(first) == ["a1", "_a2"]
+    assert mirror.reflect_attributes(second) == ["a1", "_a2"]
+    assert calls == ["a1", "_a2"]
+
+    second.extra = 1
+
+    assert mirror.reflect_attributes(second) == ["a1", "_a2", "extra"]
+    assert calls == ["a1", "_a2", "a1", "_a2", "extra"]
@@ -0,0 +1,150 @@
+import json
+
+from easyrepr import attributes, easyrepr, FormatterRegistry, ReprLimits
+from easyrepr.structured import _Record, freeze
+import pytest
+
+
+class Parent:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Child(Parent):
+    @easyrepr
+    def __repr__(self):
+        return (("virtual", 3), ("nameless",))
+
+
+@easyrepr(formatters=FormatterRegistry({int: hex}, parent=None))
+class Formatted:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+
+class Limited(Parent):
+    @easyrepr(limits=ReprLimits(max_length=40, max_depth=2, max_items=2))
+    def __repr__(self):
+        ...
+
+
+class Cached(Parent):
+    @easyrepr(cache=True, style=lambda instance, class_name, attributes: "styled")
+    def __repr__(self):
+        ...
+
+
+@easyrepr
+class Decorated:
+    def __init__(self, value):
+        self.value = value
+
+
+def test_attributes_pairs():
+    """Attributes are merged and ordered the same as the repr"""
+    obj = Child(1, "two")
+
+    assert repr(obj) == "Child(foo=1, bar='two', virtual=3, 'nameless')"
+    assert attributes(obj) == (
+        ("foo", 1),
+        ("bar", "two"),
+        ("virtual", 3),
+        (None, "nameless"),
+    )
+
+
+def test_attributes_dict():
+    obj = Child(1, "two")
+
+    assert attributes(obj, as_dict=True) == {
+        "foo": 1,
+        "bar": "two",
+        "virtual": 3,
+        3: "nameless",
+    }
+
+
+def test_attributes_not_recursive():
+    inner = Parent(1, None)
+    obj = Parent(inner, [inner])
+
+    assert attributes(obj) == (("foo", inner), ("bar", [inner]))
+
+
+def test_attributes_recursive():
+    obj = Parent(Decorated(1), [Parent(2, 3), {"key": (Decorated(4),)}])
+
+    result = attributes(obj, as_dict=True, recursive=True)
+
+    assert result == {
+        "foo": {"value": 1},
+        "bar": [{"foo": 2, "bar": 3}, {"key": ({"value": 4},)}],
+    }
+    assert json.loads(json.dumps(result)) == {
+        "foo": {"value": 1},
+        "bar": [{"foo": 2, "bar": 3}, {"key": [{"value": 4}]}],
+    }
+
+
+def test_attributes_recursive_pairs():
+    obj = Parent(Decorated(1), None)
+
+    assert attributes(obj, recursive=True) == (
+        ("foo", (("value", 1),)),
+        ("bar", None),
+    )
+
+
+def test_attributes_cycle():
+    obj = Parent(1, None)
+    obj.bar = [obj]
+
+    assert attributes(obj, as_dict=True, recursive=True) == {"foo": 1, "bar": ["..."]}
+
+
+def test_attributes_not_easyrepr():
+    with pytest.raises(TypeError, match="not an easyrepr object: object"):
+        attributes(object())
+
+
+def test_freeze_formatted():
+    obj = Formatted(255, [1])
+    snapshot = freeze(obj)
+    obj.bar.append(2)
+
+    assert isinstance(snapshot, _Record)
+    assert repr(snapshot) == "Formatted(foo=0xff, bar=[1])"
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        pytest.param(Limited(list(range(10)), "x" * 50), id="limits"),
+        pytest.param(
+            Limited(Parent(Parent(1, [2, 3, 4]), {5: 6}), (7, 8, 9)),
+            id="nested within limits",
+        ),
+        pytest.param(Parent(Limited([1, 2, 3], None), 1), id="nested limits"),
+        pytest.param(Parent(Cached(1, 2), 3), id="cache and style"),
+    ],
+)
+def test_freeze_not_portable(obj):
+    """Limits and user-defined styles are applied when the snapshot is repr'd"""
+    snapshot = freeze(obj, portable=False)
+
+    assert isinstance(snapshot, _Record)
+    assert repr(snapshot) == repr(obj)
+
+
+def test_freeze_portable_style():
+    """User-defined styles are applied right away by default"""
+    snapshot = freeze(Parent(Cached(1, 2), 3))
+
+    assert repr(snapshot.attributes[0][1]) == "styled"
+    assert not isinstance(snapshot.attributes[0][1], _Record)
@@ -0,0 +1,81 @@
+from easyrepr import easyrepr, repr_table, ReprLimits
+import pytest
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @easyrepr
+    def __repr__(self):
+        ...
+
+
+class Virtual(Point):
+    @easyrepr
+    def __repr__(self):
+        return ((1, "non-str key"), ("nameless",))
+
+
+class Limited(Point):
+    @easyrepr(override=True, limits=ReprLimits(max_items=2))
+    def __repr__(self):
+        ...
+
+
+def test_repr_table():
+    rows = list(repr_table([Point(1, 2), Point(3, "four"), Point(None, [5])]))
+
+    assert rows == ["Point(x, y)", "(1, 2)", "(3, 'four')", "(None, [5])"]
+
+
+def test_repr_table_empty():
+    assert list(repr_table([])) == []
+
+
+def test_repr_table_lazy():
+    def generate():
+        yield Point(1, 2)
+        raise AssertionError("consumed too far")
+
+    rows = repr_table(generate())
+
+    assert next(rows) == "Point(x, y)"
+    assert next(rows) == "(1, 2)"
+
+
+def test_repr_table_new_header():
+    """A new header is started when the class or attribute names change"""
+    extra = Point(5, 6)
+    extra.z = 7
+    objects = [Point(1, 2), Virtual(3, 4), extra, Point(8, 9)]
+
+    assert list(repr_table(objects)) == [
+        "Point(x, y)",
+        "(1, 2)",
+        "Virtual(x, y, 1, _)",
+        "(3, 4, 'non-str key', 'nameless')",
+        "Point(x, y, z)",
+        "(5, 6, 7)",
+        "Point(x, y)",
+        "(8, 9)",
+    ]
+
+
+def test_repr_table_limits():
+    rows = list(repr_table([Limited(list(range(10)), 1)]))
+
+    assert rows == ["Limited(x, y)", "([0, 1, ...], 1)"]
+
+
+def test_repr_table_recursive():
+    obj = Point(1, None)
+    obj.y = obj
+
+    assert list(repr_table([obj])) == ["Point(x, y)", "(1, ...)"]
+
+
+def test_repr_table_not_easyrepr():
+    with pytest.raises(TypeError, match="not an easyrepr object: int"):
+        list(repr_table([1]))
@@ -0,0 +1,187 @@
+import asyncio
+import io
+import threading
+
+from easyrepr import arepr, dump, easyrepr, verbosity
+from easyrepr import tiers
+import pytest
+
+
+class Base:
+    def __init__(self, id, name, payload):
+        self.id = id
+        self.name = name
+        self.payload = payload
+
+    @easyrepr(tiers={"brief": ["id"]})
+    def __repr__(self):
+        ...
+
+
+class Derived(Base):
+    @easyrepr(tiers={"brief": ["extra"], "medium": ["name"]})
+    def __repr__(self):
+        return (("extra", 1), ("other", 2))
+
+
+class Untiered(Base):
+    @easyrepr
+    def __repr__(self):
+        return (("extra", 1),)
+
+
+class Dynamic:
+    def __init__(self, id, payload):
+        self.id = id
+        self.payload = payload
+
+    @easyrepr(tiers={"brief": ["id", "computed"]}, cache=True)
+    def __repr__(self):
+        return (("computed", self.id * 2), "payload", "id")
+
+
+@easyrepr(tiers={"brief": ["id"]})
+class Decorated:
+    def __init__(self, id, payload):
+        self.id = id
+        self.payload = payload
+
+    def __repr__(self):
+        return ("id", "payload")
+
+
+def test_full_by_default():
+    assert repr(Base(1, "a", [2])) == "Base(id=1, name='a', payload=[2])"
+    assert tiers.current() == tiers.FULL
+
+
+def test_brief():
+    obj = Base(1, "a", [2])
+
+    with verbosity(tiers.BRIEF):
+        assert tiers.current() == "brief"
+        assert repr(obj) == "Base(id=1)"
+
+        with verbosity(tiers.FULL):
+            assert repr(obj) == "Base(id=1, name='a', payload=[2])"
+
+        assert repr(obj) == "Base(id=1)"
+
+    assert repr(obj) == "Base(id=1, name='a', payload=[2])"
+    assert not tiers.active
+
+
+def test_tiers_inherited():
+    obj = Derived(1, "a", [2])
+
+    with verbosity("brief"):
+        assert repr(obj) == "Derived(id=1, extra=1)"
+
+    with verbosity("medium"):
+        assert repr(obj) == "Derived(name='a')"
+
+
+def test_undeclared_tier_is_full():
+    obj = Untiered(1, "a", [2])
+    full_plan = Untiered.__repr__.get_plan(Untiered, tiers.FULL)
+
+    with verbosity("medium"):
+        assert repr(obj) == "Untiered(id=1, name='a', payload=[2], extra=1)"
+        assert Untiered.__repr__.get_plan(Untiered) is full_plan
+
+
+def test_tier_plans_cached():
+    repr_fn = Decorated.__repr__.__easyrepr__
+
+    with verbosity("brief"):
+        plan = repr_fn.get_plan(Decorated)
+
+        assert repr_fn.get_plan(Decorated) is plan
+        assert plan is not repr_fn.get_plan(Decorated, tiers.FULL)
+        assert plan.attributes == ["id"]
+        assert plan.compiled is not None
+
+
+def test_dynamic_repr_filtered_and_not_cached():
+    obj = Dynamic(1, [2])
+
+    assert repr(obj) == "Dynamic(computed=2, payload=[2], id=1)"
+
+    with verbosity("brief"):
+        assert repr(obj) == "Dynamic(computed=2, id=1)"
+
+    assert repr(obj) == "Dynamic(computed=2, payload=[2], id=1)"
+
+
+def test_decorated_class():
+    obj = Decorated(1, [2])
+
+    with verbosity("brief"):
+        assert repr(obj) == "Decorated(id=1)"
+
+    assert repr(obj) == "Decorated(id=1, payload=[2])"
+
+
+def test_tier_per_thread():
+    obj = Base(1, "a", [2])
+    entered = threading.Event()
+    done = threading.Event()
+    results = []
+
+    def brief_thread():
+        with verbosity("brief"):
+            entered.set()
+            results.append(repr(obj))
+            done.wait()
+
+    thread = threading.Thread(target=brief_thread)
+    thread.start()
+    entered.wait()
+
+    try:
+        assert repr(obj) == "Base(id=1, name='a', payload=[2])"
+    finally:
+        done.set()
+        thread.join()
+
+    assert results == ["Base(id=1)"]
+
+
+def test_tier_carried_to_workers():
+    obj = Base(1, "a", [2])
+    stream = io.StringIO()
+
+    async def main():
+        with verbosity("brief"):
+            return await arepr(obj, threshold=0, size_threshold=0)
+
+    with verbosity("brief"):
+        dump([obj], stream, workers=2)
+
+    assert asyncio.run(main()) == "Base(id=1)"
+    assert stream.getvalue() == "Base(id=1)\n"
+
+
+def test_full_tier_cannot_be_declared():
+    with pytest.raises(ValueError):
+
+        @easyrepr(tiers={"full": ["id"]})
+        def __repr__(self):
+            ...
+
+
+class Single:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+    @easyrepr(tiers={"brief": "id"})
+    def __repr__(self):
+        ...
+
+
+def test_tier_single_name():
+    obj = Single(1, "a")
+
+    with verbosity("brief"):
+        assert repr(obj) == "Single(id=1)"
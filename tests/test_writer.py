@@ -0,0 +1,86 @@
+import io
+
+from easyrepr import easyrepr, FormatterRegistry, ReprLimits, write_repr
+import pytest
+
+
+class CallStyle:
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+    @easyrepr
+    def __repr__(self):
+        return ("foo", "bar", ("virtual", 42), ("nameless",), (1, 2))
+
+
+class AngleStyle(CallStyle):
+    @easyrepr(style="<>")
+    def __repr__(self):
+        ...
+
+
+class CustomStyle(CallStyle):
+    @easyrepr(style=lambda instance, class_name, attributes: "custom")
+    def __repr__(self):
+        ...
+
+
+class Limited(CallStyle):
+    @easyrepr(limits=ReprLimits(max_items=1))
+    def __repr__(self):
+        ...
+
+
+class Formatted(CallStyle):
+    @easyrepr(formatters=FormatterRegistry({int: hex}, parent=None))
+    def __repr__(self):
+        ...
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        pytest.param(CallStyle(1, "two"), id="call"),
+        pytest.param(AngleStyle(1, "two"), id="angle"),
+        pytest.param(CustomStyle(1, "two"), id="custom"),
+        pytest.param(Limited([1, 2], [3, 4]), id="limited"),
+        pytest.param(Formatted(255, "two"), id="formatted"),
+        pytest.param(
+            CallStyle([AngleStyle(1, 2)], {"a": CallStyle(3, 4)}), id="nested"
+        ),
+        pytest.param([1, "two"], id="plain"),
+    ],
+)
+def test_write_repr_matches_repr(obj):
+    stream = io.StringIO()
+    write_repr(obj, stream)
+
+    assert stream.getvalue() == repr(obj)
+
+
+def test_write_repr_list():
+    """Writing to a list appends chunks"""
+    chunks = []
+    write_repr(CallStyle(1, CallStyle(2, 3)), chunks)
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == repr(CallStyle(1, CallStyle(2, 3)))
+
+
+def test_write_repr_formatted():
+    """Formatted values are written piece by piece like any other"""
+    chunks = []
+    write_repr(Formatted(255, CallStyle(2, 3)), chunks)
+
+    assert "0xff" in chunks
+    assert "".join(chunks) == repr(Formatted(255, CallStyle(2, 3)))
+    assert "".join(chunks).startswith("Formatted(foo=0xff, bar=CallStyle(foo=2, ")
+
+
+def test_write_repr_nested_shares_stream():
+    """Nested easyrepr objects are written into the same stream"""
+    chunks = []
+    write_repr(CallStyle(1, CallStyle(2, 3)), chunks)
+
+    assert "CallStyle(foo=2, bar=3, virtual=42, 'nameless', 1=2)" not in chunks